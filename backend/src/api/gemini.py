@@ -174,19 +174,22 @@ class GeminiClient:
                 config=config,
             )
 
-            full_response = ""
+            response_parts: list[str] = []
             usage_metadata = None
 
             for chunk in response_stream:
                 # Extract text from chunk
-                if chunk.text:
-                    full_response += chunk.text
-                    yield chunk.text
+                text = chunk.text
+                if text:
+                    response_parts.append(text)
+                    yield text
 
                 # Capture usage metadata from last chunk
                 if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
                     usage_metadata = chunk.usage_metadata
 
+            full_response = "".join(response_parts)
+
             # Extract token usage from metadata
             input_tokens = 0
             output_tokens = 0
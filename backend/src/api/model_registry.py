@@ -368,11 +368,20 @@ MODEL_REGISTRY: Dict[str, ModelInfo] = {
 }
 
 
+# Registered model id → provider, built once so the hot lookup is a single
+# dict probe.
+_PROVIDER_BY_MODEL: Dict[str, ProviderName] = {
+    model_id: info["provider"]
+    for model_id, info in MODEL_REGISTRY.items()
+    if "provider" in info
+}
+
+
 def get_provider_for_model(model: str) -> ProviderName:
     m = _norm(model)
-    info = MODEL_REGISTRY.get(m)
-    if info and "provider" in info:
-        return info["provider"]  # type: ignore[return-value]
+    provider = _PROVIDER_BY_MODEL.get(m)
+    if provider:
+        return provider
 
     # Conservative fallback: infer by prefix
     if m.startswith("longcat"):
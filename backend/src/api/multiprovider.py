@@ -86,13 +86,9 @@ class MultiProviderClient:
         # Dispatch and stream
         stream = client.stream_completion(**kwargs)
 
-        full_response = ""
         try:
             while True:
-                chunk = next(stream)
-                if isinstance(chunk, str):
-                    full_response += chunk
-                yield chunk
+                yield next(stream)
         except StopIteration as exc:
             meta = exc.value if exc.value else {}
             # Try to pull cost metadata off the underlying client if present
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage breakdown."""
     input_tokens: int
@@ -22,7 +26,7 @@ class TokenUsage:
             self.total_tokens = self.input_tokens + self.output_tokens + self.thinking_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class CostBreakdown:
     """Detailed cost breakdown."""
     input_cost: float
@@ -82,23 +86,73 @@ class PricingManager:
                 config_path = str(Path(__file__).parent / "pricing_config.json")
         
         self.config_path = Path(config_path)
-        self._config: Dict = {}
-        self._is_v2_schema = use_v2
-        self._load_config()
+        self._config_data: Optional[Dict] = None
+        # Canonical names and aliases -> base model info, rebuilt on each load
+        self._model_index: Dict[str, Dict[str, Any]] = {}
+        self._use_v2 = use_v2
+        self._v2_schema = use_v2
+        # (mtime_ns, size) of the file behind _config_data and when it was
+        # last checked; the config is read on first use, not at construction.
+        self._config_signature: Optional[Tuple[int, int]] = None
+        self._config_checked_at = 0.0
+        # Resolved rates per (provider, model, include_markup_details); the
+        # config is static per process, so alias and markup resolution only
+        # needs to run once per key.
+        self._pricing_cache: Dict[Tuple[str, str, bool], Dict[str, Any]] = {}
+    
+    # Seconds a loaded config is served before the file is stat()ed again
+    _REVALIDATE_INTERVAL = 5.0
+    
+    @property
+    def _config(self) -> Dict:
+        """Parsed pricing config, loaded lazily and reloaded when the file changes."""
+        if self._config_data is None:
+            self._load_config()
+        else:
+            now = time.monotonic()
+            if now - self._config_checked_at >= self._REVALIDATE_INTERVAL:
+                self._config_checked_at = now
+                if self._stat_config() != self._config_signature:
+                    self._load_config()
+        return self._config_data
+    
+    @property
+    def _is_v2_schema(self) -> bool:
+        """Whether the loaded config uses the model-centric v2 schema."""
+        # Goes through _config so the file is loaded/revalidated first
+        return bool(self._config) and self._v2_schema
+    
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        """Return the (mtime_ns, size) signature of the config file."""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def _load_config(self):
         """Load pricing configuration from JSON file."""
+        self._pricing_cache.clear()
+        self._config_signature = self._stat_config()
+        self._config_checked_at = time.monotonic()
+        self._v2_schema = self._use_v2
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = json.load(f)
+                self._config_data = json.load(f)
                 # Auto-detect schema version
-                if "schema" in self._config and self._config["schema"] == "model-centric":
-                    self._is_v2_schema = True
-                elif "base_models" in self._config:
-                    self._is_v2_schema = True
+                if "schema" in self._config_data and self._config_data["schema"] == "model-centric":
+                    self._v2_schema = True
+                elif "base_models" in self._config_data:
+                    self._v2_schema = True
         except Exception as e:
             print(f"Warning: Could not load pricing config: {e}")
-            self._config = {"version": "unknown", "providers": {}}
+            self._config_data = {"version": "unknown", "providers": {}}
+        
+        base_models = self._config_data.get("base_models", {})
+        self._model_index = dict(base_models)
+        for alias, canonical in self._config_data.get("model_aliases", {}).items():
+            if alias not in base_models and canonical in base_models:
+                self._model_index[alias] = base_models[canonical]
     
     def get_base_model_info(self, model: str) -> Optional[Dict[str, Any]]:
         """Get base model information (v2 schema only).
@@ -112,19 +166,7 @@ class PricingManager:
         if not self._is_v2_schema:
             return None
         
-        base_models = self._config.get("base_models", {})
-        
-        # Try direct lookup
-        if model in base_models:
-            return base_models[model]
-        
-        # Try aliases
-        aliases = self._config.get("model_aliases", {})
-        canonical = aliases.get(model)
-        if canonical and canonical in base_models:
-            return base_models[canonical]
-        
-        return None
+        return self._model_index.get(model)
     
     def get_model_pricing(
         self, 
@@ -143,10 +185,18 @@ class PricingManager:
             Dict with 'input', 'output', and optionally 'thinking' prices per 1M tokens
             If include_markup_details=True: also includes base_input, base_output, markup_applied
         """
-        if self._is_v2_schema:
-            return self._get_model_pricing_v2(provider, model, include_markup_details)
-        else:
-            return self._get_model_pricing_v1(provider, model)
+        # Checked before the cache so a changed config file flushes it
+        is_v2 = self._is_v2_schema
+        key = (provider, model, include_markup_details)
+        pricing = self._pricing_cache.get(key)
+        if pricing is None:
+            if is_v2:
+                pricing = self._get_model_pricing_v2(provider, model, include_markup_details)
+            else:
+                pricing = self._get_model_pricing_v1(provider, model)
+            self._pricing_cache[key] = pricing
+        # Hand out a copy so callers can't mutate the cached entry
+        return dict(pricing)
     
     def _get_model_pricing_v1(self, provider: str, model: str) -> Dict[str, float]:
         """Get pricing using legacy provider-centric schema."""
@@ -277,15 +327,20 @@ class PricingManager:
         final_output_price = pricing.get("output", 0.0)
         final_thinking_price = pricing.get("thinking", pricing.get("output", 0.0))
         
+        # Token counts in millions, shared by the base and final rates
+        input_m = usage.input_tokens / 1_000_000
+        output_m = usage.output_tokens / 1_000_000
+        thinking_m = usage.thinking_tokens / 1_000_000
+        
         # Calculate costs at base rates
-        base_input_cost = (usage.input_tokens / 1_000_000) * base_input_price
-        base_output_cost = (usage.output_tokens / 1_000_000) * base_output_price
-        base_thinking_cost = (usage.thinking_tokens / 1_000_000) * base_thinking_price
+        base_input_cost = input_m * base_input_price
+        base_output_cost = output_m * base_output_price
+        base_thinking_cost = thinking_m * base_thinking_price
         
         # Calculate costs at final rates
-        input_cost = (usage.input_tokens / 1_000_000) * final_input_price
-        output_cost = (usage.output_tokens / 1_000_000) * final_output_price
-        thinking_cost = (usage.thinking_tokens / 1_000_000) * final_thinking_price
+        input_cost = input_m * final_input_price
+        output_cost = output_m * final_output_price
+        thinking_cost = thinking_m * final_thinking_price
         
         # Calculate provider markup (difference between final and base)
         provider_markup = (input_cost - base_input_cost) + (output_cost - base_output_cost) + (thinking_cost - base_thinking_cost)
@@ -346,6 +401,50 @@ class PricingManager:
             base_model=base_model,
         )
     
+    def _effective_rates(self, provider: str, model: str) -> Tuple[float, float, float]:
+        """Total cost per 1M input/output/thinking tokens, fees and markups included."""
+        unit = 1_000_000
+        return (
+            self.calculate_cost(provider, model, TokenUsage(input_tokens=unit, output_tokens=0)).total_cost,
+            self.calculate_cost(provider, model, TokenUsage(input_tokens=0, output_tokens=unit)).total_cost,
+            self.calculate_cost(
+                provider, model, TokenUsage(input_tokens=0, output_tokens=0, thinking_tokens=unit)
+            ).total_cost,
+        )
+    
+    def calculate_costs_batch(
+        self,
+        providers: Sequence[str],
+        models: Sequence[str],
+        usages: Any,
+    ) -> np.ndarray:
+        """Calculate total costs for many usages across (provider, model) pairs.
+        
+        Cost is linear in token counts, so each pair reduces to three
+        effective per-token rates and the whole grid is a single matrix
+        product instead of one ``calculate_cost`` call per cell.
+        
+        Args:
+            providers: Provider name for each pair
+            models: Model identifier for each pair (same length as providers)
+            usages: Array-like of shape (N, 3) with input, output and
+                thinking token counts per row
+            
+        Returns:
+            Array of shape (N, M) with the total cost of usage row i on pair j
+        """
+        import numpy as np
+        
+        if len(providers) != len(models):
+            raise ValueError("providers and models must have the same length")
+        
+        rates = np.array(
+            [self._effective_rates(p, m) for p, m in zip(providers, models)],
+            dtype=np.float64,
+        ).reshape(-1, 3) / 1_000_000
+        tokens = np.asarray(usages, dtype=np.float64).reshape(-1, 3)
+        return tokens @ rates.T
+    
     def estimate_tokens(self, text: str) -> int:
         """Rough token estimation (4 chars per token average).
         
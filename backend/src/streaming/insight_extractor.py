@@ -126,7 +126,7 @@ class InsightExtractor:
     
     def _extract_sync(self, instruction: str, content: str, model: str) -> str:
         """Synchronous extraction for executor."""
-        result = ""
+        parts: List[str] = []
         try:
             # Use stream_completion: instruction goes to system, content goes to user
             for chunk in self.content_extractor.client.stream_completion(
@@ -137,10 +137,10 @@ class InsightExtractor:
                 max_tokens=500,
             ):
                 if isinstance(chunk, str):
-                    result += chunk
+                    parts.append(chunk)
         except StopIteration:
             pass
-        return result
+        return "".join(parts)
     
     def _parse_fallback(self, text: str, max_insights: int) -> List[Dict[str, str]]:
         """Fallback parser if JSON extraction fails."""
@@ -17,25 +17,76 @@ from .events import (
 from .insight_extractor import insight_extractor
 
 
+def _tokenize(text: str) -> frozenset:
+    """Lower-cased word set used for Jaccard similarity."""
+    return frozenset(text.lower().split())
+
+
+def _jaccard_similarity(set1: frozenset, set2: frozenset) -> float:
+    """Calculate Jaccard similarity between two token sets."""
+    # Handle empty sets
+    if not set1 and not set2:
+        return 1.0
+    if not set1 or not set2:
+        return 0.0
+
+    intersection = len(set1 & set2)
+    union = len(set1 | set2)
+    return intersection / union if union > 0 else 0.0
+
+
+class RunInsights:
+    """Column-oriented insight store for a single run.
+
+    Texts, steps, timestamps and token sets live in parallel lists so
+    novelty checks only walk the precomputed ``tokens`` column instead of
+    re-tokenizing every cached insight.
+    """
+
+    __slots__ = ("texts", "agent_steps", "timestamps", "tokens")
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.agent_steps: List[str] = []
+        self.timestamps: List[float] = []
+        self.tokens: List[frozenset] = []
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def append(self, text: str, agent_step: str) -> None:
+        self.texts.append(text)
+        self.agent_steps.append(agent_step)
+        self.timestamps.append(time.time())
+        self.tokens.append(_tokenize(text))
+
+    def to_dicts(self) -> List[Dict]:
+        return [
+            {"text": text, "agent_step": step, "timestamp": ts}
+            for text, step, ts in zip(self.texts, self.agent_steps, self.timestamps)
+        ]
+
+    def is_novel(self, insight_text: str, threshold: float = 0.8) -> bool:
+        tokens = _tokenize(insight_text)
+        return all(_jaccard_similarity(tokens, prev) < threshold for prev in self.tokens)
+
+
 # Global in-memory cache for run insights
-run_insights_cache: Dict[str, List[Dict]] = {}
+run_insights_cache: Dict[str, RunInsights] = {}
 
 
 def get_run_insights(run_id: str) -> List[Dict]:
     """Get all insights for a run."""
-    return run_insights_cache.get(run_id, [])
+    store = run_insights_cache.get(run_id)
+    return store.to_dicts() if store else []
 
 
 def cache_insight(run_id: str, insight_text: str, agent_step: str) -> None:
     """Cache an insight for a run."""
-    if run_id not in run_insights_cache:
-        run_insights_cache[run_id] = []
-    
-    run_insights_cache[run_id].append({
-        "text": insight_text,
-        "agent_step": agent_step,
-        "timestamp": time.time()
-    })
+    store = run_insights_cache.get(run_id)
+    if store is None:
+        store = run_insights_cache[run_id] = RunInsights()
+    store.append(insight_text, agent_step)
 
 
 def clear_run_insights(run_id: str) -> None:
@@ -52,50 +103,38 @@ def is_novel_insight(insight_text: str, previous_insights: List[Dict], threshold
     if not previous_insights:
         return True
     
-    def jaccard_similarity(text1: str, text2: str) -> float:
-        """Calculate Jaccard similarity between two texts."""
-        # Tokenize and convert to sets of words
-        set1 = set(text1.lower().split())
-        set2 = set(text2.lower().split())
-        
-        # Handle empty sets
-        if not set1 and not set2:
-            return 1.0
-        if not set1 or not set2:
-            return 0.0
-        
-        # Calculate Jaccard similarity
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-        return intersection / union if union > 0 else 0.0
+    tokens = _tokenize(insight_text)
     
     # Check similarity against all previous insights
     for prev_insight in previous_insights:
-        similarity = jaccard_similarity(insight_text, prev_insight["text"])
-        if similarity >= threshold:
+        if _jaccard_similarity(tokens, _tokenize(prev_insight["text"])) >= threshold:
             return False
     
     return True
 
 
+def is_novel_run_insight(run_id: str, insight_text: str, threshold: float = 0.8) -> bool:
+    """Check novelty against a run's cached insights using their stored tokens."""
+    store = run_insights_cache.get(run_id)
+    return store.is_novel(insight_text, threshold) if store else True
+
+
 def get_previous_insights_text(run_id: str, limit: int = 5) -> str:
     """Get previous insights as formatted text for context."""
-    insights = get_run_insights(run_id)
+    store = run_insights_cache.get(run_id)
     
-    if not insights:
+    if not store:
         return ""
     
     # Get last N insights
-    recent_insights = insights[-limit:]
-    
-    # Format as numbered list
-    formatted_insights = []
-    for i, insight in enumerate(recent_insights, 1):
-        step = insight.get("agent_step", "unknown")
-        text = insight["text"][:120]  # Truncate to avoid overly long prompts
-        formatted_insights.append(f"{i}. [{step}] {text}")
+    start = max(0, len(store) - limit)
+    recent = zip(store.agent_steps[start:], store.texts[start:])
     
-    return "\n".join(formatted_insights)
+    # Format as numbered list (truncated to avoid overly long prompts)
+    return "\n".join(
+        f"{i}. [{step or 'unknown'}] {text[:120]}"
+        for i, (step, text) in enumerate(recent, 1)
+    )
 
 
 class LRUCache:
@@ -235,7 +274,6 @@ class InsightListener:
             extraction_text = text[-3000:] if len(text) > 3000 else text
             
             # Get previous insights for context
-            previous_insights = get_run_insights(self.job_id)
             previous_insights_text = get_previous_insights_text(self.job_id, limit=5)
             
             # Extract insights asynchronously with context
@@ -251,7 +289,7 @@ class InsightListener:
                 insight_text = insight["message"]
                 
                 # Check if this insight is novel (not a duplicate)
-                if not is_novel_insight(insight_text, previous_insights):
+                if not is_novel_run_insight(self.job_id, insight_text):
                     print(f"🔍 Skipped duplicate insight: {insight_text[:50]}...")
                     continue
                 
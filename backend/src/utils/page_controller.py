@@ -1,7 +1,7 @@
 """Page estimation and control utilities for DOCX resume generation."""
 
-from typing import List, Tuple, Dict, Any
-import re
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Iterator
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -9,6 +9,23 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
 
+@lru_cache(maxsize=4096)
+def _wrapped_line_count(text: str, chars_per_line: int) -> int:
+    """Count wrapped lines for ``text`` at ``chars_per_line`` (memoized).
+
+    Bullets repeat heavily across estimation passes, so the whitespace
+    normalisation and wrap arithmetic are cached per (text, width).
+    """
+    # Collapse whitespace runs (including newlines) in one C-level pass;
+    # the normalised text is always a single logical line.
+    line_length = len(' '.join(text.split()))
+
+    if line_length <= chars_per_line:
+        return 1
+    # Estimate line wraps for long text (more conservative)
+    return (line_length + chars_per_line - 1) // chars_per_line
+
+
 class PageEstimator:
     """Estimates and controls page count for DOCX documents."""
     
@@ -38,62 +55,46 @@ class PageEstimator:
         if not text:
             return 0
         
-        # Remove extra whitespace and split by actual newlines
-        clean_text = re.sub(r'\s+', ' ', text.strip())
-        lines = clean_text.split('\n')
-        
-        total_lines = 0
-        for line in lines:
-            if len(line) <= cls.CHARS_PER_LINE:
-                total_lines += 1
-            else:
-                # Estimate line wraps for long text (more conservative)
-                wrapped_lines = max(1, (len(line) + cls.CHARS_PER_LINE - 1) // cls.CHARS_PER_LINE)
-                total_lines += wrapped_lines
-        
+        total_lines = _wrapped_line_count(text, cls.CHARS_PER_LINE)
         return total_lines * 1.2  # Add 20% buffer for formatting overhead
     
     @classmethod
-    def estimate_section_lines(cls, section_data: Dict[str, Any]) -> float:
-        """Estimate lines consumed by a resume section."""
-        lines = 0
-        
+    def _iter_section_costs(cls, section_data: Dict[str, Any]) -> Iterator[float]:
+        """Yield the line cost of every element in a section, in one flat pass."""
         # Section header
-        lines += cls.SECTION_HEADER_SPACING
+        yield cls.SECTION_HEADER_SPACING
+        
+        item_header = cls.ITEM_HEADER_SPACING
+        item_subtitle = cls.ITEM_SUBTITLE_SPACING
+        bullet_spacing = cls.BULLET_SPACING
+        estimate = cls.estimate_text_lines
         
-        # Process items in section
-        items = section_data.get('items', [])
-        for item in items:
+        for item in section_data.get('items', []):
             # Item header (title + location)
-            title = item.get('title', '')
-            location = item.get('location', '')
-            lines += cls.ITEM_HEADER_SPACING
+            yield item_header
             
             # Subtitle/dates
-            subtitle = item.get('subtitle', '')
-            dates = item.get('dates', '')
-            if subtitle or dates:
-                lines += cls.ITEM_SUBTITLE_SPACING
+            if item.get('subtitle') or item.get('dates'):
+                yield item_subtitle
             
             # Bullet points
-            bullets = item.get('bullets', [])
-            for bullet in bullets:
-                lines += cls.estimate_text_lines(bullet) * cls.BULLET_SPACING
-        
-        return lines
+            for bullet in item.get('bullets', []):
+                yield estimate(bullet) * bullet_spacing
+    
+    @classmethod
+    def estimate_section_lines(cls, section_data: Dict[str, Any]) -> float:
+        """Estimate lines consumed by a resume section."""
+        return sum(cls._iter_section_costs(section_data))
     
     @classmethod
     def estimate_resume_pages(cls, resume_data: Dict[str, Any]) -> float:
         """Estimate total pages for a complete resume."""
-        total_lines = 0
-        
-        # Contact info (name + contact)
-        total_lines += cls.CONTACT_SPACING
-        
-        # Process each section
-        sections = resume_data.get('sections', [])
-        for section in sections:
-            total_lines += cls.estimate_section_lines(section)
+        # Contact info (name + contact) plus every section element
+        total_lines = cls.CONTACT_SPACING + sum(
+            cost
+            for section in resume_data.get('sections', [])
+            for cost in cls._iter_section_costs(section)
+        )
         
         # Convert to pages with calibration factor based on real data
         estimated_pages = (total_lines / cls.LINES_PER_PAGE) * 1.0  # Updated calibration: 1.3 * 0.79 ≈ 1.0
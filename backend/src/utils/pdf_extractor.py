@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import time
 from pathlib import Path
 from typing import Optional
 
@@ -72,7 +72,7 @@ async def _extract_via_file_api(
         Extracted text content
     """
     # Upload file to Gemini
-    uploaded_file = client.files.upload(
+    uploaded_file = await client.aio.files.upload(
         file=file_path,
         config=dict(mime_type="application/pdf"),
     )
@@ -81,9 +81,9 @@ async def _extract_via_file_api(
     max_wait = 60  # seconds
     wait_time = 0
     while uploaded_file.state == "PROCESSING" and wait_time < max_wait:
-        time.sleep(2)
+        await asyncio.sleep(2)
         wait_time += 2
-        uploaded_file = client.files.get(name=uploaded_file.name)
+        uploaded_file = await client.aio.files.get(name=uploaded_file.name)
 
     if uploaded_file.state == "FAILED":
         raise Exception("Gemini file processing failed")
@@ -103,14 +103,14 @@ Requirements:
 
 Do not add any commentary or analysis - just extract the text as-is."""
 
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=model,
         contents=[uploaded_file, prompt],
     )
 
     # Cleanup uploaded file
     try:
-        client.files.delete(name=uploaded_file.name)
+        await client.aio.files.delete(name=uploaded_file.name)
     except Exception:
         pass  # Ignore cleanup errors
 
@@ -124,6 +124,11 @@ async def _extract_inline(
 ) -> str:
     """Extract PDF text using inline bytes (for files < 20MB).
 
+    The SDK needs the raw bytes for ``Part.from_bytes`` and base64-encodes
+    them itself, so the file is read once (off the event loop) and passed
+    through without an extra encoded copy. Larger files go through the
+    File API, which streams the upload from disk.
+
     Args:
         client: Gemini client instance
         file_path: Path to PDF file
@@ -132,7 +137,7 @@ async def _extract_inline(
     Returns:
         Extracted text content
     """
-    file_bytes = Path(file_path).read_bytes()
+    file_bytes = await asyncio.to_thread(Path(file_path).read_bytes)
 
     prompt = """Extract all text content from this document. 
 
@@ -145,7 +150,7 @@ Requirements:
 
 Do not add any commentary or analysis - just extract the text as-is."""
 
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=model,
         contents=[
             types.Part.from_bytes(
@@ -159,11 +164,39 @@ Do not add any commentary or analysis - just extract the text as-is."""
     return response.text
 
 
+def _extract_pages_pdfium(file_path: str) -> list[str]:
+    """Extract per-page text with pypdfium2 (native PDFium bindings)."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                pages.append(textpage.get_text_range().replace("\r\n", "\n"))
+            finally:
+                textpage.close()
+                page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _extract_pages_pypdf(file_path: str) -> list[str]:
+    """Extract per-page text with the pure-Python pypdf reader."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(file_path)
+    return [page.extract_text() for page in reader.pages]
+
+
 def extract_text_from_pdf_fallback(file_path: str) -> str:
-    """Fallback PDF text extraction using pypdf library.
+    """Fallback PDF text extraction without Gemini.
 
     Used when Gemini API is unavailable or fails. Provides basic text extraction
-    without advanced formatting preservation.
+    without advanced formatting preservation. Prefers pypdfium2, which parses
+    in native code, and falls back to pypdf when it is not installed.
 
     Args:
         file_path: Path to PDF file
@@ -172,23 +205,26 @@ def extract_text_from_pdf_fallback(file_path: str) -> str:
         Extracted text content
 
     Raises:
-        ImportError: If pypdf is not installed
+        ImportError: If neither pypdfium2 nor pypdf is installed
         Exception: If PDF reading fails
     """
     try:
-        from pypdf import PdfReader
-    except ImportError as e:
-        raise ImportError(
-            "pypdf library required for fallback extraction. "
-            "Install with: pip install pypdf"
-        ) from e
+        import pypdfium2  # noqa: F401
+        extract_pages = _extract_pages_pdfium
+    except ImportError:
+        try:
+            import pypdf  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "pypdfium2 or pypdf library required for fallback extraction. "
+                "Install with: pip install pypdfium2"
+            ) from e
+        extract_pages = _extract_pages_pypdf
 
     try:
-        reader = PdfReader(file_path)
         text_parts = []
 
-        for page_num, page in enumerate(reader.pages, 1):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(extract_pages(file_path), 1):
             if page_text.strip():
                 text_parts.append(f"--- Page {page_num} ---\n{page_text}")
 
@@ -2,7 +2,17 @@
 
 import os
 
+import pytest
+
 
 os.environ.setdefault("USE_SUPABASE_DB", "true")
 os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
 os.environ.setdefault("SUPABASE_SECRET_KEY", "sb_secret_test")
+
+
+@pytest.fixture(scope="session")
+def pm():
+    """Pricing manager shared by the whole session so the config loads once."""
+    from src.api.pricing import PricingManager
+
+    return PricingManager(use_v2=True)
@@ -3,6 +3,7 @@
 import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add project src to path
@@ -62,8 +63,10 @@ async def test_pdf_extraction_module():
             try:
                 from src.utils.pdf_extractor import extract_text_from_pdf_gemini
                 
+                started = time.perf_counter()
                 text = await extract_text_from_pdf_gemini(str(test_pdf_path))
-                print(f"✓ Successfully extracted {len(text)} characters using Gemini")
+                elapsed = time.perf_counter() - started
+                print(f"✓ Successfully extracted {len(text)} characters using Gemini ({elapsed:.2f}s)")
                 print(f"  Preview: {text[:200]}...")
             except Exception as e:
                 print(f"✗ Gemini extraction failed: {str(e)}")
@@ -1,299 +1,115 @@
-"""Test script for model-centric pricing architecture (v2)."""
+"""Tests for model-centric pricing architecture (v2)."""
 
-import sys
-import json
-from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, Optional
+import pytest
 
-# Add project src to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+from src.api.pricing import TokenUsage
 
-import importlib.util
-pricing_path = PROJECT_ROOT / "src" / "api" / "pricing.py"
-spec = importlib.util.spec_from_file_location("pricing", str(pricing_path))
-pricing_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(pricing_module)
+SONNET = "anthropic/claude-sonnet-4.5"
+FLASH = "gemini-2.5-flash"
 
-PricingManager = pricing_module.PricingManager
-TokenUsage = pricing_module.TokenUsage
-CostBreakdown = pricing_module.CostBreakdown
 
-def test_basic_loading():
-    """Test that v2 config loads correctly."""
-    print("=" * 60)
-    print("TEST 1: Basic V2 Config Loading")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    print("✓ Pricing manager loaded")
-    print(f"  Version: {pm._config.get('version')}")
-    print(f"  Schema: {pm._config.get('schema')}")
-    print(f"  Base models count: {len(pm._config.get('base_models', {}))}")
-    print()
+def test_basic_loading(pm):
+    assert pm._is_v2_schema
+    assert pm._config.get("schema") == "model-centric"
+    assert pm._config.get("version") not in (None, "unknown")
+    assert pm._config.get("base_models")
 
-def test_base_model_lookup():
-    """Test base model information retrieval."""
-    print("=" * 60)
-    print("TEST 2: Base Model Information Lookup")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    # Test direct lookup
-    model = "anthropic/claude-sonnet-4.5"
-    info = pm.get_base_model_info(model)
-    print(f"Model: {model}")
-    print(f"  Display name: {info['display_name']}")
-    print(f"  Vendor: {info['vendor']}")
-    print(f"  Base pricing: ${info['base_pricing']['input']}/1M input, ${info['base_pricing']['output']}/1M output")
-    print(f"  Context window: {info['context_window']:,} tokens")
-    print(f"  Supports thinking: {info['supports_thinking']}")
-    print()
-    
-    # Test alias lookup
-    alias = "claude-sonnet"
-    info = pm.get_base_model_info(alias)
-    print(f"Alias: {alias}")
-    print(f"  Resolves to: {info['display_name']}")
-    print()
 
-def test_pricing_without_markup():
-    """Test direct pricing (no markup)."""
-    print("=" * 60)
-    print("TEST 3: Direct Pricing (Gemini - No Markup)")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "gemini-2.5-flash"
-    pricing = pm.get_model_pricing("gemini", model, include_markup_details=True)
-    
-    print(f"Model: {model} via Gemini")
-    print(f"  Input: ${pricing['input']}/1M tokens")
-    print(f"  Output: ${pricing['output']}/1M tokens")
-    print(f"  Base input: ${pricing['base_input']}/1M tokens")
-    print(f"  Base output: ${pricing['base_output']}/1M tokens")
-    print(f"  Markup: {pricing['markup_applied']}")
-    print()
+def test_base_model_lookup(pm):
+    info = pm.get_base_model_info(SONNET)
 
-def test_pricing_with_platform_fee():
-    """Test platform fee markup (OpenRouter)."""
-    print("=" * 60)
-    print("TEST 4: Platform Fee Markup (OpenRouter)")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "anthropic/claude-sonnet-4.5"
-    pricing = pm.get_model_pricing("openrouter", model, include_markup_details=True)
-    
-    print(f"Model: {model} via OpenRouter")
-    print(f"  Base input: ${pricing['base_input']}/1M tokens")
-    print(f"  Base output: ${pricing['base_output']}/1M tokens")
-    print(f"  Final input: ${pricing['input']}/1M tokens (same as base)")
-    print(f"  Final output: ${pricing['output']}/1M tokens (same as base)")
-    print(f"  Markup: {pricing['markup_applied']}")
-    print()
+    assert info["display_name"] == "Claude Sonnet 4.5"
+    assert info["vendor"] == "anthropic"
+    assert info["context_window"] > 0
+    assert {"input", "output"} <= info["base_pricing"].keys()
 
-def test_pricing_with_multiplier():
-    """Test multiplier markup (Zenmux)."""
-    print("=" * 60)
-    print("TEST 5: Multiplier Markup (Zenmux)")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "anthropic/claude-sonnet-4.5"
-    pricing = pm.get_model_pricing("zenmux", model, include_markup_details=True)
-    
-    print(f"Model: {model} via Zenmux")
-    print(f"  Base input: ${pricing['base_input']}/1M tokens")
-    print(f"  Base output: ${pricing['base_output']}/1M tokens")
-    print(f"  Final input: ${pricing['input']}/1M tokens")
-    print(f"  Final output: ${pricing['output']}/1M tokens")
-    print(f"  Markup: {pricing['markup_applied']}")
-    
-    # Calculate input multiplier with safety checks
-    base_input = pricing.get('base_input')
-    input_price = pricing.get('input')
-    if base_input and base_input > 0 and input_price:
-        input_multiplier = input_price / base_input
-        print(f"  Input multiplier: {input_multiplier:.2f}x")
-    else:
-        print("  Input multiplier: N/A")
-    
-    # Calculate output multiplier with safety checks
-    base_output = pricing.get('base_output')
-    output_price = pricing.get('output')
-    if base_output and base_output > 0 and output_price:
-        output_multiplier = output_price / base_output
-        print(f"  Output multiplier: {output_multiplier:.2f}x")
-    else:
-        print("  Output multiplier: N/A")
-    print()
 
-def test_cost_calculation_openrouter():
-    """Test cost calculation with OpenRouter platform fee."""
-    print("=" * 60)
-    print("TEST 6: Cost Calculation - OpenRouter Platform Fee")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "anthropic/claude-sonnet-4.5"
-    usage = TokenUsage(input_tokens=1000, output_tokens=2000)
-    cost = pm.calculate_cost("openrouter", model, usage)
-    
-    print(f"Model: {model} via OpenRouter")
-    print(f"Usage: {usage.input_tokens:,} input + {usage.output_tokens:,} output tokens")
-    print()
-    print("Cost Breakdown:")
-    print(f"  Base input cost:  ${cost.input_cost:.6f}")
-    print(f"  Base output cost: ${cost.output_cost:.6f}")
-    print(f"  Subtotal:         ${cost.input_cost + cost.output_cost:.6f}")
-    print(f"  Platform fee:     ${cost.platform_fee:.6f} ({cost.markup_value})")
-    print(f"  Provider markup:  ${cost.provider_markup:.6f}")
-    print(f"  TOTAL COST:       ${cost.total_cost:.6f}")
-    print()
-    print("Rates:")
-    print(f"  Base input:  ${cost.base_input_price_per_1m:.2f}/1M tokens")
-    print(f"  Base output: ${cost.base_output_price_per_1m:.2f}/1M tokens")
-    print(f"  Final input:  ${cost.input_price_per_1m:.2f}/1M tokens")
-    print(f"  Final output: ${cost.output_price_per_1m:.2f}/1M tokens")
-    print()
+@pytest.mark.parametrize(
+    "alias, model",
+    [
+        ("claude-sonnet", SONNET),
+        ("gemini-flash", FLASH),
+    ],
+)
+def test_alias_lookup(pm, alias, model):
+    assert pm.get_base_model_info(alias) is pm.get_base_model_info(model)
+
+
+@pytest.mark.parametrize(
+    "provider, model, markup",
+    [
+        ("gemini", FLASH, "none"),
+        ("openrouter", SONNET, "5.5% platform fee"),
+    ],
+)
+def test_pricing_keeps_base_rates(pm, provider, model, markup):
+    """Direct and platform-fee providers bill at the base per-token rates."""
+    pricing = pm.get_model_pricing(provider, model, include_markup_details=True)
+
+    assert pricing["input"] == pricing["base_input"]
+    assert pricing["output"] == pricing["base_output"]
+    assert pricing["markup_applied"] == markup
+
 
-def test_cost_calculation_zenmux():
-    """Test cost calculation with Zenmux multiplier."""
-    print("=" * 60)
-    print("TEST 7: Cost Calculation - Zenmux Multiplier")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "anthropic/claude-sonnet-4.5"
+def test_pricing_with_multiplier(pm):
+    pricing = pm.get_model_pricing("zenmux", SONNET, include_markup_details=True)
+    markup = pm._config["providers"]["zenmux"]["model_specific_markup"][SONNET]
+
+    assert pricing["input"] == pytest.approx(pricing["base_input"] * markup["input_multiplier"])
+    assert pricing["output"] == pytest.approx(pricing["base_output"] * markup["output_multiplier"])
+
+
+def test_cost_calculation_openrouter(pm):
     usage = TokenUsage(input_tokens=1000, output_tokens=2000)
-    cost = pm.calculate_cost("zenmux", model, usage)
-    
-    print(f"Model: {model} via Zenmux")
-    print(f"Usage: {usage.input_tokens:,} input + {usage.output_tokens:,} output tokens")
-    print()
-    print("Cost Breakdown:")
-    print(f"  Input cost:       ${cost.input_cost:.6f}")
-    print(f"  Output cost:      ${cost.output_cost:.6f}")
-    print(f"  Provider markup:  ${cost.provider_markup:.6f} ({cost.markup_value})")
-    print(f"  Platform fee:     ${cost.platform_fee:.6f}")
-    print(f"  TOTAL COST:       ${cost.total_cost:.6f}")
-    print()
-    print("Rates:")
-    print(f"  Base input:  ${cost.base_input_price_per_1m:.2f}/1M tokens")
-    print(f"  Base output: ${cost.base_output_price_per_1m:.2f}/1M tokens")
-    print(f"  Final input:  ${cost.input_price_per_1m:.2f}/1M tokens ({cost.input_price_per_1m / cost.base_input_price_per_1m:.1f}x)" if cost.base_input_price_per_1m > 0 else "  Final input:  ${cost.input_price_per_1m:.2f}/1M tokens (N/A)")
-    print(f"  Final output: ${cost.output_price_per_1m:.2f}/1M tokens ({cost.output_price_per_1m / cost.base_output_price_per_1m:.1f}x)" if cost.base_output_price_per_1m > 0 else "  Final output: ${cost.output_price_per_1m:.2f}/1M tokens (N/A)")
-    print()
+    cost = pm.calculate_cost("openrouter", SONNET, usage)
+
+    subtotal = cost.input_cost + cost.output_cost
+    assert cost.markup_type == "platform_fee"
+    assert cost.provider_markup == 0.0
+    assert cost.platform_fee == pytest.approx(subtotal * 0.055)
+    assert cost.total_cost == pytest.approx(subtotal + cost.platform_fee)
 
-def test_cost_comparison():
-    """Compare costs across providers for the same model."""
-    print("=" * 60)
-    print("TEST 8: Cost Comparison Across Providers")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "anthropic/claude-sonnet-4.5"
+
+def test_cost_calculation_zenmux(pm):
     usage = TokenUsage(input_tokens=1000, output_tokens=2000)
-    
-    print(f"Model: {model}")
-    print(f"Usage: {usage.input_tokens:,} input + {usage.output_tokens:,} output tokens")
-    print()
-    
+    cost = pm.calculate_cost("zenmux", SONNET, usage)
+
+    base_cost = (
+        usage.input_tokens * cost.base_input_price_per_1m
+        + usage.output_tokens * cost.base_output_price_per_1m
+    ) / 1_000_000
+    assert cost.markup_type == "multiplier"
+    assert cost.platform_fee == 0.0
+    assert cost.provider_markup == pytest.approx(cost.input_cost + cost.output_cost - base_cost)
+    assert cost.total_cost == pytest.approx(cost.input_cost + cost.output_cost + cost.provider_markup)
+
+
+@pytest.mark.parametrize(
+    "usage",
+    [
+        TokenUsage(input_tokens=1000, output_tokens=2000),
+        TokenUsage(input_tokens=0, output_tokens=0, thinking_tokens=500),
+    ],
+)
+def test_cost_comparison(pm, usage):
+    """Batch totals match calculate_cost, and the multiplier provider is pricier."""
     providers = ["openrouter", "zenmux"]
-    costs = []
-    
-    for provider in providers:
-        cost = pm.calculate_cost(provider, model, usage)
-        costs.append((provider, cost))
-        print(f"{provider.upper()}:")
-        print(f"  Base cost:   ${cost.input_cost + cost.output_cost - cost.provider_markup:.6f}")
-        print(f"  Markup:      ${cost.provider_markup:.6f}")
-        print(f"  Platform fee: ${cost.platform_fee:.6f}")
-        print(f"  TOTAL:       ${cost.total_cost:.6f}")
-        print()
-    
-    # Calculate price difference
-    cheapest = min(costs, key=lambda x: x[1].total_cost)
-    most_expensive = max(costs, key=lambda x: x[1].total_cost)
-    
-    price_diff = most_expensive[1].total_cost - cheapest[1].total_cost
-    
-    # Calculate price ratio with zero-division guard
-    if cheapest[1].total_cost == 0:
-        price_ratio = float('inf')
-    else:
-        price_ratio = most_expensive[1].total_cost / cheapest[1].total_cost
-    
-    print(f"Cheapest: {cheapest[0]} at ${cheapest[1].total_cost:.6f}")
-    print(f"Most expensive: {most_expensive[0]} at ${most_expensive[1].total_cost:.6f}")
-    print(f"Price difference: ${price_diff:.6f} ({price_ratio:.2f}x)")
-    print()
 
-def test_thinking_tokens():
-    """Test cost calculation with thinking tokens (Gemini 2.5)."""
-    print("=" * 60)
-    print("TEST 9: Thinking Tokens Cost (Gemini 2.5)")
-    print("=" * 60)
-    
-    pm = PricingManager(use_v2=True)
-    
-    model = "gemini-2.5-flash"
-    usage = TokenUsage(input_tokens=1000, output_tokens=2000, thinking_tokens=500)
-    cost = pm.calculate_cost("gemini", model, usage)
-    
-    print(f"Model: {model} via Gemini")
-    print(f"Usage: {usage.input_tokens:,} input + {usage.output_tokens:,} output + {usage.thinking_tokens:,} thinking tokens")
-    print()
-    print("Cost Breakdown:")
-    print(f"  Input cost:    ${cost.input_cost:.6f}")
-    print(f"  Output cost:   ${cost.output_cost:.6f}")
-    print(f"  Thinking cost: ${cost.thinking_cost:.6f}")
-    print(f"  TOTAL COST:    ${cost.total_cost:.6f}")
-    print()
-    print("Rates:")
-    print(f"  Input:    ${cost.input_price_per_1m:.2f}/1M tokens")
-    print(f"  Output:   ${cost.output_price_per_1m:.2f}/1M tokens")
-    print(f"  Thinking: ${cost.thinking_price_per_1m:.2f}/1M tokens")
-    print()
+    totals = pm.calculate_costs_batch(
+        providers,
+        [SONNET] * len(providers),
+        [[usage.input_tokens, usage.output_tokens, usage.thinking_tokens]],
+    )[0]
+
+    for provider, total in zip(providers, totals):
+        assert total == pytest.approx(pm.calculate_cost(provider, SONNET, usage).total_cost)
+    assert providers[int(totals.argmin())] == "openrouter"
 
-def main():
-    """Run all tests."""
-    try:
-        test_basic_loading()
-        test_base_model_lookup()
-        test_pricing_without_markup()
-        test_pricing_with_platform_fee()
-        test_pricing_with_multiplier()
-        test_cost_calculation_openrouter()
-        test_cost_calculation_zenmux()
-        test_cost_comparison()
-        test_thinking_tokens()
-        
-        print("=" * 60)
-        print("✓ ALL TESTS PASSED!")
-        print("=" * 60)
-        print()
-        print("Key Insights:")
-        print("  • Model-centric pricing provides transparency")
-        print("  • Provider markups are clearly visible")
-        print("  • Easy to compare costs across providers")
-        print("  • Thinking tokens tracked separately")
-        print()
-        
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
 
-if __name__ == "__main__":
-    main()
+def test_thinking_tokens(pm):
+    usage = TokenUsage(input_tokens=1000, output_tokens=2000, thinking_tokens=500)
+    cost = pm.calculate_cost("gemini", FLASH, usage)
+
+    assert usage.total_tokens == 3500
+    assert cost.thinking_cost == pytest.approx(500 * cost.thinking_price_per_1m / 1_000_000)
+    assert cost.total_cost == pytest.approx(cost.input_cost + cost.output_cost + cost.thinking_cost)
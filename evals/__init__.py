@@ -1,13 +1,3 @@
-"""Evaluation suite for resume optimizer pipeline.
-
-This package provides a research-grade evaluation framework for comparing
-LLM configurations across pipeline stages using human preference judgments.
-
-Key modules:
-- framework: Core evaluation logic (runner, collector, analyzer)
-- db: Database layer for persistence
-- ui: Streamlit UI for blind comparison
-- scripts: CLI tools for running evals and analysis
-"""
+"""Evaluation suite for the resume optimizer pipeline (see README.md)."""
 
 __version__ = "0.1.0"
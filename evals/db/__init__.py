@@ -8,6 +8,6 @@ _evals_root = Path(__file__).parent.parent
 if str(_evals_root) not in sys.path:
     sys.path.insert(0, str(_evals_root))
 
-from .eval_db import EvalDatabase
+from .eval_db import EvalDatabase, get_db
 
-__all__ = ["EvalDatabase"]
+__all__ = ["EvalDatabase", "get_db"]
@@ -5,10 +5,17 @@ candidate outputs, and human judgments.
 """
 
 import json
+import logging
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from framework.schemas import (
     Scenario,
@@ -19,9 +26,190 @@ from framework.schemas import (
     PairwiseResult,
 )
 
+logger = logging.getLogger(__name__)
+
+# orjson is a much faster codec for the metadata/context/score blobs; values
+# are still stored as TEXT so databases stay readable with either codec
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# JSON columns are selected as `col AS "col [json]"`; with PARSE_COLNAMES the
+# sqlite3 C layer hands their bytes straight to the decoder during fetch.
+# NULLs bypass converters and come back as None.
+sqlite3.register_converter("json", _json_loads)
+
+# The list methods unpack rows from these column lists positionally (plain
+# tuples skip sqlite3.Row's per-access name lookup), so keep the order in
+# sync with those methods.
+_SCENARIO_COLUMNS = (
+    'id, scenario_id, user_profile, job_posting, created_at, '
+    'metadata AS "metadata [json]"'
+)
+_STAGE_RUN_COLUMNS = (
+    'sr.id, sr.scenario_id, sr.stage_id, sr.created_at, '
+    'sr.context AS "context [json]"'
+)
+_CANDIDATE_COLUMNS = (
+    'id, stage_run_id, candidate_label, model_id, output_text, latency_ms, '
+    'token_count, created_at'
+)
+_JUDGMENT_COLUMNS = (
+    'id, stage_run_id, evaluator_id, chosen_candidate_id, comments, created_at, '
+    'ranking AS "ranking [json]", scores AS "scores [json]", tags AS "tags [json]"'
+)
+
+# Applied to every connection. WAL lets readers proceed during writes and,
+# with synchronous=NORMAL, fsyncs at checkpoints rather than on each commit.
+_CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "busy_timeout=30000",
+    "cache_size=-20000",
+    "temp_store=MEMORY",
+    "foreign_keys=ON",
+    "mmap_size=268435456",
+)
+
+# Separator for model ids aggregated with GROUP_CONCAT (ASCII unit separator,
+# which can't appear in a model id)
+_MODEL_SEP = "\x1f"
+
+# INSERT ... RETURNING (SQLite 3.35+) hands back the assigned id and
+# created_at from the insert itself; older builds fall back to lastrowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING = " RETURNING id, created_at" if _HAS_RETURNING else ""
+
+# Parameters bound per multi-row INSERT; well below SQLite's parameter limit
+_MAX_IN_PARAMS = 500
+
+# ID lists are bound as one JSON array and expanded with json_each, so an
+# "IN (...)" query has the same SQL text for any number of IDs. sqlite3
+# caches prepared statements per connection keyed by that text; a
+# placeholder per ID would compile a fresh statement for every list length.
+_IN_IDS = "IN (SELECT value FROM json_each(?))"
+
+# Candidate insert up to VALUES; callers append one "(?, ...)" group per row
+_INSERT_CANDIDATES = (
+    "INSERT INTO eval_candidates "
+    "(stage_run_id, candidate_label, model_id, output_text, latency_ms, token_count) "
+    "VALUES "
+)
+
+# Judgment insert up to VALUES, same convention
+_INSERT_JUDGMENTS = (
+    "INSERT INTO eval_judgments "
+    "(stage_run_id, evaluator_id, chosen_candidate_id, ranking, scores, tags, comments) "
+    "VALUES "
+)
+_INSERT_JUDGMENT_TAGS = "INSERT OR IGNORE INTO eval_judgment_tags (judgment_id, tag) VALUES (?, ?)"
+
+
+def _judgment_params(judgment: Judgment) -> tuple:
+    """Bind values for one _INSERT_JUDGMENTS row."""
+    return (
+        judgment.stage_run_id,
+        judgment.evaluator_id,
+        judgment.chosen_candidate_id,
+        _json_dumps(judgment.ranking) if judgment.ranking else None,
+        _json_dumps(judgment.scores) if judgment.scores else None,
+        _json_dumps(judgment.tags) if judgment.tags else None,
+        judgment.comments,
+    )
+
+
+# Judged (winner, loser) model pairs for a stage, one per judgment and
+# losing model, plus the models in them numbered 0..n-1 in id order
+_PAIRWISE_CTE = """
+    WITH pairs AS (
+        SELECT DISTINCT
+            j.id AS judgment_id,
+            winner_c.model_id AS winner,
+            loser_c.model_id AS loser
+        FROM eval_judgments j
+        JOIN eval_stage_runs sr ON j.stage_run_id = sr.id
+        JOIN eval_candidates winner_c ON winner_c.id = j.chosen_candidate_id
+        JOIN eval_candidates loser_c
+            ON loser_c.stage_run_id = sr.id
+            AND loser_c.model_id <> winner_c.model_id
+        WHERE sr.stage_id = ?
+    ),
+    models AS (
+        SELECT model_id, ROW_NUMBER() OVER (ORDER BY model_id) - 1 AS idx
+        FROM (SELECT winner AS model_id FROM pairs UNION SELECT loser FROM pairs)
+    )
+"""
+
+# Column definitions per table, in creation order. Child rows cascade on
+# delete so removing a scenario or stage run is a single statement.
+# created_at stays ISO-8601 TEXT: datetime.fromisoformat parses it in C,
+# faster than building a datetime from an integer epoch would be.
+_TABLES = {
+    "eval_scenarios": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scenario_id TEXT UNIQUE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        user_profile TEXT NOT NULL,
+        job_posting TEXT NOT NULL,
+        metadata TEXT
+    """,
+    "eval_stage_runs": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scenario_id TEXT NOT NULL,
+        stage_id TEXT NOT NULL,
+        context TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (scenario_id) REFERENCES eval_scenarios(scenario_id)
+            ON DELETE CASCADE
+    """,
+    "eval_candidates": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stage_run_id INTEGER NOT NULL,
+        candidate_label TEXT NOT NULL,
+        model_id TEXT NOT NULL,
+        output_text TEXT NOT NULL,
+        latency_ms INTEGER,
+        token_count INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (stage_run_id) REFERENCES eval_stage_runs(id) ON DELETE CASCADE
+    """,
+    "eval_judgments": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stage_run_id INTEGER NOT NULL,
+        evaluator_id TEXT DEFAULT 'default',
+        chosen_candidate_id INTEGER NOT NULL,
+        ranking TEXT,
+        scores TEXT,
+        tags TEXT,
+        comments TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (stage_run_id) REFERENCES eval_stage_runs(id) ON DELETE CASCADE,
+        FOREIGN KEY (chosen_candidate_id) REFERENCES eval_candidates(id)
+            ON DELETE CASCADE
+    """,
+    # One row per judgment tag so tag filters are index lookups; the JSON
+    # tags column on eval_judgments stays as the ordered copy for reads
+    "eval_judgment_tags": """
+        judgment_id INTEGER NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (judgment_id, tag),
+        FOREIGN KEY (judgment_id) REFERENCES eval_judgments(id) ON DELETE CASCADE
+    """,
+}
+
 
 class EvalDatabase:
-    """SQLite database for evaluation data."""
+    """SQLite database for evaluation data.
+
+    Instances are meant to be long-lived: opening one sets up connections,
+    PRAGMAs and the schema. Use get_db() to share one per database file.
+    """
 
     def __init__(self, db_path: str = "./data/evals.db"):
         """Initialize database connection and create tables.
@@ -31,63 +219,187 @@ class EvalDatabase:
         """
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Single writer connection; all INSERT/DELETE paths hold _write_lock
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, detect_types=sqlite3.PARSE_COLNAMES
+        )
         self.conn.row_factory = sqlite3.Row
+        self._write_lock = threading.RLock()
+        # Nesting depth of transaction() blocks; writes commit only at depth 0
+        self._txn_depth = 0
+        # Bumped on every commit through this instance, see data_version()
+        self._write_count = 0
+        self._configure_connection(self.conn)
         self._create_tables()
+        # Read-only connections, opened on demand and reused; under WAL they
+        # read concurrently with each other and with the writer
+        self._readers: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        # The reader a thread has checked out, so nested reads share it
+        self._local = threading.local()
+        # Dedicated reader for PRAGMA data_version, whose value is only
+        # comparable across calls on the same connection
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
+
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Switch a connection to WAL and apply the tuned PRAGMAs."""
+        # In-memory databases can't use WAL
+        if self.db_path != ":memory:":
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                logger.warning("SQLite stayed in %s journal mode for %s", mode, self.db_path)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+
+    @contextmanager
+    def transaction(self) -> Iterator["EvalDatabase"]:
+        """Group several writes into one transaction with a single commit.
+
+        Write methods called inside the block skip their own commit; the
+        whole block commits on exit or rolls back if it raises. Blocks may
+        nest, in which case only the outermost one commits. Reads run on
+        separate connections and don't see the block's writes until it
+        commits.
+
+        Example:
+            with db.transaction():
+                stage_run_id = db.create_stage_run(scenario_id, stage_id, context)
+                db.save_candidates(stage_run_id, candidates)
+        """
+        with self._write_lock:
+            if not self._txn_depth:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._txn_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._txn_depth -= 1
+                if not self._txn_depth:
+                    self.conn.rollback()
+                raise
+            self._txn_depth -= 1
+            if not self._txn_depth:
+                self.conn.commit()
+                self._write_count += 1
+
+    def _commit(self) -> None:
+        """Commit the current write unless a transaction() block is open."""
+        if not self._txn_depth:
+            self.conn.commit()
+            self._write_count += 1
+
+    def _insert(self, sql: str, params: tuple) -> sqlite3.Row:
+        """Run a single-row INSERT and return its (id, created_at).
+
+        created_at is None on SQLite builds without RETURNING support.
+        """
+        cursor = self.conn.execute(sql + _RETURNING, params)
+        if _HAS_RETURNING:
+            return cursor.fetchone()
+        return {"id": cursor.lastrowid, "created_at": None}
+
+    def data_version(self) -> tuple:
+        """Get a token that changes whenever the stored data may have changed.
+
+        Covers writes made through this instance as well as commits from
+        other connections or processes (via PRAGMA data_version), so callers
+        can cache query results and drop them when the token moves.
+
+        Returns:
+            Opaque tuple; compare for equality only
+        """
+        # Neither part waits on _write_lock, so lookups don't queue behind
+        # open transactions or bulk saves
+        if self.db_path == ":memory:":
+            # No other connection can write a private in-memory database
+            return (self._write_count, 0)
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = self._open_reader()
+            external = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._write_count, external)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a new read-only connection to the database file."""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, detect_types=sqlite3.PARSE_COLNAMES
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure_connection(conn)
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection for the duration of a query.
+
+        Reads nested inside another read on the same thread reuse its
+        connection, and with it any snapshot the outer read has open.
+        """
+        # An in-memory database is private to its connection
+        if self.db_path == ":memory:":
+            with self._write_lock:
+                yield self.conn
+            return
+
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+            with self._write_lock:
+                self._all_readers.append(conn)
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._readers.put(conn)
 
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
 
-        # Scenarios table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS eval_scenarios (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scenario_id TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                user_profile TEXT NOT NULL,
-                job_posting TEXT NOT NULL,
-                metadata TEXT
+        has_tag_table = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'eval_judgment_tags'"
+        ).fetchone()
+        for name, columns in _TABLES.items():
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} ({columns})")
+        self._migrate_cascade_foreign_keys()
+
+        # Databases from before the tag table get it filled from the JSON column
+        if not has_tag_table:
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO eval_judgment_tags (judgment_id, tag)
+                SELECT j.id, t.value FROM eval_judgments j, json_each(j.tags) t
+                WHERE j.tags IS NOT NULL
+                """
             )
-        """)
+
+        # Scenarios
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_scenarios_id ON eval_scenarios(scenario_id)"
         )
 
-        # Stage evaluations table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS eval_stage_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scenario_id TEXT NOT NULL,
-                stage_id TEXT NOT NULL,
-                context TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (scenario_id) REFERENCES eval_scenarios(scenario_id)
-            )
-        """)
+        # Stage runs. The composite index serves scenario lookups filtered by
+        # stage and ordered by recency; it supersedes the scenario_id-only one
+        cursor.execute("DROP INDEX IF EXISTS idx_stage_runs_scenario")
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_stage_runs_scenario "
-            "ON eval_stage_runs(scenario_id)"
+            "CREATE INDEX IF NOT EXISTS idx_stage_runs_scenario_stage "
+            "ON eval_stage_runs(scenario_id, stage_id, created_at DESC)"
         )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_stage_runs_stage "
             "ON eval_stage_runs(stage_id)"
         )
 
-        # Candidate outputs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS eval_candidates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                stage_run_id INTEGER NOT NULL,
-                candidate_label TEXT NOT NULL,
-                model_id TEXT NOT NULL,
-                output_text TEXT NOT NULL,
-                latency_ms INTEGER,
-                token_count INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (stage_run_id) REFERENCES eval_stage_runs(id)
-            )
-        """)
+        # Candidates
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_candidates_stage_run "
             "ON eval_candidates(stage_run_id)"
@@ -96,30 +408,71 @@ class EvalDatabase:
             "CREATE INDEX IF NOT EXISTS idx_candidates_model "
             "ON eval_candidates(model_id)"
         )
+        # Covers the per-stage-run model lookups in the pairwise self-join
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_candidates_sr_model "
+            "ON eval_candidates(stage_run_id, model_id)"
+        )
 
-        # Human judgments table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS eval_judgments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                stage_run_id INTEGER NOT NULL,
-                evaluator_id TEXT DEFAULT 'default',
-                chosen_candidate_id INTEGER NOT NULL,
-                ranking TEXT,
-                scores TEXT,
-                tags TEXT,
-                comments TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (stage_run_id) REFERENCES eval_stage_runs(id),
-                FOREIGN KEY (chosen_candidate_id) REFERENCES eval_candidates(id)
-            )
-        """)
+        # Judgments. A stage run can be re-judged, so the latest-judgment
+        # lookup walks this index backwards instead of sorting; it also
+        # supersedes the stage_run_id-only index
+        cursor.execute("DROP INDEX IF EXISTS idx_judgments_stage_run")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_judgments_sr_created "
+            "ON eval_judgments(stage_run_id, created_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_judgments_chosen "
+            "ON eval_judgments(chosen_candidate_id)"
+        )
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_judgments_stage_run "
-            "ON eval_judgments(stage_run_id)"
+            "CREATE INDEX IF NOT EXISTS idx_tags_tag ON eval_judgment_tags(tag)"
         )
 
         self.conn.commit()
 
+    def _migrate_cascade_foreign_keys(self) -> None:
+        """Rebuild tables created before their foreign keys cascaded on delete.
+
+        SQLite can't alter a foreign key in place, so each outdated table is
+        copied into a fresh one with the current definition (the documented
+        create/copy/drop/rename procedure). Indexes are recreated afterwards
+        by _create_tables.
+        """
+        outdated = [
+            name
+            for name in _TABLES
+            if any(
+                fk["on_delete"] != "CASCADE"
+                for fk in self.conn.execute(f"PRAGMA foreign_key_list({name})")
+            )
+        ]
+        if not outdated:
+            return
+
+        logger.info("Migrating %s to ON DELETE CASCADE", ", ".join(outdated))
+        self.conn.commit()
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            for name in outdated:
+                columns = ", ".join(
+                    row["name"] for row in self.conn.execute(f"PRAGMA table_info({name})")
+                )
+                self.conn.execute(f"CREATE TABLE {name}__new ({_TABLES[name]})")
+                self.conn.execute(
+                    f"INSERT INTO {name}__new ({columns}) SELECT {columns} FROM {name}"
+                )
+                self.conn.execute(f"DROP TABLE {name}")
+                self.conn.execute(f"ALTER TABLE {name}__new RENAME TO {name}")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.conn.execute("PRAGMA foreign_keys=ON")
+
     # --- Scenario Operations ---
 
     def create_scenario(self, scenario: Scenario) -> int:
@@ -131,21 +484,23 @@ class EvalDatabase:
         Returns:
             Database ID of the created scenario
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO eval_scenarios (scenario_id, user_profile, job_posting, metadata)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                scenario.scenario_id,
-                scenario.user_profile,
-                scenario.job_posting,
-                json.dumps(scenario.metadata) if scenario.metadata else None,
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            row = self._insert(
+                """
+                INSERT INTO eval_scenarios (scenario_id, user_profile, job_posting, metadata)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    scenario.scenario_id,
+                    scenario.user_profile,
+                    scenario.job_posting,
+                    _json_dumps(scenario.metadata) if scenario.metadata else None,
+                ),
+            )
+            self._commit()
+        if row["created_at"]:
+            scenario.created_at = datetime.fromisoformat(row["created_at"])
+        return row["id"]
 
     def get_scenario(self, scenario_id: str) -> Optional[Scenario]:
         """Get scenario by ID.
@@ -156,23 +511,24 @@ class EvalDatabase:
         Returns:
             Scenario object or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM eval_scenarios WHERE scenario_id = ?",
-            (scenario_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        return Scenario(
-            id=row["id"],
-            scenario_id=row["scenario_id"],
-            user_profile=row["user_profile"],
-            job_posting=row["job_posting"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {_SCENARIO_COLUMNS} FROM eval_scenarios WHERE scenario_id = ?",
+                (scenario_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            return Scenario(
+                id=row["id"],
+                scenario_id=row["scenario_id"],
+                user_profile=row["user_profile"],
+                job_posting=row["job_posting"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                metadata=row["metadata"] or {},
+            )
 
     def list_scenarios(self, limit: int = 100) -> List[Scenario]:
         """List all scenarios.
@@ -183,26 +539,30 @@ class EvalDatabase:
         Returns:
             List of Scenario objects
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM eval_scenarios
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        rows = cursor.fetchall()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                f"""
+                SELECT {_SCENARIO_COLUMNS} FROM eval_scenarios
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = cursor.fetchall()
+        # Bind per-row callables to locals once for the comprehension
+        fromiso = datetime.fromisoformat
         return [
             Scenario(
-                id=row["id"],
-                scenario_id=row["scenario_id"],
-                user_profile=row["user_profile"],
-                job_posting=row["job_posting"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+                id=id_,
+                scenario_id=scenario_id,
+                user_profile=user_profile,
+                job_posting=job_posting,
+                created_at=fromiso(created_at),
+                metadata=metadata or {},
             )
-            for row in rows
+            for id_, scenario_id, user_profile, job_posting, created_at, metadata in rows
         ]
 
     # --- Stage Run Operations ---
@@ -223,16 +583,16 @@ class EvalDatabase:
         Returns:
             Database ID of the created stage run
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO eval_stage_runs (scenario_id, stage_id, context)
-            VALUES (?, ?, ?)
-            """,
-            (scenario_id, stage_id, json.dumps(context)),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            row = self._insert(
+                """
+                INSERT INTO eval_stage_runs (scenario_id, stage_id, context)
+                VALUES (?, ?, ?)
+                """,
+                (scenario_id, stage_id, _json_dumps(context)),
+            )
+            self._commit()
+        return row["id"]
 
     def get_stage_run(self, stage_run_id: int) -> Optional[StageEval]:
         """Get stage run by ID.
@@ -243,25 +603,26 @@ class EvalDatabase:
         Returns:
             StageEval object or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM eval_stage_runs WHERE id = ?",
-            (stage_run_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        candidates = self.get_candidates_for_stage_run(stage_run_id)
-
-        return StageEval(
-            id=row["id"],
-            scenario_id=row["scenario_id"],
-            stage_id=row["stage_id"],
-            context=json.loads(row["context"]) if row["context"] else {},
-            candidates=candidates,
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {_STAGE_RUN_COLUMNS} FROM eval_stage_runs sr WHERE sr.id = ?",
+                (stage_run_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            candidates = self.get_candidates_for_stage_run(stage_run_id)
+
+            return StageEval(
+                id=row["id"],
+                scenario_id=row["scenario_id"],
+                stage_id=row["stage_id"],
+                context=row["context"] or {},
+                candidates=candidates,
+                created_at=datetime.fromisoformat(row["created_at"]),
+            )
 
     def get_stage_runs_for_scenario(
         self, scenario_id: str, stage_id: Optional[str] = None
@@ -275,38 +636,30 @@ class EvalDatabase:
         Returns:
             List of StageEval objects
         """
-        cursor = self.conn.cursor()
-        if stage_id:
-            cursor.execute(
-                """
-                SELECT * FROM eval_stage_runs
-                WHERE scenario_id = ? AND stage_id = ?
-                ORDER BY created_at DESC
-                """,
-                (scenario_id, stage_id),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT * FROM eval_stage_runs
-                WHERE scenario_id = ?
-                ORDER BY created_at DESC
-                """,
-                (scenario_id,),
-            )
-
-        rows = cursor.fetchall()
-        return [
-            StageEval(
-                id=row["id"],
-                scenario_id=row["scenario_id"],
-                stage_id=row["stage_id"],
-                context=json.loads(row["context"]) if row["context"] else {},
-                candidates=self.get_candidates_for_stage_run(row["id"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
-            for row in rows
-        ]
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if stage_id:
+                cursor.execute(
+                    f"""
+                    SELECT {_STAGE_RUN_COLUMNS} FROM eval_stage_runs sr
+                    WHERE sr.scenario_id = ? AND sr.stage_id = ?
+                    ORDER BY sr.created_at DESC
+                    """,
+                    (scenario_id, stage_id),
+                )
+            else:
+                cursor.execute(
+                    f"""
+                    SELECT {_STAGE_RUN_COLUMNS} FROM eval_stage_runs sr
+                    WHERE sr.scenario_id = ?
+                    ORDER BY sr.created_at DESC
+                    """,
+                    (scenario_id,),
+                )
+
+            rows = cursor.fetchall()
+        return self._build_stage_runs(rows)
 
     def get_pending_stage_runs(self, limit: int = 50) -> List[StageEval]:
         """Get stage runs that haven't been judged yet.
@@ -317,28 +670,36 @@ class EvalDatabase:
         Returns:
             List of StageEval objects without judgments
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT sr.* FROM eval_stage_runs sr
-            LEFT JOIN eval_judgments j ON sr.id = j.stage_run_id
-            WHERE j.id IS NULL
-            ORDER BY sr.created_at ASC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        rows = cursor.fetchall()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                f"""
+                SELECT {_STAGE_RUN_COLUMNS} FROM eval_stage_runs sr
+                LEFT JOIN eval_judgments j ON sr.id = j.stage_run_id
+                WHERE j.id IS NULL
+                ORDER BY sr.created_at ASC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = cursor.fetchall()
+        return self._build_stage_runs(rows)
+
+    def _build_stage_runs(self, rows: List[tuple]) -> List[StageEval]:
+        """Build StageEval objects, with candidates, from _STAGE_RUN_COLUMNS tuples."""
+        fromiso = datetime.fromisoformat
+        candidates = self._get_candidates_bulk([row[0] for row in rows])
         return [
             StageEval(
-                id=row["id"],
-                scenario_id=row["scenario_id"],
-                stage_id=row["stage_id"],
-                context=json.loads(row["context"]) if row["context"] else {},
-                candidates=self.get_candidates_for_stage_run(row["id"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
+                id=id_,
+                scenario_id=scenario_id,
+                stage_id=stage_id,
+                context=context or {},
+                candidates=candidates.get(id_, []),
+                created_at=fromiso(created_at),
             )
-            for row in rows
+            for id_, scenario_id, stage_id, created_at, context in rows
         ]
 
     # --- Candidate Operations ---
@@ -357,24 +718,82 @@ class EvalDatabase:
         Returns:
             Database ID of the created candidate
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO eval_candidates
-            (stage_run_id, candidate_label, model_id, output_text, latency_ms, token_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                stage_run_id,
-                candidate.candidate_label,
-                candidate.model_id,
-                candidate.output_text,
-                candidate.latency_ms,
-                candidate.token_count,
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            row = self._insert(
+                _INSERT_CANDIDATES + "(?, ?, ?, ?, ?, ?)",
+                (
+                    stage_run_id,
+                    candidate.candidate_label,
+                    candidate.model_id,
+                    candidate.output_text,
+                    candidate.latency_ms,
+                    candidate.token_count,
+                ),
+            )
+            self._commit()
+        if row["created_at"]:
+            candidate.created_at = datetime.fromisoformat(row["created_at"])
+        return row["id"]
+
+    def save_candidates(
+        self,
+        stage_run_id: int,
+        candidates: List[CandidateOutput],
+    ) -> List[int]:
+        """Save several candidate outputs in one transaction.
+
+        Args:
+            stage_run_id: Parent stage run ID
+            candidates: CandidateOutput objects to persist, in label order
+
+        Returns:
+            Database IDs of the created candidates, in input order
+        """
+        if not candidates:
+            return []
+
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            params = [
+                (
+                    stage_run_id,
+                    c.candidate_label,
+                    c.model_id,
+                    c.output_text,
+                    c.latency_ms,
+                    c.token_count,
+                )
+                for c in candidates
+            ]
+            if _HAS_RETURNING:
+                # One multi-row INSERT per chunk; RETURNING order is unspecified
+                # but AUTOINCREMENT ids ascend in insertion order
+                rows_per_chunk = _MAX_IN_PARAMS // 6
+                ids = []
+                for start in range(0, len(params), rows_per_chunk):
+                    chunk = params[start:start + rows_per_chunk]
+                    cursor.execute(
+                        _INSERT_CANDIDATES
+                        + ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                        + " RETURNING id",
+                        [value for row in chunk for value in row],
+                    )
+                    ids.extend(sorted(row["id"] for row in cursor.fetchall()))
+            else:
+                cursor.executemany(_INSERT_CANDIDATES + "(?, ?, ?, ?, ?, ?)", params)
+                # Rows inserted in one transaction get consecutive rowids
+                cursor.execute(
+                    """
+                    SELECT id FROM eval_candidates
+                    WHERE stage_run_id = ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                    """,
+                    (stage_run_id, len(candidates)),
+                )
+                ids = [row["id"] for row in reversed(cursor.fetchall())]
+            self._commit()
+            return ids
 
     def get_candidates_for_stage_run(
         self, stage_run_id: int
@@ -387,29 +806,59 @@ class EvalDatabase:
         Returns:
             List of CandidateOutput objects
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM eval_candidates
-            WHERE stage_run_id = ?
-            ORDER BY candidate_label
-            """,
-            (stage_run_id,),
-        )
-        rows = cursor.fetchall()
-        return [
-            CandidateOutput(
-                id=row["id"],
-                stage_run_id=row["stage_run_id"],
-                candidate_label=row["candidate_label"],
-                model_id=row["model_id"],
-                output_text=row["output_text"],
-                latency_ms=row["latency_ms"],
-                token_count=row["token_count"],
-                created_at=datetime.fromisoformat(row["created_at"]),
+        return self._get_candidates_bulk([stage_run_id]).get(stage_run_id, [])
+
+    def _get_candidates_bulk(
+        self, stage_run_ids: List[int]
+    ) -> Dict[int, List[CandidateOutput]]:
+        """Get candidates for many stage runs with one query.
+
+        Args:
+            stage_run_ids: Parent stage run IDs
+
+        Returns:
+            Dict mapping stage run ID to its candidates, ordered by label
+            (candidates are saved in label order, so by id; plain text order
+            would put C27 between C and D)
+        """
+        grouped: Dict[int, List[CandidateOutput]] = {}
+        if not stage_run_ids:
+            return grouped
+
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                f"""
+                SELECT {_CANDIDATE_COLUMNS} FROM eval_candidates
+                WHERE stage_run_id {_IN_IDS}
+                ORDER BY stage_run_id, id
+                """,
+                (_json_dumps(stage_run_ids),),
             )
-            for row in rows
-        ]
+            rows = cursor.fetchall()
+
+        fromiso = datetime.fromisoformat
+        for (
+            id_, stage_run_id, candidate_label, model_id, output_text,
+            latency_ms, token_count, created_at,
+        ) in rows:
+            group = grouped.get(stage_run_id)
+            if group is None:
+                group = grouped[stage_run_id] = []
+            group.append(
+                CandidateOutput(
+                    id=id_,
+                    stage_run_id=stage_run_id,
+                    candidate_label=candidate_label,
+                    model_id=model_id,
+                    output_text=output_text,
+                    latency_ms=latency_ms,
+                    token_count=token_count,
+                    created_at=fromiso(created_at),
+                )
+            )
+        return grouped
 
     def get_candidate(self, candidate_id: int) -> Optional[CandidateOutput]:
         """Get candidate by ID.
@@ -420,25 +869,26 @@ class EvalDatabase:
         Returns:
             CandidateOutput object or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM eval_candidates WHERE id = ?",
-            (candidate_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        return CandidateOutput(
-            id=row["id"],
-            stage_run_id=row["stage_run_id"],
-            candidate_label=row["candidate_label"],
-            model_id=row["model_id"],
-            output_text=row["output_text"],
-            latency_ms=row["latency_ms"],
-            token_count=row["token_count"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM eval_candidates WHERE id = ?",
+                (candidate_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            return CandidateOutput(
+                id=row["id"],
+                stage_run_id=row["stage_run_id"],
+                candidate_label=row["candidate_label"],
+                model_id=row["model_id"],
+                output_text=row["output_text"],
+                latency_ms=row["latency_ms"],
+                token_count=row["token_count"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+            )
 
     # --- Judgment Operations ---
 
@@ -451,30 +901,78 @@ class EvalDatabase:
         Returns:
             Database ID of the created judgment
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO eval_judgments
-            (stage_run_id, evaluator_id, chosen_candidate_id, ranking, scores, tags, comments)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                judgment.stage_run_id,
-                judgment.evaluator_id,
-                judgment.chosen_candidate_id,
-                json.dumps(judgment.ranking) if judgment.ranking else None,
-                json.dumps(judgment.scores) if judgment.scores else None,
-                json.dumps(judgment.tags) if judgment.tags else None,
-                judgment.comments,
-            ),
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        with self._write_lock:
+            row = self._insert(
+                _INSERT_JUDGMENTS + "(?, ?, ?, ?, ?, ?, ?)", _judgment_params(judgment)
+            )
+            if judgment.tags:
+                self.conn.executemany(
+                    _INSERT_JUDGMENT_TAGS, [(row["id"], tag) for tag in judgment.tags]
+                )
+            self._commit()
+        if row["created_at"]:
+            judgment.created_at = datetime.fromisoformat(row["created_at"])
+        return row["id"]
+
+    def save_judgments(self, judgments: List[Judgment]) -> List[int]:
+        """Save several human judgments in one transaction.
+
+        Args:
+            judgments: Judgment objects to persist
+
+        Returns:
+            Database IDs of the created judgments, in input order
+        """
+        if not judgments:
+            return []
+
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            params = [_judgment_params(j) for j in judgments]
+            if _HAS_RETURNING:
+                # One multi-row INSERT per chunk; RETURNING order is unspecified
+                # but AUTOINCREMENT ids ascend in insertion order
+                rows_per_chunk = _MAX_IN_PARAMS // 7
+                rows = []
+                for start in range(0, len(params), rows_per_chunk):
+                    chunk = params[start:start + rows_per_chunk]
+                    cursor.execute(
+                        _INSERT_JUDGMENTS
+                        + ", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+                        + _RETURNING,
+                        [value for row in chunk for value in row],
+                    )
+                    rows.extend(sorted(cursor.fetchall(), key=itemgetter("id")))
+            else:
+                cursor.executemany(_INSERT_JUDGMENTS + "(?, ?, ?, ?, ?, ?, ?)", params)
+                # Rows inserted in one transaction get consecutive rowids, and
+                # the write lock keeps other inserts out
+                cursor.execute(
+                    "SELECT id, created_at FROM eval_judgments ORDER BY id DESC LIMIT ?",
+                    (len(judgments),),
+                )
+                rows = list(reversed(cursor.fetchall()))
+
+            ids = [row["id"] for row in rows]
+            cursor.executemany(
+                _INSERT_JUDGMENT_TAGS,
+                [
+                    (judgment_id, tag)
+                    for judgment_id, judgment in zip(ids, judgments)
+                    if judgment.tags
+                    for tag in judgment.tags
+                ],
+            )
+            self._commit()
+
+        for judgment, row in zip(judgments, rows):
+            judgment.created_at = datetime.fromisoformat(row["created_at"])
+        return ids
 
     def get_judgment_for_stage_run(
         self, stage_run_id: int
     ) -> Optional[Judgment]:
-        """Get judgment for a stage run.
+        """Get the most recent judgment for a stage run.
 
         Args:
             stage_run_id: Parent stage run ID
@@ -482,38 +980,80 @@ class EvalDatabase:
         Returns:
             Judgment object or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM eval_judgments
-            WHERE stage_run_id = ?
-            ORDER BY created_at DESC
-            LIMIT 1
-            """,
-            (stage_run_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        return Judgment(
-            id=row["id"],
-            stage_run_id=row["stage_run_id"],
-            evaluator_id=row["evaluator_id"],
-            chosen_candidate_id=row["chosen_candidate_id"],
-            ranking=json.loads(row["ranking"]) if row["ranking"] else None,
-            scores=json.loads(row["scores"]) if row["scores"] else None,
-            tags=json.loads(row["tags"]) if row["tags"] else None,
-            comments=row["comments"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {_JUDGMENT_COLUMNS} FROM eval_judgments
+                WHERE stage_run_id = ?
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+                """,
+                (stage_run_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            return Judgment(
+                id=row["id"],
+                stage_run_id=row["stage_run_id"],
+                evaluator_id=row["evaluator_id"],
+                chosen_candidate_id=row["chosen_candidate_id"],
+                ranking=row["ranking"],
+                scores=row["scores"],
+                tags=row["tags"],
+                comments=row["comments"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+            )
+
+    def get_judgments_by_tag(
+        self, tag: str, stage_id: Optional[str] = None
+    ) -> List[Judgment]:
+        """Get judgments carrying a tag, newest first.
+
+        Args:
+            tag: Tag to filter by
+            stage_id: Optional filter by stage
+
+        Returns:
+            List of Judgment objects
+        """
+        sql = f"""
+            SELECT {_JUDGMENT_COLUMNS} FROM eval_judgments
+            WHERE id IN (SELECT judgment_id FROM eval_judgment_tags WHERE tag = ?)
+        """
+        params: List[Any] = [tag]
+        if stage_id:
+            sql += " AND stage_run_id IN (SELECT id FROM eval_stage_runs WHERE stage_id = ?)"
+            params.append(stage_id)
+        sql += " ORDER BY created_at DESC, id DESC"
+
+        with self._read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        fromiso = datetime.fromisoformat
+        return [
+            Judgment(
+                id=row["id"],
+                stage_run_id=row["stage_run_id"],
+                evaluator_id=row["evaluator_id"],
+                chosen_candidate_id=row["chosen_candidate_id"],
+                ranking=row["ranking"],
+                scores=row["scores"],
+                tags=row["tags"],
+                comments=row["comments"],
+                created_at=fromiso(row["created_at"]),
+            )
+            for row in rows
+        ]
 
     # --- Analysis Queries ---
 
     def get_judgments_for_stage(self, stage_id: str) -> List[Dict[str, Any]]:
         """Get all judgments for a stage with model information.
 
-        Optimized to avoid N+1 queries by batch-fetching all participant models.
+        Participant models are aggregated in the same query, so the whole
+        result comes back in one round trip.
 
         Args:
             stage_id: Stage to get judgments for
@@ -521,62 +1061,48 @@ class EvalDatabase:
         Returns:
             List of judgment records with winner model info
         """
-        cursor = self.conn.cursor()
-
-        # Step 1: Get all judgments with winner info
-        cursor.execute(
-            """
-            SELECT 
-                j.*,
-                c.model_id as winner_model_id,
-                sr.scenario_id
-            FROM eval_judgments j
-            JOIN eval_stage_runs sr ON j.stage_run_id = sr.id
-            JOIN eval_candidates c ON j.chosen_candidate_id = c.id
-            WHERE sr.stage_id = ?
-            """,
-            (stage_id,),
-        )
-        rows = cursor.fetchall()
-
-        if not rows:
-            return []
-
-        # Step 2: Batch fetch all participant models for relevant stage_runs
-        stage_run_ids = list(set(row["stage_run_id"] for row in rows))
-        placeholders = ",".join("?" * len(stage_run_ids))
-        cursor.execute(
-            f"""
-            SELECT stage_run_id, model_id
-            FROM eval_candidates
-            WHERE stage_run_id IN ({placeholders})
-            """,
-            stage_run_ids,
-        )
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT 
+                    j.id,
+                    j.stage_run_id,
+                    j.scores AS "scores [json]",
+                    j.tags AS "tags [json]",
+                    c.model_id as winner_model_id,
+                    sr.scenario_id,
+                    (
+                        SELECT GROUP_CONCAT(model_id, '{_MODEL_SEP}')
+                        FROM (
+                            SELECT DISTINCT model_id FROM eval_candidates
+                            WHERE stage_run_id = sr.id
+                            ORDER BY id
+                        )
+                    ) as all_model_ids
+                FROM eval_judgments j
+                JOIN eval_stage_runs sr ON j.stage_run_id = sr.id
+                JOIN eval_candidates c ON j.chosen_candidate_id = c.id
+                WHERE sr.stage_id = ?
+                """,
+                (stage_id,),
+            )
+            rows = cursor.fetchall()
 
-        # Build stage_run_id -> [model_ids] mapping
-        stage_run_models: Dict[int, List[str]] = {}
-        for r in cursor.fetchall():
-            sr_id = r["stage_run_id"]
-            if sr_id not in stage_run_models:
-                stage_run_models[sr_id] = []
-            if r["model_id"] not in stage_run_models[sr_id]:
-                stage_run_models[sr_id].append(r["model_id"])
-
-        # Step 3: Build results using the pre-fetched mapping
-        results = []
-        for row in rows:
-            results.append({
+        return [
+            {
                 "id": row["id"],
                 "stage_run_id": row["stage_run_id"],
                 "scenario_id": row["scenario_id"],
                 "winner_model_id": row["winner_model_id"],
-                "all_model_ids": stage_run_models.get(row["stage_run_id"], []),
-                "scores": json.loads(row["scores"]) if row["scores"] else None,
-                "tags": json.loads(row["tags"]) if row["tags"] else None,
-            })
-
-        return results
+                "all_model_ids": (
+                    row["all_model_ids"].split(_MODEL_SEP) if row["all_model_ids"] else []
+                ),
+                "scores": row["scores"],
+                "tags": row["tags"],
+            }
+            for row in rows
+        ]
 
     def get_head_to_head(
         self, stage_id: str, model_a: str, model_b: str
@@ -591,32 +1117,34 @@ class EvalDatabase:
         Returns:
             List of comparison records
         """
-        cursor = self.conn.cursor()
+        with self._read() as conn:
+            cursor = conn.cursor()
         
-        # Find stage runs where both models participated
-        cursor.execute(
-            """
-            SELECT sr.id as stage_run_id, j.chosen_candidate_id, c.model_id as winner
-            FROM eval_stage_runs sr
-            JOIN eval_judgments j ON sr.id = j.stage_run_id
-            JOIN eval_candidates c ON j.chosen_candidate_id = c.id
-            WHERE sr.stage_id = ?
-            AND sr.id IN (
-                SELECT stage_run_id FROM eval_candidates WHERE model_id = ?
-            )
-            AND sr.id IN (
-                SELECT stage_run_id FROM eval_candidates WHERE model_id = ?
+            # Find stage runs where both models participated
+            cursor.execute(
+                """
+                SELECT sr.id as stage_run_id, j.chosen_candidate_id, c.model_id as winner
+                FROM eval_stage_runs sr
+                JOIN eval_judgments j ON sr.id = j.stage_run_id
+                JOIN eval_candidates c ON j.chosen_candidate_id = c.id
+                WHERE sr.stage_id = ?
+                AND sr.id IN (
+                    SELECT stage_run_id FROM eval_candidates WHERE model_id = ?
+                )
+                AND sr.id IN (
+                    SELECT stage_run_id FROM eval_candidates WHERE model_id = ?
+                )
+                """,
+                (stage_id, model_a, model_b),
             )
-            """,
-            (stage_id, model_a, model_b),
-        )
         
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_all_pairwise(self, stage_id: str) -> List[Dict[str, Any]]:
         """Get all pairwise comparisons for Bradley-Terry analysis.
 
-        Optimized to avoid N+1 queries by batch-fetching all candidates.
+        Each judgment is joined to every other model in its stage run, so
+        the pairs are produced by SQLite directly.
 
         Args:
             stage_id: Stage to analyze
@@ -624,61 +1152,82 @@ class EvalDatabase:
         Returns:
             List of {winner, loser} pairs
         """
-        cursor = self.conn.cursor()
+        return [
+            {"winner": winner, "loser": loser}
+            for winner, loser in self.iter_pairwise(stage_id)
+        ]
 
-        # Step 1: Get all judgments with winner info
-        cursor.execute(
-            """
-            SELECT 
-                sr.id as stage_run_id,
-                c.model_id as winner
-            FROM eval_stage_runs sr
-            JOIN eval_judgments j ON sr.id = j.stage_run_id
-            JOIN eval_candidates c ON j.chosen_candidate_id = c.id
-            WHERE sr.stage_id = ?
-            """,
-            (stage_id,),
-        )
-        judgment_rows = cursor.fetchall()
+    def iter_pairwise(self, stage_id: str) -> Iterator[Tuple[str, str]]:
+        """Stream all pairwise comparisons as (winner, loser) tuples.
 
-        if not judgment_rows:
-            return []
+        Same pairs and order as get_all_pairwise, read straight off the
+        cursor so no result list is held in memory. The read connection is
+        checked out until the iterator is exhausted or closed, so consume
+        it promptly.
 
-        # Step 2: Batch fetch all candidates for relevant stage_runs
-        stage_run_ids = list(set(row["stage_run_id"] for row in judgment_rows))
-        placeholders = ",".join("?" * len(stage_run_ids))
-        cursor.execute(
-            f"""
-            SELECT DISTINCT stage_run_id, model_id
-            FROM eval_candidates
-            WHERE stage_run_id IN ({placeholders})
-            """,
-            stage_run_ids,
-        )
+        Args:
+            stage_id: Stage to analyze
 
-        # Build stage_run_id -> [model_ids] mapping
-        stage_run_models: Dict[int, List[str]] = {}
-        for r in cursor.fetchall():
-            sr_id = r["stage_run_id"]
-            if sr_id not in stage_run_models:
-                stage_run_models[sr_id] = []
-            stage_run_models[sr_id].append(r["model_id"])
-
-        # Step 3: Build winner/loser pairs using pre-fetched mapping
-        results = []
-        for row in judgment_rows:
-            winner = row["winner"]
-            sr_id = row["stage_run_id"]
-            all_models = stage_run_models.get(sr_id, [])
-
-            for model in all_models:
-                if model != winner:
-                    results.append({
-                        "winner": winner,
-                        "loser": model,
-                    })
-
-        return results
+        Yields:
+            (winner, loser) model id pairs
+        """
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                _PAIRWISE_CTE + "SELECT winner, loser FROM pairs ORDER BY judgment_id, loser",
+                (stage_id,),
+            )
+            yield from cursor
+
+    def get_all_pairwise_arrays(
+        self, stage_id: str
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Get all pairwise comparisons as model indices for vectorized analysis.
+
+        Same pairs as get_all_pairwise, with model ids factorized by SQLite
+        so no per-pair dict or string is built in Python.
+
+        Args:
+            stage_id: Stage to analyze
+
+        Returns:
+            (winners, losers, labels): int32 arrays of model indices, one entry
+            per pair, and the model id for each index (sorted)
+        """
+        with self._read() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            # Both statements read one snapshot so indices match the labels
+            # (an in-memory database's writer may already be in a transaction)
+            snapshot = not conn.in_transaction
+            if snapshot:
+                cursor.execute("BEGIN")
+            try:
+                cursor.execute(
+                    _PAIRWISE_CTE + "SELECT model_id FROM models ORDER BY idx",
+                    (stage_id,),
+                )
+                labels = [model_id for (model_id,) in cursor.fetchall()]
+                cursor.execute(
+                    _PAIRWISE_CTE
+                    + """
+                    SELECT mw.idx, ml.idx
+                    FROM pairs p
+                    JOIN models mw ON mw.model_id = p.winner
+                    JOIN models ml ON ml.model_id = p.loser
+                    ORDER BY p.judgment_id, ml.idx
+                    """,
+                    (stage_id,),
+                )
+                # Fill the array straight from the cursor rather than via a
+                # fetchall() list holding a tuple per pair
+                pairs = np.fromiter(cursor, dtype=np.dtype((np.int32, 2)))
+            finally:
+                if snapshot:
+                    cursor.execute("COMMIT")
+
+        return np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1]), labels
 
     def get_all_head_to_head_counts(
         self, stage_id: str
@@ -691,66 +1240,96 @@ class EvalDatabase:
         Returns:
             Dict mapping (model_a, model_b) tuple (sorted) to {model_a: wins, model_b: wins, total: n}
         """
-        cursor = self.conn.cursor()
+        with self._read() as conn:
+            cursor = conn.cursor()
 
-        # Get all stage runs with their winners for this stage
-        cursor.execute(
-            """
-            SELECT 
-                sr.id as stage_run_id,
-                c.model_id as winner
-            FROM eval_stage_runs sr
-            JOIN eval_judgments j ON sr.id = j.stage_run_id
-            JOIN eval_candidates c ON j.chosen_candidate_id = c.id
-            WHERE sr.stage_id = ?
-            """,
-            (stage_id,),
-        )
-        stage_winners = {row["stage_run_id"]: row["winner"] for row in cursor.fetchall()}
+            # Get all stage runs with their winners for this stage
+            cursor.execute(
+                """
+                SELECT 
+                    sr.id as stage_run_id,
+                    c.model_id as winner
+                FROM eval_stage_runs sr
+                JOIN eval_judgments j ON sr.id = j.stage_run_id
+                JOIN eval_candidates c ON j.chosen_candidate_id = c.id
+                WHERE sr.stage_id = ?
+                """,
+                (stage_id,),
+            )
+            stage_winners = {
+                row["stage_run_id"]: row["winner"] for row in cursor.fetchall()
+            }
 
-        if not stage_winners:
-            return {}
+            if not stage_winners:
+                return {}
 
-        # Get all candidates grouped by stage_run_id
-        stage_run_ids = list(stage_winners.keys())
-        placeholders = ",".join("?" * len(stage_run_ids))
-        cursor.execute(
-            f"""
-            SELECT stage_run_id, model_id
-            FROM eval_candidates
-            WHERE stage_run_id IN ({placeholders})
-            """,
-            stage_run_ids,
-        )
+            # Get all candidates grouped by stage_run_id
+            cursor.execute(
+                f"""
+                SELECT stage_run_id, model_id
+                FROM eval_candidates
+                WHERE stage_run_id {_IN_IDS}
+                """,
+                (_json_dumps(list(stage_winners)),),
+            )
 
-        # Build stage_run -> models mapping
-        stage_models: Dict[int, List[str]] = {}
-        for row in cursor.fetchall():
-            sr_id = row["stage_run_id"]
-            if sr_id not in stage_models:
-                stage_models[sr_id] = []
-            stage_models[sr_id].append(row["model_id"])
-
-        # Aggregate head-to-head counts
-        from collections import defaultdict
-        pair_counts: Dict[tuple, Dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
+            # Build stage_run -> models mapping
+            stage_models: Dict[int, List[str]] = {}
+            for sr_id, model_id in cursor.fetchall():
+                models = stage_models.get(sr_id)
+                if models is None:
+                    models = stage_models[sr_id] = []
+                models.append(model_id)
+
+            # Aggregate head-to-head counts in one pass over the stage runs.
+            # Sorting each run's models once makes every (m1, m2) with i < j
+            # already the canonical sorted pair key.
+            pair_counts: Dict[tuple, Dict[str, int]] = {}
+            for sr_id, winner in stage_winners.items():
+                models = sorted(stage_models.get(sr_id, ()))
+                for i, m1 in enumerate(models):
+                    for m2 in models[i + 1:]:
+                        counts = pair_counts.get((m1, m2))
+                        if counts is None:
+                            counts = pair_counts[(m1, m2)] = {"total": 0}
+                        counts["total"] += 1
+                        counts[winner] = counts.get(winner, 0) + 1
+
+            return pair_counts
+
+    def get_report_bundle(
+        self, stage_id: str, include_pairwise_arrays: bool = True
+    ) -> Dict[str, Any]:
+        """Get everything a stage report reads, in one round trip.
+
+        Runs the stats, judgments, head-to-head and (optionally) pairwise
+        queries on a single connection inside one read transaction, so the
+        parts are mutually consistent and share a warm page cache.
 
-        for sr_id, winner in stage_winners.items():
-            models = stage_models.get(sr_id, [])
-            if len(models) < 2:
-                continue
-            # For each pair in this stage run
-            for i, m1 in enumerate(models):
-                for m2 in models[i + 1:]:
-                    # Use sorted tuple as key for consistent ordering
-                    pair_key = tuple(sorted([m1, m2]))
-                    pair_counts[pair_key]["total"] += 1
-                    pair_counts[pair_key][winner] += 1
-
-        # Convert defaultdict to regular dict
-        return {k: dict(v) for k, v in pair_counts.items()}
+        Args:
+            stage_id: Stage to analyze
+            include_pairwise_arrays: Whether to fetch get_all_pairwise_arrays
+
+        Returns:
+            Dict with "stats", "judgments", "head_to_head_counts" and, if
+            requested, "pairwise_arrays", shaped as the individual getters
+        """
+        with self._read() as conn:
+            snapshot = not conn.in_transaction
+            if snapshot:
+                conn.execute("BEGIN")
+            try:
+                bundle = {
+                    "stats": self.get_model_stats(stage_id),
+                    "judgments": self.get_judgments_for_stage(stage_id),
+                    "head_to_head_counts": self.get_all_head_to_head_counts(stage_id),
+                }
+                if include_pairwise_arrays:
+                    bundle["pairwise_arrays"] = self.get_all_pairwise_arrays(stage_id)
+            finally:
+                if snapshot:
+                    conn.execute("COMMIT")
+        return bundle
 
     def get_model_stats(self, stage_id: str) -> Dict[str, Dict[str, int]]:
         """Get win/appearance counts per model.
@@ -761,42 +1340,33 @@ class EvalDatabase:
         Returns:
             Dict mapping model_id to {wins, appearances}
         """
-        cursor = self.conn.cursor()
-        
-        # Count appearances
-        cursor.execute(
-            """
-            SELECT c.model_id, COUNT(DISTINCT c.stage_run_id) as appearances
-            FROM eval_candidates c
-            JOIN eval_stage_runs sr ON c.stage_run_id = sr.id
-            WHERE sr.stage_id = ?
-            GROUP BY c.model_id
-            """,
-            (stage_id,),
-        )
-        stats = {row["model_id"]: {"appearances": row["appearances"], "wins": 0} 
-                 for row in cursor.fetchall()}
-        
-        # Count wins
-        cursor.execute(
-            """
-            SELECT c.model_id, COUNT(*) as wins
-            FROM eval_judgments j
-            JOIN eval_candidates c ON j.chosen_candidate_id = c.id
-            JOIN eval_stage_runs sr ON j.stage_run_id = sr.id
-            WHERE sr.stage_id = ?
-            GROUP BY c.model_id
-            """,
-            (stage_id,),
-        )
-        for row in cursor.fetchall():
-            if row["model_id"] in stats:
-                stats[row["model_id"]]["wins"] = row["wins"]
-        
-        return stats
+        with self._read() as conn:
+            cursor = conn.cursor()
+            # Appearances and wins in one grouped pass; the judgment join fans
+            # out rows, hence DISTINCT on appearances
+            cursor.execute(
+                """
+                SELECT
+                    c.model_id,
+                    COUNT(DISTINCT c.stage_run_id) as appearances,
+                    COALESCE(SUM(j.chosen_candidate_id = c.id), 0) as wins
+                FROM eval_candidates c
+                JOIN eval_stage_runs sr ON c.stage_run_id = sr.id
+                LEFT JOIN eval_judgments j ON j.stage_run_id = sr.id
+                WHERE sr.stage_id = ?
+                GROUP BY c.model_id
+                """,
+                (stage_id,),
+            )
+            rows = cursor.fetchall()
+
+        return {
+            row["model_id"]: {"appearances": row["appearances"], "wins": row["wins"]}
+            for row in rows
+        }
 
     def delete_stage_run(self, stage_run_id: int, commit: bool = True) -> bool:
-        """Delete a stage run and its candidates/judgments.
+        """Delete a stage run; its candidates/judgments cascade.
         
         Args:
             stage_run_id: ID of the stage run to delete
@@ -805,28 +1375,15 @@ class EvalDatabase:
         Returns:
             True if deleted, False if not found
         """
-        cursor = self.conn.cursor()
-        
-        # Check if exists
-        cursor.execute("SELECT id FROM eval_stage_runs WHERE id = ?", (stage_run_id,))
-        if not cursor.fetchone():
-            return False
-        
-        # Delete judgments first (foreign key)
-        cursor.execute("DELETE FROM eval_judgments WHERE stage_run_id = ?", (stage_run_id,))
-        
-        # Delete candidates
-        cursor.execute("DELETE FROM eval_candidates WHERE stage_run_id = ?", (stage_run_id,))
-        
-        # Delete stage run
-        cursor.execute("DELETE FROM eval_stage_runs WHERE id = ?", (stage_run_id,))
-        
-        if commit:
-            self.conn.commit()
-        return True
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM eval_stage_runs WHERE id = ?", (stage_run_id,))
+            if commit:
+                self._commit()
+            return cursor.rowcount > 0
 
     def delete_scenario(self, scenario_id: str) -> bool:
-        """Delete a scenario and all its stage runs.
+        """Delete a scenario; its stage runs and their children cascade.
         
         Args:
             scenario_id: ID of the scenario to delete
@@ -834,35 +1391,58 @@ class EvalDatabase:
         Returns:
             True if deleted, False if not found
         """
-        try:
-            cursor = self.conn.cursor()
-            
-            # Check if scenario exists
-            cursor.execute("SELECT id FROM eval_scenarios WHERE scenario_id = ?", (scenario_id,))
-            if not cursor.fetchone():
-                return False
-
-            # Get all stage runs for this scenario
-            cursor.execute(
-                "SELECT id FROM eval_stage_runs WHERE scenario_id = ?",
-                (scenario_id,),
-            )
-            stage_run_ids = [row["id"] for row in cursor.fetchall()]
-            
-            # Delete each stage run
-            for sr_id in stage_run_ids:
-                self.delete_stage_run(sr_id, commit=False)
-            
-            # Delete scenario
-            cursor.execute("DELETE FROM eval_scenarios WHERE scenario_id = ?", (scenario_id,))
-            self.conn.commit()
-            
-            return True
-            
-        except Exception:
-            self.conn.rollback()
-            raise
+        with self._write_lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "DELETE FROM eval_scenarios WHERE scenario_id = ?", (scenario_id,)
+                )
+                self._commit()
+                return cursor.rowcount > 0
+            except Exception:
+                if not self._txn_depth:
+                    self.conn.rollback()
+                raise
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close the writer and all reader connections."""
+        with _INSTANCES_LOCK:
+            if _INSTANCES.get(self.db_path) is self:
+                del _INSTANCES[self.db_path]
+        # Refresh planner statistics for tables whose shape has changed
+        self.conn.execute("PRAGMA optimize")
+        for conn in self._all_readers:
+            conn.close()
+        self._all_readers.clear()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
         self.conn.close()
+
+
+# Shared instances by database path, see get_db()
+_INSTANCES: Dict[str, EvalDatabase] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def get_db(db_path: str = "./data/evals.db") -> EvalDatabase:
+    """Get the process-wide EvalDatabase for a path, opening it on first use.
+
+    Reusing one instance keeps its connections and SQLite page cache warm
+    across requests/reruns instead of reopening the file each time.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Shared EvalDatabase (a fresh one for ":memory:", which can't be shared)
+    """
+    if db_path == ":memory:":
+        return EvalDatabase(db_path)
+
+    with _INSTANCES_LOCK:
+        db = _INSTANCES.get(db_path)
+        if db is None:
+            db = _INSTANCES[db_path] = EvalDatabase(db_path)
+        return db
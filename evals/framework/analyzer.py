@@ -6,8 +6,11 @@ and Bradley-Terry rankings from collected human judgments.
 
 import logging
 import math
-from collections import defaultdict
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import numpy as np
 
 from .schemas import (
     WinRateResult,
@@ -18,14 +21,414 @@ from db.eval_db import EvalDatabase
 
 logger = logging.getLogger(__name__)
 
-# Module-level scipy import (optimization #5)
+T = TypeVar("T")
+
+# Module-level scipy import (optimization #5). The special-function ufuncs
+# are used directly: scipy.stats distributions validate and broadcast their
+# arguments in Python on every call, which dominates for a single pair.
 try:
-    from scipy.stats import binomtest
+    from scipy.special import bdtr, bdtrc, betaincinv
     _HAS_SCIPY = True
 except ImportError:
-    binomtest = None
+    bdtr = bdtrc = betaincinv = None
     _HAS_SCIPY = False
 
+# Optional JIT for the Bradley-Terry sweep; NumPy row updates otherwise
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    njit = None
+    _HAS_NUMBA = False
+
+
+def _pair_key(model_a: str, model_b: str) -> Tuple[str, str]:
+    """Canonical (sorted) head-to-head key for a model pair."""
+    return (model_a, model_b) if model_a < model_b else (model_b, model_a)
+
+
+def _binomial_tests(
+    successes: np.ndarray,
+    trials: np.ndarray,
+    confidence_level: float = 0.95,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Two-sided binomial tests against p = 0.5, element-wise.
+
+    Matches scipy's binomtest(k, n, p=0.5).pvalue and its exact
+    (Clopper-Pearson) proportion_ci. Under p = 0.5 the PMF is symmetric,
+    so the two-sided tail is found directly instead of searching for the
+    opposite-side cutoff: O(1) per test for any n. Accepts scalars or
+    arrays; requires scipy and trials > 0.
+
+    Returns:
+        (p_values, ci_low, ci_high) arrays
+    """
+    k, n = successes, trials
+    # p = 0.5 is symmetric, so the two-sided p-value is twice the smaller tail
+    # (bdtr is the binomial CDF P(X <= k), bdtrc the survival P(X > k))
+    p_values = np.minimum(1.0, 2 * np.minimum(bdtr(k, n, 0.5), bdtrc(k - 1, n, 0.5)))
+    ci_low, ci_high = _clopper_pearson(k, n, confidence_level)
+    return p_values, ci_low, ci_high
+
+
+def _clopper_pearson(
+    successes: np.ndarray,
+    trials: np.ndarray,
+    confidence_level: float = 0.95,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact (Clopper-Pearson) binomial proportion CI, element-wise.
+
+    The bounds are Beta quantiles, Beta(k, n-k+1) at α/2 and Beta(k+1, n-k)
+    at 1-α/2, taken with the inverse regularized incomplete beta function.
+    """
+    k, n = successes, trials
+    alpha = 1 - confidence_level
+    ci_low = np.where(k > 0, betaincinv(np.maximum(k, 1), n - k + 1, alpha / 2), 0.0)
+    ci_high = np.where(k < n, betaincinv(k + 1, np.maximum(n - k, 1), 1 - alpha / 2), 1.0)
+    return ci_low, ci_high
+
+
+def _wilson_ci(
+    successes: np.ndarray,
+    trials: np.ndarray,
+    z: float = 1.96,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilson score interval for a binomial proportion, element-wise.
+
+    The no-scipy stand-in for _clopper_pearson; z = 1.96 gives a 95% CI.
+    Requires trials > 0.
+    """
+    n = np.asarray(trials, dtype=np.float64)
+    p_hat = successes / n
+    denominator = 1 + z**2 / n
+    center = (p_hat + z**2 / (2 * n)) / denominator
+    spread = z * np.sqrt((p_hat * (1 - p_hat) + z**2 / (4 * n)) / n) / denominator
+    return np.maximum(0.0, center - spread), np.minimum(1.0, center + spread)
+
+
+def _bt_sweep_numpy(
+    phi: np.ndarray,
+    rows: np.ndarray,
+    indptr: np.ndarray,
+    opponents: np.ndarray,
+    log_wins: np.ndarray,
+    log_losses: np.ndarray,
+    log_comparisons: np.ndarray,
+    log_total_wins: np.ndarray,
+) -> None:
+    """One Gauss-Seidel sweep of Newman's Bradley-Terry update, in place.
+
+    Works on log-strengths φ over the comparison graph in CSR form: model
+    m's opponents are opponents[indptr[m]:indptr[m + 1]], and the log_*
+    edge arrays hold log(wins), log(losses) and log(comparisons) against
+    each of them. Each row is one vector operation over its own edges.
+    """
+    logsumexp = np.logaddexp.reduce
+    bounds = indptr.tolist()
+    for m in rows.tolist():
+        edges = slice(bounds[m], bounds[m + 1])
+        phi_opp = phi[opponents[edges]]
+        log_pair_sum = np.logaddexp(phi[m], phi_opp)
+        # θ_m = Σ_j w_mj θ_j / (θ_m + θ_j)  /  Σ_j w_jm / (θ_m + θ_j)
+        den = logsumexp(log_losses[edges] - log_pair_sum)
+        if den > -np.inf:
+            phi[m] = logsumexp(log_wins[edges] + phi_opp - log_pair_sum) - den
+        else:
+            # Undefeated: no losses to divide by, so fall back to the
+            # MM/Zermelo update, which stays finite
+            phi[m] = log_total_wins[m] - logsumexp(log_comparisons[edges] - log_pair_sum)
+
+
+def _bt_sweep_loops(
+    phi: np.ndarray,
+    rows: np.ndarray,
+    indptr: np.ndarray,
+    opponents: np.ndarray,
+    log_wins: np.ndarray,
+    log_losses: np.ndarray,
+    log_comparisons: np.ndarray,
+    log_total_wins: np.ndarray,
+) -> None:
+    """Scalar-loop form of _bt_sweep_numpy, written for Numba to compile.
+
+    Fuses each row's three reductions into one pass with no temporaries.
+    """
+    for m in rows:
+        phi_m = phi[m]
+        num = den = mm = -np.inf
+        for e in range(indptr[m], indptr[m + 1]):
+            phi_j = phi[opponents[e]]
+            # log(θ_m + θ_j), then running log-sum-exps of the three terms
+            log_pair_sum = _logaddexp(phi_m, phi_j)
+            num = _logaddexp(num, log_wins[e] + phi_j - log_pair_sum)
+            den = _logaddexp(den, log_losses[e] - log_pair_sum)
+            mm = _logaddexp(mm, log_comparisons[e] - log_pair_sum)
+        if den > -np.inf:
+            phi[m] = num - den
+        else:
+            phi[m] = log_total_wins[m] - mm
+
+
+def _bt_fit_numpy(
+    phi: np.ndarray,
+    rows: np.ndarray,
+    indptr: np.ndarray,
+    opponents: np.ndarray,
+    log_wins: np.ndarray,
+    log_losses: np.ndarray,
+    log_comparisons: np.ndarray,
+    log_total_wins: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+) -> int:
+    """Iterate Gauss-Seidel sweeps on φ in place until convergence.
+
+    Only the models in rows (fitted models) are updated; the rest stay at
+    φ = -inf. After each sweep φ is re-centred to mean 0 over rows, and the
+    fit stops once no strength changes by more than tolerance relative to
+    the previous sweep.
+
+    Returns:
+        Number of sweeps taken, or 0 if max_iterations ran out first
+    """
+    # The updated models' log-strengths before and after each sweep, plus a
+    # scratch buffer for the change; all filled in place and swapped, so the
+    # loop itself allocates no arrays
+    old_phi = phi[rows]
+    new_phi = np.empty_like(old_phi)
+    change = np.empty_like(old_phi)
+    for iteration in range(max_iterations):
+        # One Gauss-Seidel sweep: each row uses the strengths already
+        # updated this sweep (the simultaneous update oscillates, e.g.
+        # between 1:1 and 81:1 for a 9:1 two-model record)
+        _bt_sweep_numpy(
+            phi, rows, indptr, opponents,
+            log_wins, log_losses, log_comparisons, log_total_wins,
+        )
+
+        # Normalize to prevent drift
+        np.take(phi, rows, out=new_phi)
+        new_phi -= new_phi.mean()
+        phi[rows] = new_phi
+
+        # Relative change in θ, so the stopping point doesn't depend on
+        # the strength scale (the standard BT criterion). expm1 is
+        # monotonic, so the L∞ norm of expm1(Δφ) comes from the extreme
+        # Δφ values: two reductions instead of two more array passes.
+        np.subtract(new_phi, old_phi, out=change)
+        if max(math.expm1(change.max()), -math.expm1(change.min())) < tolerance:
+            return iteration + 1
+        old_phi, new_phi = new_phi, old_phi
+    return 0
+
+
+def _bt_fit_loops(
+    phi: np.ndarray,
+    rows: np.ndarray,
+    indptr: np.ndarray,
+    opponents: np.ndarray,
+    log_wins: np.ndarray,
+    log_losses: np.ndarray,
+    log_comparisons: np.ndarray,
+    log_total_wins: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+) -> int:
+    """Scalar-loop form of _bt_fit_numpy, written for Numba to compile.
+
+    The whole fixed-point loop runs compiled, so no Python dispatch happens
+    between sweeps.
+    """
+    n_rows = rows.shape[0]
+    old_phi = np.empty(n_rows)
+    for iteration in range(max_iterations):
+        for r in range(n_rows):
+            old_phi[r] = phi[rows[r]]
+
+        _bt_sweep_loops(
+            phi, rows, indptr, opponents,
+            log_wins, log_losses, log_comparisons, log_total_wins,
+        )
+
+        mean = 0.0
+        for r in range(n_rows):
+            mean += phi[rows[r]]
+        mean /= n_rows
+
+        max_change = 0.0
+        for r in range(n_rows):
+            m = rows[r]
+            phi[m] -= mean
+            change = abs(math.expm1(phi[m] - old_phi[r]))
+            if change > max_change:
+                max_change = change
+        if max_change < tolerance:
+            return iteration + 1
+    return 0
+
+
+def _logaddexp(a: float, b: float) -> float:
+    """log(exp(a) + exp(b)) for scalars, exact at -inf."""
+    if a == -np.inf:
+        return b
+    if b == -np.inf:
+        return a
+    return max(a, b) + math.log1p(math.exp(-abs(a - b)))
+
+
+if _HAS_NUMBA:
+    # Gauss-Seidel rows depend on each other, so no parallel=True; no
+    # fastmath either, since the -inf log-counts must stay exact. cache=True
+    # keeps the compiled code on disk, so only the first process compiles.
+    _logaddexp = njit(cache=True)(_logaddexp)
+    _bt_sweep_loops = njit(cache=True)(_bt_sweep_loops)
+    _bt_fit = njit(cache=True)(_bt_fit_loops)
+else:
+    _bt_fit = _bt_fit_numpy
+
+
+def _top_classes(wins_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the models the Bradley-Terry MLE gives a positive strength.
+
+    Model i reaches j if a chain of wins leads from i to j. The MLE sends a
+    model's strength to 0, relative to the rest, whenever it is reached by a
+    model it cannot reach back, so only the top strongly connected classes
+    (those no outside model reaches) keep a positive strength. Each class
+    has a finite fit of its own: within it every model has a win and a loss.
+
+    Returns:
+        Tuple of (mask of models in a top class, class id per model, the
+        smallest model index in its class)
+    """
+    reach = wins_matrix > 0
+    # Transitive closure by repeated squaring: O(log M) matrix products
+    while True:
+        wider = reach | (reach.astype(np.float64) @ reach.astype(np.float64) > 0)
+        if np.array_equal(wider, reach):
+            break
+        reach = wider
+    top = ~(reach & ~reach.T).any(axis=0)
+    mutual = reach & reach.T
+    np.fill_diagonal(mutual, True)
+    return top, mutual.argmax(axis=1)
+
+
+def _graph_components(
+    n_nodes: int, edge_rows: np.ndarray, edge_cols: np.ndarray
+) -> Tuple[np.ndarray, int]:
+    """Label the connected components of an undirected graph.
+
+    Union-find with path halving over the edge list, O(edges·α(N)).
+    Components are numbered 0, 1, ... in order of their first node.
+
+    Returns:
+        Tuple of (component label per node, number of components)
+    """
+    parent = list(range(n_nodes))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for a, b in zip(edge_rows.tolist(), edge_cols.tolist()):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    # Roots are each component's smallest node, so numbering roots as they
+    # are first met orders components by first node
+    numbering: Dict[int, int] = {}
+    labels = [numbering.setdefault(find(node), len(numbering)) for node in range(n_nodes)]
+    return np.array(labels, dtype=np.intp), len(numbering)
+
+
+@dataclass(slots=True)
+class JudgmentColumns:
+    """A stage's judgments stored column-wise.
+
+    One list (or array) per field instead of one dict per judgment, so
+    aggregations walk the columns they need without per-row key lookups.
+    """
+    id: np.ndarray
+    stage_run_id: np.ndarray
+    scenario_id: List[str]
+    winner_model_id: List[str]
+    all_model_ids: List[List[str]]
+    scores: List[Dict[str, Any]]
+    tags: List[List[str]]
+
+    @classmethod
+    def from_records(cls, judgments: List[Dict[str, Any]]) -> "JudgmentColumns":
+        """Transpose get_judgments_for_stage records into columns."""
+        n = len(judgments)
+        return cls(
+            id=np.fromiter((j["id"] for j in judgments), dtype=np.int64, count=n),
+            stage_run_id=np.fromiter(
+                (j["stage_run_id"] for j in judgments), dtype=np.int64, count=n
+            ),
+            scenario_id=[j["scenario_id"] for j in judgments],
+            winner_model_id=[j["winner_model_id"] for j in judgments],
+            all_model_ids=[j["all_model_ids"] for j in judgments],
+            scores=[j["scores"] for j in judgments],
+            tags=[j["tags"] for j in judgments],
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rebuild the row-wise records (legacy form)."""
+        return [
+            {
+                "id": judgment_id,
+                "stage_run_id": stage_run_id,
+                "scenario_id": scenario_id,
+                "winner_model_id": winner,
+                "all_model_ids": all_model_ids,
+                "scores": scores,
+                "tags": tags,
+            }
+            for judgment_id, stage_run_id, scenario_id, winner, all_model_ids, scores, tags
+            in zip(
+                self.id.tolist(), self.stage_run_id.tolist(), self.scenario_id,
+                self.winner_model_id, self.all_model_ids, self.scores, self.tags,
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.winner_model_id)
+
+
+class PairwiseIndex:
+    """Symmetric lookup over upper-triangle pairwise results.
+
+    all_pairwise_comparisons returns each unordered pair once; get() serves
+    either orientation, mirroring the stored result when asked for (b, a)
+    instead of keeping both directions around.
+    """
+
+    __slots__ = ("results", "_by_pair")
+
+    def __init__(self, results: List[PairwiseResult]):
+        self.results = results
+        self._by_pair = {(r.model_a, r.model_b): r for r in results}
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get(self, model_a: str, model_b: str) -> Optional[PairwiseResult]:
+        """Result oriented as model_a vs model_b, or None if not compared."""
+        result = self._by_pair.get((model_a, model_b))
+        if result is not None:
+            return result
+        result = self._by_pair.get((model_b, model_a))
+        if result is None:
+            return None
+        return PairwiseResult(
+            model_a, model_b, result.stage_id, result.b_wins, result.a_wins,
+            result.total, 1 - result.p_a_preferred, result.p_value,
+            1 - result.ci_high, 1 - result.ci_low, result.significant,
+        )
+
 
 class EvalAnalyzer:
     """Analyzes evaluation results with statistical methods."""
@@ -38,9 +441,24 @@ class EvalAnalyzer:
         """
         self.db = db
         # Stage-level caches (optimization #1b, #1c)
-        self._judgments_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._judgments_cache: Dict[str, JudgmentColumns] = {}
         self._stats_cache: Dict[str, Dict[str, Dict[str, int]]] = {}
         self._head_to_head_cache: Dict[str, Dict[tuple, Dict[str, int]]] = {}
+        self._pairwise_cache: Dict[str, Tuple[np.ndarray, np.ndarray, List[str]]] = {}
+        self._summary_cache: Dict[
+            str, Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, int]]]
+        ] = {}
+        # Serialized report sections by (stage_id, include_bradley_terry,
+        # include_pairwise), so unchanged data isn't re-analyzed and
+        # re-serialized with to_dict() on every report
+        self._report_cache: Dict[Tuple[str, bool, bool], Dict[str, Any]] = {}
+        # Database version the caches were filled at; any write drops them
+        self._cache_version: Optional[tuple] = None
+        # One lock per stage so concurrent UI requests for a stage share a
+        # single fetch (reentrant: cached getters nest); _locks_mu guards the
+        # lock table and the version check
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_mu = threading.Lock()
 
     def clear_cache(self, stage_id: Optional[str] = None) -> None:
         """Clear cached data for a stage or all stages.
@@ -52,28 +470,116 @@ class EvalAnalyzer:
             self._judgments_cache.clear()
             self._stats_cache.clear()
             self._head_to_head_cache.clear()
+            self._pairwise_cache.clear()
+            self._summary_cache.clear()
+            self._report_cache.clear()
         else:
             self._judgments_cache.pop(stage_id, None)
             self._stats_cache.pop(stage_id, None)
             self._head_to_head_cache.pop(stage_id, None)
+            self._pairwise_cache.pop(stage_id, None)
+            self._summary_cache.pop(stage_id, None)
+            for key in [key for key in self._report_cache if key[0] == stage_id]:
+                del self._report_cache[key]
+
+    def _sync_cache(self) -> None:
+        """Drop cached stage data if the database changed since it was read."""
+        version = self.db.data_version()
+        with self._locks_mu:
+            if version != self._cache_version:
+                self.clear_cache()
+                self._cache_version = version
+
+    def _stage_lock(self, stage_id: str) -> threading.RLock:
+        """Get the lock serializing cache fills for a stage."""
+        with self._locks_mu:
+            lock = self._locks.get(stage_id)
+            if lock is None:
+                lock = self._locks[stage_id] = threading.RLock()
+            return lock
+
+    def _cached(
+        self, cache: Dict[Any, T], key: Any, stage_id: str, load: Callable[[], T]
+    ) -> T:
+        """Get cache[key], loading it at most once across threads.
+
+        The first caller for a stage loads while later ones wait on the stage
+        lock and then find the value cached (single flight). A value loaded
+        while a write invalidated the caches is returned but not stored.
+        """
+        self._sync_cache()
+        value = cache.get(key)
+        if value is None:
+            with self._stage_lock(stage_id):
+                value = cache.get(key)
+                if value is None:
+                    version = self._cache_version
+                    value = load()
+                    if version == self._cache_version:
+                        cache[key] = value
+        return value
+
+    def _get_judgments_columnar(self, stage_id: str) -> JudgmentColumns:
+        """Get judgments for a stage as columns with caching."""
+        return self._cached(
+            self._judgments_cache, stage_id, stage_id,
+            lambda: JudgmentColumns.from_records(self.db.get_judgments_for_stage(stage_id)),
+        )
 
     def _get_judgments(self, stage_id: str) -> List[Dict[str, Any]]:
-        """Get judgments for a stage with caching."""
-        if stage_id not in self._judgments_cache:
-            self._judgments_cache[stage_id] = self.db.get_judgments_for_stage(stage_id)
-        return self._judgments_cache[stage_id]
+        """Get judgments for a stage as records (adapter over the columns)."""
+        return self._get_judgments_columnar(stage_id).to_records()
 
     def _get_model_stats(self, stage_id: str) -> Dict[str, Dict[str, int]]:
         """Get model stats for a stage with caching."""
-        if stage_id not in self._stats_cache:
-            self._stats_cache[stage_id] = self.db.get_model_stats(stage_id)
-        return self._stats_cache[stage_id]
+        return self._cached(
+            self._stats_cache, stage_id, stage_id,
+            lambda: self.db.get_model_stats(stage_id),
+        )
 
     def _get_head_to_head_counts(self, stage_id: str) -> Dict[tuple, Dict[str, int]]:
         """Get all head-to-head counts for a stage with caching."""
-        if stage_id not in self._head_to_head_cache:
-            self._head_to_head_cache[stage_id] = self.db.get_all_head_to_head_counts(stage_id)
-        return self._head_to_head_cache[stage_id]
+        return self._cached(
+            self._head_to_head_cache, stage_id, stage_id,
+            lambda: self.db.get_all_head_to_head_counts(stage_id),
+        )
+
+    def _get_pairwise_arrays(
+        self, stage_id: str
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Get winner/loser model indices and model labels for a stage with caching."""
+        return self._cached(
+            self._pairwise_cache, stage_id, stage_id,
+            lambda: self.db.get_all_pairwise_arrays(stage_id),
+        )
+
+    def _load_report_data(self, stage_id: str, include_pairwise_arrays: bool) -> None:
+        """Fill the stage caches a report needs with one bundled DB read."""
+        self._sync_cache()
+        with self._stage_lock(stage_id):
+            missing = (
+                stage_id not in self._stats_cache
+                or stage_id not in self._judgments_cache
+                or stage_id not in self._head_to_head_cache
+                or (include_pairwise_arrays and stage_id not in self._pairwise_cache)
+            )
+            if not missing:
+                return
+            version = self._cache_version
+            bundle = self.db.get_report_bundle(stage_id, include_pairwise_arrays)
+            if version != self._cache_version:
+                return
+            self._fill_from_bundle(stage_id, bundle, include_pairwise_arrays)
+
+    def _fill_from_bundle(
+        self, stage_id: str, bundle: Dict[str, Any], include_pairwise_arrays: bool
+    ) -> None:
+        """Store a get_report_bundle result in the stage caches."""
+        self._stats_cache[stage_id] = bundle["stats"]
+        self._judgments_cache[stage_id] = JudgmentColumns.from_records(bundle["judgments"])
+        self._head_to_head_cache[stage_id] = bundle["head_to_head_counts"]
+        if include_pairwise_arrays:
+            self._pairwise_cache[stage_id] = bundle["pairwise_arrays"]
 
     def compute_win_rates(
         self,
@@ -94,30 +600,44 @@ class EvalAnalyzer:
         if stats is None:
             stats = self._get_model_stats(stage_id)
 
-        results = []
-        for model_id, counts in stats.items():
-            wins = counts["wins"]
-            appearances = counts["appearances"]
-            win_rate = wins / appearances if appearances > 0 else 0.0
-
-            results.append(WinRateResult(
-                model_id=model_id,
-                stage_id=stage_id,
-                wins=wins,
-                appearances=appearances,
-                win_rate=win_rate,
-            ))
+        # Rates and ordering as whole-array operations; result objects are
+        # only built once, already in sorted order
+        model_ids = list(stats)
+        n_models = len(model_ids)
+        wins = np.fromiter((c["wins"] for c in stats.values()), dtype=np.int64, count=n_models)
+        appearances = np.fromiter(
+            (c["appearances"] for c in stats.values()), dtype=np.int64, count=n_models
+        )
+        win_rates = np.divide(
+            wins, appearances, out=np.zeros(n_models), where=appearances > 0
+        )
 
-        # Sort by win rate descending
-        results.sort(key=lambda x: x.win_rate, reverse=True)
+        # Sort by win rate descending (stable, so ties keep stats order)
+        order = np.argsort(-win_rates, kind="stable")
 
-        # Deferred logging (optimization #4)
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(
+        # Back to Python scalars once per array rather than per element
+        wins_list, appearances_list, rates_list = (
+            wins.tolist(), appearances.tolist(), win_rates.tolist()
+        )
+        results = [
+            # Positional: one result per model, so skip keyword binding
+            WinRateResult(model_ids[i], stage_id, wins_list[i], appearances_list[i], rates_list[i])
+            for i in order.tolist()
+        ]
+
+        # Deferred logging (optimization #4). INFO gets a constant-size
+        # summary; the O(M) per-model list is only built at DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "Win rates for %s: %s",
                 stage_id,
                 [(r.model_id, f"{r.win_rate:.1%}") for r in results],
             )
+        elif results and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Win rates for %s: %d models, top %s (%.1f%%)",
+                stage_id, len(results), results[0].model_id, 100 * results[0].win_rate,
+            )
 
         return results
 
@@ -141,19 +661,14 @@ class EvalAnalyzer:
         Returns:
             PairwiseResult with preference probability and significance
         """
-        # Get counts from cache or pre-fetched data
-        if head_to_head_counts is not None:
-            pair_key = tuple(sorted([model_a, model_b]))
-            counts = head_to_head_counts.get(pair_key, {})
-            a_wins = counts.get(model_a, 0)
-            b_wins = counts.get(model_b, 0)
-            total = counts.get("total", 0)
-        else:
-            # Fallback to individual DB query for ad-hoc calls
-            head_to_head = self.db.get_head_to_head(stage_id, model_a, model_b)
-            a_wins = sum(1 for h in head_to_head if h["winner"] == model_a)
-            b_wins = sum(1 for h in head_to_head if h["winner"] == model_b)
-            total = len(head_to_head)
+        # Ad-hoc calls share the stage's cached counts, so comparing several
+        # pairs one by one still costs a single head-to-head query
+        if head_to_head_counts is None:
+            head_to_head_counts = self._get_head_to_head_counts(stage_id)
+        counts = head_to_head_counts.get(_pair_key(model_a, model_b), {})
+        a_wins = counts.get(model_a, 0)
+        b_wins = counts.get(model_b, 0)
+        total = counts.get("total", 0)
 
         if total == 0:
             return PairwiseResult(
@@ -178,12 +693,22 @@ class EvalAnalyzer:
                 model_a, model_b, stage_id, a_wins, b_wins, total, p_hat
             )
 
-        # Binomial test: H0 is p = 0.5
-        result = binomtest(a_wins, total, p=0.5, alternative="two-sided")
-        ci = result.proportion_ci(confidence_level=0.95)
+        # Binomial test: H0 is p = 0.5. A count of exactly total / 2 sits at
+        # the centre of the symmetric null, so its p-value is exactly 1 and
+        # only the CI needs scipy (total also counts runs a third model won,
+        # so a_wins == b_wins is not enough)
+        if 2 * a_wins == total:
+            p_value = 1.0
+            ci_low, ci_high = (
+                float(v) for v in _clopper_pearson(np.int64(a_wins), np.int64(total))
+            )
+        else:
+            p_value, ci_low, ci_high = (
+                float(v) for v in _binomial_tests(np.int64(a_wins), np.int64(total))
+            )
 
         # Significant if 95% CI doesn't include 0.5
-        significant = ci.low > 0.5 or ci.high < 0.5
+        significant = ci_low > 0.5 or ci_high < 0.5
 
         pairwise = PairwiseResult(
             model_a=model_a,
@@ -193,9 +718,9 @@ class EvalAnalyzer:
             b_wins=b_wins,
             total=total,
             p_a_preferred=p_hat,
-            p_value=result.pvalue,
-            ci_low=ci.low,
-            ci_high=ci.high,
+            p_value=p_value,
+            ci_low=ci_low,
+            ci_high=ci_high,
             significant=significant,
         )
 
@@ -203,7 +728,7 @@ class EvalAnalyzer:
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Pairwise %s vs %s: P(A>B)=%.2f, p=%.3f, CI=[%.2f, %.2f], sig=%s",
-                model_a, model_b, p_hat, result.pvalue, ci.low, ci.high, significant,
+                model_a, model_b, p_hat, p_value, ci_low, ci_high, significant,
             )
 
         return pairwise
@@ -219,14 +744,7 @@ class EvalAnalyzer:
         p_hat: float,
     ) -> PairwiseResult:
         """Compute pairwise result with Wilson score CI (no scipy)."""
-        # Wilson score interval for 95% CI
-        z = 1.96
-        denominator = 1 + z**2 / total
-        center = (p_hat + z**2 / (2 * total)) / denominator
-        spread = z * math.sqrt((p_hat * (1 - p_hat) + z**2 / (4 * total)) / total) / denominator
-
-        ci_low = max(0, center - spread)
-        ci_high = min(1, center + spread)
+        ci_low, ci_high = (float(v) for v in _wilson_ci(a_wins, total))
         significant = ci_low > 0.5 or ci_high < 0.5
 
         return PairwiseResult(
@@ -250,11 +768,10 @@ class EvalAnalyzer:
         model_b: str,
     ) -> PairwiseResult:
         """Approximate pairwise preference without scipy (legacy ad-hoc method)."""
-        head_to_head = self.db.get_head_to_head(stage_id, model_a, model_b)
-
-        a_wins = sum(1 for h in head_to_head if h["winner"] == model_a)
-        b_wins = sum(1 for h in head_to_head if h["winner"] == model_b)
-        total = len(head_to_head)
+        counts = self._get_head_to_head_counts(stage_id).get(_pair_key(model_a, model_b), {})
+        a_wins = counts.get(model_a, 0)
+        b_wins = counts.get(model_b, 0)
+        total = counts.get("total", 0)
 
         if total == 0:
             return PairwiseResult(
@@ -284,7 +801,8 @@ class EvalAnalyzer:
     ) -> List[PairwiseResult]:
         """Compute all pairwise comparisons for a stage.
 
-        Uses bulk head-to-head counts to avoid N^2 DB queries (optimization #1a).
+        Uses bulk head-to-head counts to avoid N^2 DB queries (optimization #1a)
+        and runs the binomial tests for all pairs as one vectorized batch.
 
         Args:
             stage_id: Stage to analyze
@@ -300,133 +818,285 @@ class EvalAnalyzer:
             head_to_head_counts = self._get_head_to_head_counts(stage_id)
 
         models = list(stats.keys())
+        pairs = [
+            (model_a, model_b)
+            for i, model_a in enumerate(models)
+            for model_b in models[i + 1:]
+        ]
+
+        # Gather the per-pair counts up front; the tests below then run as a
+        # single batch rather than one scipy call (or worker task) per pair
+        a_wins, b_wins, totals = [], [], []
+        for model_a, model_b in pairs:
+            counts = head_to_head_counts.get(_pair_key(model_a, model_b), {})
+            a_wins.append(counts.get(model_a, 0))
+            b_wins.append(counts.get(model_b, 0))
+            totals.append(counts.get("total", 0))
+
+        # All binomial tests in one vectorized pass over the compared pairs;
+        # without scipy, Wilson intervals (optimization #5) and no p-values
+        a_arr = np.array(a_wins, dtype=np.int64)
+        total_arr = np.array(totals, dtype=np.int64)
+        compared = total_arr > 0
+        p_values = np.ones(len(pairs))
+        ci_low = np.zeros(len(pairs))
+        ci_high = np.ones(len(pairs))
+        if compared.any():
+            if _HAS_SCIPY:
+                (
+                    p_values[compared], ci_low[compared], ci_high[compared]
+                ) = _binomial_tests(a_arr[compared], total_arr[compared])
+            else:
+                p_values[compared] = 0.0  # Not computed without scipy
+                ci_low[compared], ci_high[compared] = _wilson_ci(
+                    a_arr[compared], total_arr[compared]
+                )
 
         results = []
-        for i, model_a in enumerate(models):
-            for model_b in models[i + 1:]:
-                result = self.pairwise_preference(
-                    stage_id, model_a, model_b, head_to_head_counts
-                )
-                results.append(result)
+        for (model_a, model_b), a, b, total, p_value, low, high in zip(
+            pairs, a_wins, b_wins, totals,
+            p_values.tolist(), ci_low.tolist(), ci_high.tolist(),
+        ):
+            # Positional, in field order (O(M²) results); significant if
+            # the 95% CI doesn't include 0.5
+            results.append(PairwiseResult(
+                model_a, model_b, stage_id, a, b, total,
+                a / total if total else 0.5,
+                p_value, low, high, low > 0.5 or high < 0.5,
+            ))
 
         return results
 
+    def pairwise_index(
+        self,
+        stage_id: str,
+        stats: Optional[Dict[str, Dict[str, int]]] = None,
+        head_to_head_counts: Optional[Dict[tuple, Dict[str, int]]] = None,
+    ) -> PairwiseIndex:
+        """All pairwise comparisons for a stage, looked up in either order.
+
+        Args:
+            stage_id: Stage to analyze
+            stats: Pre-fetched model stats (optional)
+            head_to_head_counts: Pre-fetched head-to-head counts (optional)
+
+        Returns:
+            PairwiseIndex over the upper-triangle results
+        """
+        return PairwiseIndex(
+            self.all_pairwise_comparisons(
+                stage_id, stats=stats, head_to_head_counts=head_to_head_counts
+            )
+        )
+
     def bradley_terry_ranking(
         self,
         stage_id: str,
         max_iterations: int = 100,
         tolerance: float = 1e-6,
-        pairwise_data: Optional[List[Dict[str, Any]]] = None,
+        pairwise_data: Optional[Iterable[Dict[str, Any]]] = None,
     ) -> List[BradleyTerryResult]:
         """Fit Bradley-Terry model and rank models by strength.
 
         The Bradley-Terry model estimates latent strength parameters θ_m
         such that P(m > n) = exp(θ_m) / (exp(θ_m) + exp(θ_n)).
 
-        Uses adjacency maps and integer indices for O(models * unique_opponents)
-        per iteration instead of O(models * total_rows) (optimization #2).
+        Uses Newman's iteration, which reaches the same fixed point as the
+        classic MM/Zermelo update in far fewer sweeps; each model's update
+        is a vector operation over the opponents it met, read from a CSR
+        view of the win-count matrix:
+
+            θ_m ← Σ_n w_mn θ_n / (θ_m + θ_n)  /  Σ_n w_nm / (θ_m + θ_n)
+
+        See M. E. J. Newman, "Efficient computation of rankings from
+        pairwise comparisons", JMLR 24 (2023), arXiv:2207.00076.
 
         Args:
             stage_id: Stage to analyze
             max_iterations: Maximum iterations for convergence
             tolerance: Convergence tolerance
-            pairwise_data: Pre-fetched pairwise data (optional)
+            pairwise_data: Pre-fetched {winner, loser} pairs (optional); any
+                iterable, consumed in a single pass
 
         Returns:
             List of BradleyTerryResult sorted by strength descending
         """
         if pairwise_data is None:
-            pairwise_data = self.db.get_all_pairwise(stage_id)
-
-        if not pairwise_data:
+            winners, losers, models = self._get_pairwise_arrays(stage_id)
+        else:
+            # Factorize model ids into contiguous indices in one pass. Kept as
+            # a dict loop: np.unique on the string labels has to build a
+            # unicode array and sort it (~5x slower at 100k comparisons), and
+            # would reorder models away from first appearance.
+            model_to_idx: Dict[str, int] = {}
+            index = model_to_idx.setdefault
+            w_idx: List[int] = []
+            l_idx: List[int] = []
+            for d in pairwise_data:
+                w_idx.append(index(d["winner"], len(model_to_idx)))
+                l_idx.append(index(d["loser"], len(model_to_idx)))
+            winners = np.asarray(w_idx, dtype=np.intp)
+            losers = np.asarray(l_idx, dtype=np.intp)
+            models = list(model_to_idx)
+
+        if len(winners) == 0:
             logger.warning("No pairwise data for stage %s", stage_id)
             return []
 
-        # Get all models and create index mapping (optimization #2b)
-        models = list(set(
-            [d["winner"] for d in pairwise_data] +
-            [d["loser"] for d in pairwise_data]
-        ))
-
         if len(models) < 2:
             logger.warning("Need at least 2 models for Bradley-Terry")
             return []
 
         n_models = len(models)
-        model_to_idx = {m: i for i, m in enumerate(models)}
-        idx_to_model = {i: m for m, i in model_to_idx.items()}
-
-        # Build adjacency map with counts (optimization #2a)
-        # opponents[i][j] = count of comparisons between model i and model j
-        opponents: List[Dict[int, int]] = [defaultdict(int) for _ in range(n_models)]
-        wins = [0] * n_models
-
-        for d in pairwise_data:
-            w_idx = model_to_idx[d["winner"]]
-            l_idx = model_to_idx[d["loser"]]
-            wins[w_idx] += 1
-            opponents[w_idx][l_idx] += 1
-            opponents[l_idx][w_idx] += 1
-
-        # Initialize strengths as list (faster than dict in hot loop)
-        theta = [1.0] * n_models
-
-        # Iterative algorithm with adjacency optimization
-        for iteration in range(max_iterations):
-            old_theta = theta.copy()
-            new_theta = [0.0] * n_models
-
-            for m in range(n_models):
-                num = wins[m]
-                if num == 0:
-                    new_theta[m] = 1.0
-                    continue
-
-                # Sum over unique opponents only (optimization #2a)
-                theta_m = theta[m]
-                denom = 0.0
-                for opp, count in opponents[m].items():
-                    denom += count / (theta_m + theta[opp])
-
-                new_theta[m] = num / denom if denom > 0 else 1.0
-
-            # Normalize to prevent drift
-            total = sum(new_theta)
-            if total <= 0:
-                theta = [1.0] * n_models
-            else:
-                theta = [(v / total) * n_models for v in new_theta]
-
-            # Check convergence
-            max_change = max(abs(theta[m] - old_theta[m]) for m in range(n_models))
-            if max_change < tolerance:
-                if logger.isEnabledFor(logging.INFO):
-                    logger.info("Bradley-Terry converged in %d iterations", iteration + 1)
-                break
 
-        # Build results sorted by strength
-        indexed_strengths = [(i, theta[i]) for i in range(n_models)]
-        indexed_strengths.sort(key=lambda x: x[1], reverse=True)
+        # wins_matrix[i, j] = times model i beat model j. Indices are
+        # contiguous, so one bincount over flattened (i, j) cells counts every
+        # pair (much faster than the unbuffered np.add.at scatter)
+        wins_matrix = np.bincount(
+            winners * n_models + losers, minlength=n_models * n_models
+        ).reshape(n_models, n_models).astype(np.float64)
+        comparisons = wins_matrix + wins_matrix.T
+        wins = np.bincount(winners, minlength=n_models)
+
+        # Only models in a top class get a finite log-strength; everyone else
+        # sits at φ = -inf (strength 0, its maximum-likelihood value) and is
+        # never swept. Sweeping a model whose only wins came against
+        # strength-0 models would give -inf - -inf = NaN, and an undefeated
+        # leader is its own top class, so it keeps a positive strength.
+        top, classes = _top_classes(wins_matrix)
+
+        # The comparison graph in CSR form, one row per model listing only
+        # the opponents it actually met, so sweeps cost O(edges) rather
+        # than O(M²) when most pairs were never compared. np.nonzero walks
+        # row-major, so edges come out grouped by row.
+        edge_rows, opponents = np.nonzero(comparisons)
+        indptr = np.zeros(n_models + 1, dtype=np.intp)
+        np.cumsum(np.bincount(edge_rows, minlength=n_models), out=indptr[1:])
+
+        # Iterate on log-strengths φ = log θ: products become sums, the
+        # normalization is a mean subtraction, and strength-0 opponents sit
+        # at φ = -inf without special-casing. Zero counts become log 0 = -inf
+        # the same way.
+        # All of this is fixed across sweeps; only φ-dependent terms are
+        # recomputed inside the loop.
+        with np.errstate(divide="ignore"):
+            log_wins = np.log(wins_matrix[edge_rows, opponents])
+            log_losses = np.log(wins_matrix[opponents, edge_rows])
+            log_comparisons = np.log(comparisons[edge_rows, opponents])
+            log_total_wins = np.log(wins)
+
+        # Strengths in models that never met, directly or through common
+        # opponents, share no scale. Fit each connected group on its own
+        # (each is re-centred separately) and rank the groups one after
+        # another instead of interleaving incomparable numbers.
+        labels, n_components = _graph_components(n_models, edge_rows, opponents)
+        if n_components > 1:
+            logger.warning(
+                "Bradley-Terry comparison graph for %s has %d disconnected "
+                "groups of models; ranking each group separately",
+                stage_id, n_components,
+            )
 
-        results = []
-        for rank, (idx, strength) in enumerate(indexed_strengths, 1):
-            results.append(BradleyTerryResult(
-                model_id=idx_to_model[idx],
-                stage_id=stage_id,
-                strength=strength,
-                rank=rank,
+        # Fit each top class on its own, re-centred to mean φ = 0, so two
+        # unbeaten classes in one group (never compared to each other) come
+        # out level rather than at an arbitrary ratio
+        phi = np.where(top, 0.0, -np.inf)
+        sweeps = []
+        for cls in np.unique(classes[top]).tolist():
+            sweeps.append(_bt_fit(
+                phi, np.flatnonzero(classes == cls), indptr, opponents,
+                log_wins, log_losses, log_comparisons, log_total_wins,
+                max_iterations, tolerance,
             ))
-
-        # Deferred logging (optimization #4)
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(
+        if all(sweeps) and logger.isEnabledFor(logging.INFO):
+            logger.info("Bradley-Terry converged in %d iterations", max(sweeps))
+
+        # Report strengths with mean 1 within each group, as before. Every
+        # group holds a top class, so every group total is positive.
+        theta = np.exp(phi)
+        group_sizes = np.bincount(labels, minlength=n_components)
+        totals = np.bincount(labels, weights=theta, minlength=n_components)
+        theta *= (group_sizes / totals)[labels]
+
+        # Build results sorted by group (largest first), then strength, with
+        # raw win counts ordering the strength-0 models below a top class
+        order = np.lexsort((-wins, -theta, labels, -group_sizes[labels]))
+
+        strengths = theta.tolist()
+        results = [
+            BradleyTerryResult(models[idx], stage_id, strengths[idx], rank)
+            for rank, idx in enumerate(order.tolist(), 1)
+        ]
+
+        # Deferred logging (optimization #4), summary only at INFO
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "Bradley-Terry ranking for %s: %s",
                 stage_id,
                 [(r.model_id, f"{r.strength:.3f}") for r in results],
             )
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Bradley-Terry ranking for %s: %d models, top %s (%.3f)",
+                stage_id, len(results), results[0].model_id, results[0].strength,
+            )
 
         return results
 
+    def _summarize_judgments(
+        self, judgments: JudgmentColumns
+    ) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, int]]]:
+        """Compute mean scores and tag counts per winning model in one pass.
+
+        Scores are aggregated as running sums and counts rather than lists
+        (optimization #3a), held together in one [sum, count] accumulator per
+        criterion so each score costs a single dict lookup. A DataFrame
+        groupby is slower here: flattening the score dicts into columns is
+        already as much Python work as this loop.
+
+        Returns:
+            (mean_scores, tag_counts): model_id -> {criterion: mean} and
+            model_id -> {tag: count}
+        """
+        score_acc: Dict[str, Dict[str, List[float]]] = {}
+        tag_counts: Dict[str, Dict[str, int]] = {}
+
+        # Only the three columns needed are walked, in lockstep
+        for model, scores, tags in zip(
+            judgments.winner_model_id, judgments.scores, judgments.tags
+        ):
+            if not scores and not tags:
+                continue
+
+            if scores:
+                model_acc = score_acc.setdefault(model, {})
+                for criterion, score in scores.items():
+                    acc = model_acc.get(criterion)
+                    if acc is None:
+                        model_acc[criterion] = [score, 1]
+                    else:
+                        acc[0] += score
+                        acc[1] += 1
+            if tags:
+                model_tags = tag_counts.setdefault(model, {})
+                for tag in tags:
+                    model_tags[tag] = model_tags.get(tag, 0) + 1
+
+        mean_scores = {
+            model: {criterion: total / n for criterion, (total, n) in model_acc.items()}
+            for model, model_acc in score_acc.items()
+        }
+        return mean_scores, tag_counts
+
+    def _get_judgment_summary(
+        self, stage_id: str
+    ) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, int]]]:
+        """Get mean scores and tag counts for a stage with caching."""
+        return self._cached(
+            self._summary_cache, stage_id, stage_id,
+            lambda: self._summarize_judgments(self._get_judgments_columnar(stage_id)),
+        )
+
     def compute_mean_scores(
         self,
         stage_id: str,
@@ -434,8 +1104,7 @@ class EvalAnalyzer:
     ) -> Dict[str, Dict[str, float]]:
         """Compute mean scores per model per criterion.
 
-        Uses streaming aggregation (sum + count) instead of storing all scores
-        in lists (optimization #3a).
+        Shares one pass over the judgments with compute_tag_frequencies.
 
         Args:
             stage_id: Stage to analyze
@@ -445,30 +1114,8 @@ class EvalAnalyzer:
             Dict mapping model_id -> {criterion: mean_score}
         """
         if judgments is None:
-            judgments = self._get_judgments(stage_id)
-
-        # Streaming aggregation: store sum and count, not all values (optimization #3a)
-        totals: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(
-            lambda: defaultdict(lambda: {"sum": 0.0, "count": 0})
-        )
-
-        for j in judgments:
-            if j["scores"]:
-                model = j["winner_model_id"]
-                for criterion, score in j["scores"].items():
-                    agg = totals[model][criterion]
-                    agg["sum"] += score
-                    agg["count"] += 1
-
-        # Compute means
-        results = {}
-        for model, criteria in totals.items():
-            results[model] = {
-                criterion: agg["sum"] / agg["count"]
-                for criterion, agg in criteria.items()
-            }
-
-        return results
+            return self._get_judgment_summary(stage_id)[0]
+        return self._summarize_judgments(JudgmentColumns.from_records(judgments))[0]
 
     def compute_tag_frequencies(
         self,
@@ -477,6 +1124,8 @@ class EvalAnalyzer:
     ) -> Dict[str, Dict[str, int]]:
         """Compute tag frequencies per model.
 
+        Shares one pass over the judgments with compute_mean_scores.
+
         Args:
             stage_id: Stage to analyze
             judgments: Pre-fetched judgments (optional, for batch operations)
@@ -485,19 +1134,8 @@ class EvalAnalyzer:
             Dict mapping model_id -> {tag: count}
         """
         if judgments is None:
-            judgments = self._get_judgments(stage_id)
-
-        tag_counts: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
-
-        for j in judgments:
-            if j["tags"]:
-                model = j["winner_model_id"]
-                for tag in j["tags"]:
-                    tag_counts[model][tag] += 1
-
-        return dict(tag_counts)
+            return self._get_judgment_summary(stage_id)[1]
+        return self._summarize_judgments(JudgmentColumns.from_records(judgments))[1]
 
     def generate_report(
         self,
@@ -508,7 +1146,10 @@ class EvalAnalyzer:
         """Generate a comprehensive analysis report for a stage.
 
         Pre-fetches all data once and passes to sub-methods to minimize
-        DB calls (optimization #6).
+        DB calls (optimization #6). The serialized report is cached until the
+        database changes; each call returns a new top-level dict, but the
+        section lists and dicts inside are shared and should be treated as
+        read-only.
 
         Args:
             stage_id: Stage to analyze
@@ -518,23 +1159,32 @@ class EvalAnalyzer:
         Returns:
             Dict containing all analysis results
         """
-        # Pre-fetch all data once (optimization #6)
+        report = self._cached(
+            self._report_cache,
+            (stage_id, include_bradley_terry, include_pairwise),
+            stage_id,
+            lambda: self._build_report(stage_id, include_bradley_terry, include_pairwise),
+        )
+        return dict(report)
+
+    def _build_report(
+        self, stage_id: str, include_bradley_terry: bool, include_pairwise: bool
+    ) -> Dict[str, Any]:
+        """Compute and serialize the report sections (uncached)."""
+        # Pre-fetch all data once (optimization #6), in a single DB round
+        # trip when the caches are cold
+        self._load_report_data(stage_id, include_pairwise_arrays=include_bradley_terry)
         stats = self._get_model_stats(stage_id)
-        judgments = self._get_judgments(stage_id)
+        mean_scores, tag_frequencies = self._get_judgment_summary(stage_id)
         head_to_head_counts = self._get_head_to_head_counts(stage_id)
 
-        # For Bradley-Terry, we need the raw pairwise data
-        pairwise_data = None
-        if include_bradley_terry:
-            pairwise_data = self.db.get_all_pairwise(stage_id)
-
         report = {
             "stage_id": stage_id,
             "win_rates": [
                 r.to_dict() for r in self.compute_win_rates(stage_id, stats=stats)
             ],
-            "mean_scores": self.compute_mean_scores(stage_id, judgments=judgments),
-            "tag_frequencies": self.compute_tag_frequencies(stage_id, judgments=judgments),
+            "mean_scores": mean_scores,
+            "tag_frequencies": tag_frequencies,
         }
 
         if include_pairwise:
@@ -548,9 +1198,7 @@ class EvalAnalyzer:
         if include_bradley_terry:
             report["bradley_terry"] = [
                 r.to_dict()
-                for r in self.bradley_terry_ranking(
-                    stage_id, pairwise_data=pairwise_data
-                )
+                for r in self.bradley_terry_ranking(stage_id)
             ]
 
         return report
@@ -5,7 +5,7 @@ on candidate outputs, including winner selection, rankings, scores, and tags.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Collection, Dict, List, Optional
 
 from .schemas import Judgment, CandidateOutput, StageEval
 from db.eval_db import EvalDatabase
@@ -151,7 +151,7 @@ class JudgmentCollector:
     def validate_scores(
         self,
         scores: Dict[str, int],
-        valid_criteria: List[str],
+        valid_criteria: Collection[str],
         min_score: int = 1,
         max_score: int = 5,
     ) -> bool:
@@ -159,21 +159,25 @@ class JudgmentCollector:
 
         Args:
             scores: Scores to validate
-            valid_criteria: List of valid criterion names
+            valid_criteria: Valid criterion names (list or set)
             min_score: Minimum allowed score
             max_score: Maximum allowed score
 
         Returns:
             True if all scores are valid
         """
+        # Hash lookups per score instead of scanning the list each time
+        valid = valid_criteria
+        if not isinstance(valid, (set, frozenset)):
+            valid = set(valid)
         for criterion, score in scores.items():
-            if criterion not in valid_criteria:
-                logger.warning(f"Unknown criterion: {criterion}")
+            if criterion not in valid:
+                logger.warning("Unknown criterion: %s", criterion)
                 return False
             if not (min_score <= score <= max_score):
                 logger.warning(
-                    f"Score {score} for {criterion} out of range "
-                    f"[{min_score}, {max_score}]"
+                    "Score %s for %s out of range [%s, %s]",
+                    score, criterion, min_score, max_score,
                 )
                 return False
         return True
@@ -224,10 +228,10 @@ class BatchJudgmentCollector(JudgmentCollector):
         Returns:
             List of saved Judgment objects
         """
-        saved = []
-        for judgment in self._pending_judgments:
-            judgment.id = self.db.save_judgment(judgment)
-            saved.append(judgment)
+        saved = self._pending_judgments
+        # One bulk insert and one commit for the whole batch
+        for judgment, judgment_id in zip(saved, self.db.save_judgments(saved)):
+            judgment.id = judgment_id
 
         logger.info(f"Flushed {len(saved)} judgments to database")
         self._pending_judgments = []
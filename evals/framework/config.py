@@ -5,8 +5,9 @@ Domain-specific configuration (e.g., resume optimization criteria)
 should be placed in config_resume.py or a domain/ subdirectory.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 
@@ -30,15 +31,7 @@ class EvalConfig:
     ui_port: int = 8502
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "db_path": self.db_path,
-            "default_evaluator_id": self.default_evaluator_id,
-            "randomize_candidate_order": self.randomize_candidate_order,
-            "log_level": self.log_level,
-            "log_to_file": self.log_to_file,
-            "log_dir": self.log_dir,
-            "ui_port": self.ui_port,
-        }
+        return asdict(self)
 
 
 @dataclass
@@ -51,13 +44,7 @@ class StageConfig:
     criteria_weights: Dict[str, float] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "stage_id": self.stage_id,
-            "display_name": self.display_name,
-            "description": self.description,
-            "criteria": self.criteria,
-            "criteria_weights": self.criteria_weights,
-        }
+        return asdict(self)
 
 
 @dataclass
@@ -73,16 +60,7 @@ class ModelConfig:
     cost_per_1k_output: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "model_id": self.model_id,
-            "display_name": self.display_name,
-            "provider": self.provider,
-            "prompt_version": self.prompt_version,
-            "default_temperature": self.default_temperature,
-            "default_max_tokens": self.default_max_tokens,
-            "cost_per_1k_input": self.cost_per_1k_input,
-            "cost_per_1k_output": self.cost_per_1k_output,
-        }
+        return asdict(self)
 
 
 def get_default_config() -> EvalConfig:
@@ -92,25 +70,23 @@ def get_default_config() -> EvalConfig:
 
 def load_config_from_file(config_path: str) -> EvalConfig:
     """Load configuration from a YAML or JSON file."""
-    import json
-    import yaml
-    try:
-        from pydantic import ValidationError  # type: ignore
-    except Exception:  # pragma: no cover - optional dependency
-        class ValidationError(Exception):  # type: ignore
-            ...
-
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
+    # json.JSONDecodeError is a ValueError
+    errors: Tuple[type, ...] = (ValueError, TypeError)
     try:
         with open(path, encoding="utf-8") as f:
             if path.suffix in (".yaml", ".yml"):
+                # Imported only when needed: PyYAML costs tens of ms at
+                # startup, which JSON configs shouldn't pay
+                import yaml
+                errors += (yaml.YAMLError,)
                 data = yaml.safe_load(f)
             else:
                 data = json.load(f)
 
         return EvalConfig(**data)
-    except (yaml.YAMLError, json.JSONDecodeError, ValueError, TypeError, ValidationError) as exc:
+    except errors as exc:
         raise ValueError(f"Failed to load config from {config_path}: {exc}") from exc
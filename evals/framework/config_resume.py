@@ -5,17 +5,14 @@ model configurations specific to the resume optimization pipeline.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 from .config import StageConfig, ModelConfig, EvalConfig
 
-# Ensure backend is importable so we can read MODEL_REGISTRY
 backend_root = Path(__file__).parent.parent.parent / "backend"
 backend_src = backend_root / "src"
-for p in (backend_root, backend_src):
-    if p.exists() and str(p) not in sys.path:
-        sys.path.insert(0, str(p))
 
 
 # --- Stage Definitions ---
@@ -172,6 +169,10 @@ _FALLBACK_MODELS: List[ModelConfig] = [
 
 def _get_models_from_registry() -> List[ModelConfig]:
     """Get models from backend's MODEL_REGISTRY, fallback if missing/empty."""
+    # Ensure backend is importable so we can read MODEL_REGISTRY
+    for p in (backend_root, backend_src):
+        if p.exists() and str(p) not in sys.path:
+            sys.path.insert(0, str(p))
     try:
         from src.api.model_registry import MODEL_REGISTRY
     except ImportError:
@@ -195,8 +196,28 @@ def _get_models_from_registry() -> List[ModelConfig]:
     return models or _FALLBACK_MODELS
 
 
-# Load models from backend registry
-CANDIDATE_MODELS: List[ModelConfig] = _get_models_from_registry()
+# The backend registry is only imported on first use of the models, so
+# importing this module for stages, criteria or tags stays cheap.
+# CANDIDATE_MODELS is still readable as a module attribute (see __getattr__).
+@lru_cache(maxsize=1)
+def _candidate_models() -> List[ModelConfig]:
+    """Load models from backend registry (once)."""
+    return _get_models_from_registry()
+
+
+@lru_cache(maxsize=1)
+def _model_by_id() -> Dict[str, ModelConfig]:
+    """model_id -> ModelConfig, built once so get_model_by_id is a dict lookup.
+
+    Registry ids are dict keys, so each appears once.
+    """
+    return {model.model_id: model for model in _candidate_models()}
+
+
+def __getattr__(name: str):
+    if name == "CANDIDATE_MODELS":
+        return _candidate_models()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_resume_eval_config() -> EvalConfig:
@@ -228,7 +249,7 @@ def get_tags_for_stage(stage_id: str) -> List[str]:
 
 def get_model_by_id(model_id: str) -> ModelConfig:
     """Get model configuration by ID."""
-    for model in CANDIDATE_MODELS:
-        if model.model_id == model_id:
-            return model
-    raise ValueError(f"Unknown model: {model_id}")
+    model = _model_by_id().get(model_id)
+    if model is None:
+        raise ValueError(f"Unknown model: {model_id}")
+    return model
@@ -5,7 +5,10 @@ for a given pipeline stage, with proper randomization for blind evaluation.
 """
 
 import asyncio
+import contextlib
 import random
+import string
+import threading
 import time
 import uuid
 import logging
@@ -21,6 +24,40 @@ from db.eval_db import EvalDatabase
 
 logger = logging.getLogger(__name__)
 
+_LABELS = string.ascii_uppercase
+
+
+def _blind_label(index: int) -> str:
+    """Blind label for the index-th shuffled candidate: A-Z, then C27, C28, ..."""
+    if index < len(_LABELS):
+        return _LABELS[index]
+    return f"C{index + 1}"
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count, ~4 characters per token.
+
+    The same heuristic the backend's PricingManager.estimate_tokens uses;
+    O(1), where counting words would split the whole output into strings.
+    """
+    return len(text) // 4
+
+
+def _run_loop_forever(loop: asyncio.AbstractEventLoop) -> None:
+    """Thread target: run loop until stopped, then shut it down."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def _provider_of(model_id: str) -> str:
+    """Provider prefix of a "provider::model" id, or "" if it has none."""
+    provider, sep, _ = model_id.partition("::")
+    return provider if sep else ""
+
 
 class AgentProtocol(Protocol):
     """Protocol for agents that can be evaluated."""
@@ -50,15 +87,38 @@ class EvalRunner:
         self,
         db: EvalDatabase,
         agent_factory: Optional[AgentFactory] = None,
+        provider_limits: Optional[Dict[str, int]] = None,
     ):
         """Initialize the evaluation runner.
 
         Args:
             db: Database for persisting evaluation data
             agent_factory: Factory for creating agents (optional, can use custom runner)
+            provider_limits: Max concurrent candidate calls per provider within
+                one stage eval, e.g. {"openrouter": 5, "gemini": 3}. The
+                provider is the model id's "provider::" prefix; providers
+                not listed are not limited.
         """
         self.db = db
         self.agent_factory = agent_factory
+        self.provider_limits = dict(provider_limits or {})
+
+        # Event loop for run_stage_eval_sync, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def _provider_semaphores(self) -> Dict[str, asyncio.Semaphore]:
+        """Create one semaphore per limited provider for a single stage eval.
+
+        Made per call: a semaphore is bound to the event loop that first
+        waits on it, and run_stage_eval_sync runs each eval under its own
+        asyncio.run loop unless it is called from inside a running loop.
+        """
+        return {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in self.provider_limits.items()
+        }
 
     def generate_scenario_id(self) -> str:
         """Generate a unique scenario ID."""
@@ -120,9 +180,14 @@ class EvalRunner:
             f"with {len(candidates)} candidates"
         )
 
-        # Run all candidates concurrently
+        # Run all candidates concurrently, at most provider_limits[provider]
+        # at a time per provider so one throttled provider doesn't trip rate
+        # limits for all of its models at once
+        semaphores = self._provider_semaphores()
         tasks = [
-            self._run_candidate(stage_id, context, cfg)
+            self._run_candidate(
+                stage_id, context, cfg, semaphores.get(_provider_of(cfg.model_id))
+            )
             for cfg in candidates
         ]
         results: List[CandidateOutput] = await asyncio.gather(*tasks)
@@ -132,11 +197,13 @@ class EvalRunner:
             random.shuffle(results)
 
         # Assign blinded labels and persist
-        labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
         for i, result in enumerate(results):
-            result.candidate_label = labels[i]
-            result.id = self.db.save_candidate(stage_run_id, result)
+            result.candidate_label = _blind_label(i)
             result.stage_run_id = stage_run_id
+        for result, candidate_id in zip(
+            results, self.db.save_candidates(stage_run_id, results)
+        ):
+            result.id = candidate_id
 
         # Build and return StageEval
         stage_eval = StageEval(
@@ -158,41 +225,44 @@ class EvalRunner:
         stage_id: str,
         context: Dict[str, Any],
         cfg: CandidateConfig,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> CandidateOutput:
         """Run a single candidate and capture output + metrics.
 
+        Failures are recorded as "[ERROR] ..." output rather than raised, so
+        one failing candidate (e.g. a 429) doesn't cancel the others.
+
         Args:
             stage_id: Stage being evaluated
             context: Context for the agent
             cfg: Candidate configuration
+            semaphore: Provider concurrency limit to hold while running (optional)
 
         Returns:
             CandidateOutput with results
         """
-        agent = self.agent_factory.create(stage_id, cfg.model_id)
-
-        start_time = time.time()
-        try:
-            output = await agent.run_async(
-                context=context,
-                model=cfg.model_id,
-                temperature=cfg.temperature,
-                max_tokens=cfg.max_tokens,
-            )
-        except Exception as e:
-            logger.error(f"Candidate {cfg.model_id} failed: {e}")
-            output = f"[ERROR] {type(e).__name__}: {str(e)}"
-
-        latency_ms = int((time.time() - start_time) * 1000)
+        async with semaphore or contextlib.nullcontext():
+            # Latency covers the call only, not time spent queued
+            start_time = time.time()
+            try:
+                agent = self.agent_factory.create(stage_id, cfg.model_id)
+                output = await agent.run_async(
+                    context=context,
+                    model=cfg.model_id,
+                    temperature=cfg.temperature,
+                    max_tokens=cfg.max_tokens,
+                )
+            except Exception as e:
+                logger.error(f"Candidate {cfg.model_id} failed: {e}")
+                output = f"[ERROR] {type(e).__name__}: {str(e)}"
 
-        # Estimate token count (rough approximation)
-        token_count = len(output.split())
+            latency_ms = int((time.time() - start_time) * 1000)
 
         return CandidateOutput(
             model_id=cfg.model_id,
             output_text=output,
             latency_ms=latency_ms,
-            token_count=token_count,
+            token_count=_estimate_tokens(output),
         )
 
     async def run_stage_eval_with_custom_runner(
@@ -207,6 +277,8 @@ class EvalRunner:
         """Run evaluation with a custom runner function.
 
         This allows using the eval framework without implementing AgentFactory.
+        runner_fn is called for all candidates concurrently, each in a worker
+        thread, so it must be thread-safe.
 
         Args:
             scenario_id: Parent scenario ID
@@ -221,32 +293,27 @@ class EvalRunner:
         """
         stage_run_id = self.db.create_stage_run(scenario_id, stage_id, context)
 
-        results = []
-        for cfg in candidates:
-            start_time = time.time()
-            try:
-                output = runner_fn(cfg, context)
-            except Exception as e:
-                logger.error(f"Candidate {cfg.model_id} failed: {e}")
-                output = f"[ERROR] {type(e).__name__}: {str(e)}"
-
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            results.append(CandidateOutput(
-                model_id=cfg.model_id,
-                output_text=output,
-                latency_ms=latency_ms,
-                token_count=len(output.split()),
-            ))
+        # runner_fn blocks (typically on an LLM HTTP call), so run each
+        # candidate in a worker thread: wall time is the slowest candidate
+        # rather than the sum of all of them
+        semaphores = self._provider_semaphores()
+        results: List[CandidateOutput] = list(await asyncio.gather(*(
+            self._run_custom_candidate(
+                runner_fn, context, cfg, semaphores.get(_provider_of(cfg.model_id))
+            )
+            for cfg in candidates
+        )))
 
         if randomize:
             random.shuffle(results)
 
-        labels = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
         for i, result in enumerate(results):
-            result.candidate_label = labels[i]
-            result.id = self.db.save_candidate(stage_run_id, result)
+            result.candidate_label = _blind_label(i)
             result.stage_run_id = stage_run_id
+        for result, candidate_id in zip(
+            results, self.db.save_candidates(stage_run_id, results)
+        ):
+            result.id = candidate_id
 
         return StageEval(
             id=stage_run_id,
@@ -256,6 +323,41 @@ class EvalRunner:
             candidates=results,
         )
 
+    async def _run_custom_candidate(
+        self,
+        runner_fn: Callable[[CandidateConfig, Dict[str, Any]], str],
+        context: Dict[str, Any],
+        cfg: CandidateConfig,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> CandidateOutput:
+        """Run runner_fn for one candidate in a worker thread.
+
+        Args:
+            runner_fn: Custom function that takes (config, context) and returns output
+            context: Context passed to runner_fn
+            cfg: Candidate configuration
+            semaphore: Provider concurrency limit to hold while running (optional)
+
+        Returns:
+            CandidateOutput with results
+        """
+        async with semaphore or contextlib.nullcontext():
+            start_time = time.time()
+            try:
+                output = await asyncio.to_thread(runner_fn, cfg, context)
+            except Exception as e:
+                logger.error(f"Candidate {cfg.model_id} failed: {e}")
+                output = f"[ERROR] {type(e).__name__}: {str(e)}"
+
+            latency_ms = int((time.time() - start_time) * 1000)
+
+        return CandidateOutput(
+            model_id=cfg.model_id,
+            output_text=output,
+            latency_ms=latency_ms,
+            token_count=_estimate_tokens(output),
+        )
+
     def run_stage_eval_sync(
         self,
         scenario_id: str,
@@ -267,30 +369,48 @@ class EvalRunner:
     ) -> StageEval:
         """Synchronous version of run_stage_eval_with_custom_runner.
 
-        Useful for CLI scripts or non-async contexts.
+        Useful for CLI scripts or non-async contexts, where it is a plain
+        asyncio.run in the calling thread. Called from inside a running loop
+        (e.g. a notebook), the eval runs on a background loop the runner
+        starts once and keeps until close(); the caller's loop is still
+        blocked until the eval finishes.
         """
-        import concurrent.futures
-
-        def _run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(
-                    self.run_stage_eval_with_custom_runner(
-                        scenario_id=scenario_id,
-                        stage_id=stage_id,
-                        context=context,
-                        candidates=candidates,
-                        runner_fn=runner_fn,
-                        randomize=randomize,
-                    )
+        coro = self.run_stage_eval_with_custom_runner(
+            scenario_id=scenario_id,
+            stage_id=stage_id,
+            context=context,
+            candidates=candidates,
+            runner_fn=runner_fn,
+            randomize=randomize,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._background_loop()).result()
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the loop nested run_stage_eval_sync calls use, starting it if needed."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Daemon, so a runner that is never closed doesn't block exit
+                thread = threading.Thread(
+                    target=_run_loop_forever, args=(loop,),
+                    name="eval-runner-loop", daemon=True,
                 )
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(_run_in_thread)
-            return future.result()
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def close(self) -> None:
+        """Stop the background event loop and its worker threads."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
 
     def get_pending_evaluations(self, limit: int = 50) -> List[StageEval]:
         """Get stage evaluations that need human judgment.
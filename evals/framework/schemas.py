@@ -74,7 +74,8 @@ class CandidateOutput:
     """Output from a single model candidate for a stage evaluation.
     
     The candidate_label (A, B, C, ...) is assigned after shuffling
-    to ensure blind evaluation.
+    to ensure blind evaluation. Past 26 candidates labels continue as
+    C27, C28, ...
     """
     model_id: str
     output_text: str
@@ -171,8 +172,9 @@ class Judgment:
 
 
 # --- Analysis Result Types ---
+# Built in bulk by the analyzer, so slotted: smaller and faster to create
 
-@dataclass
+@dataclass(slots=True)
 class WinRateResult:
     """Win rate statistics for a model at a stage."""
     model_id: str
@@ -191,7 +193,7 @@ class WinRateResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PairwiseResult:
     """Pairwise preference statistics between two models."""
     model_a: str
@@ -222,7 +224,7 @@ class PairwiseResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BradleyTerryResult:
     """Bradley-Terry model ranking result."""
     model_id: str
@@ -10,6 +10,7 @@ Usage:
 import argparse
 import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 # Add evals root to path for direct imports
@@ -138,7 +139,7 @@ def print_text_report(analyzer: EvalAnalyzer, stage_id: str):
         for model, tags in tag_freqs.items():
             model_short = model.split("/")[-1]
             print(f"  {model_short}:")
-            for tag, count in sorted(tags.items(), key=lambda x: -x[1]):
+            for tag, count in sorted(tags.items(), key=itemgetter(1), reverse=True):
                 print(f"    {tag}: {count}")
     else:
         print("  No tag data available.")
@@ -34,7 +34,6 @@ Requirements:
 import argparse
 import asyncio
 import json
-import os
 import sys
 import time
 from pathlib import Path
@@ -171,10 +170,9 @@ def create_real_runner(stage_id: str):
     """
     def run_agent(cfg: CandidateConfig, context: Dict[str, Any]) -> str:
         """Run the appropriate agent for the given stage."""
-        # Change to backend directory so prompt files are found
-        original_cwd = os.getcwd()
-        os.chdir(backend_root)
-        
+        # No chdir into the backend: agents resolve their prompt files
+        # against the backend root, and the runner calls this from several
+        # threads
         try:
             from src.api.client_factory import create_client
             client = create_client()
@@ -293,8 +291,6 @@ def create_real_runner(stage_id: str):
             return f"[ERROR] Backend import failed: {e}\n\nEnsure backend dependencies are installed and API keys are set in .env"
         except Exception as e:
             return f"[ERROR] {type(e).__name__}: {e}"
-        finally:
-            os.chdir(original_cwd)
     
     return run_agent
 
@@ -434,6 +430,7 @@ def main():
         runner_fn=agent_runner,
         randomize=not args.no_randomize,
     )
+    runner.close()
 
     print(f"\nCompleted stage evaluation (ID: {stage_eval.id})")
     print(f"\nCandidate outputs:")
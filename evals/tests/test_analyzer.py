@@ -1,11 +1,14 @@
 """Tests for evaluation analyzer."""
 
+import logging
 import pytest
 import tempfile
 import os
 
+import numpy as np
+
 from db.eval_db import EvalDatabase
-from framework.analyzer import EvalAnalyzer
+from framework.analyzer import EvalAnalyzer, _bt_fit_loops, _bt_fit_numpy
 from framework.schemas import (
     Scenario,
     CandidateOutput,
@@ -128,6 +131,51 @@ class TestWinRates:
         rates = [r.win_rate for r in results]
         assert rates == sorted(rates, reverse=True)
 
+    def test_cached_stats_follow_writes(self, db, analyzer):
+        """Test that cached stage data is reused until the database changes."""
+        assert analyzer.compute_win_rates("optimizer") == []
+        
+        setup_eval_data(db, num_runs=3, models=["a", "b", "c"])
+        stats = analyzer._get_model_stats("optimizer")
+        
+        assert analyzer._get_model_stats("optimizer") is stats
+        assert len(analyzer.compute_win_rates("optimizer")) == 3
+        
+        # Commits from another connection invalidate the cache too
+        other = EvalDatabase(db.db_path)
+        other.delete_scenario("test_scenario")
+        other.close()
+        
+        assert analyzer.compute_win_rates("optimizer") == []
+
+    def test_concurrent_cache_fill_fetches_once(self, db, analyzer, monkeypatch):
+        """Test that threads asking for the same stage share one DB fetch."""
+        import threading
+        import time
+        
+        setup_eval_data(db, num_runs=3)
+        calls = []
+        fetch = db.get_model_stats
+        
+        def slow_fetch(stage_id):
+            calls.append(stage_id)
+            time.sleep(0.05)
+            return fetch(stage_id)
+        
+        monkeypatch.setattr(db, "get_model_stats", slow_fetch)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(analyzer._get_model_stats("optimizer")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert calls == ["optimizer"]
+        assert all(r is results[0] for r in results)
+
 
 class TestPairwisePreference:
     """Tests for pairwise preference computation."""
@@ -154,6 +202,8 @@ class TestPairwisePreference:
         assert result.a_wins == 5
         assert result.b_wins == 5
         assert abs(result.p_a_preferred - 0.5) < 0.01
+        assert result.p_value == 1.0
+        assert result.significant is False
 
     def test_pairwise_significant(self, db, analyzer):
         """Test pairwise with significant preference."""
@@ -181,6 +231,68 @@ class TestPairwisePreference:
         
         # 3 models = 3 pairs: (a,b), (a,c), (b,c)
         assert len(results) == 3
+        
+        # The batched tests agree with the one-pair-at-a-time path
+        for r in results:
+            single = analyzer.pairwise_preference("optimizer", r.model_a, r.model_b)
+            assert (r.a_wins, r.b_wins, r.total, r.significant) == (
+                single.a_wins, single.b_wins, single.total, single.significant
+            )
+            assert [r.p_value, r.ci_low, r.ci_high] == pytest.approx(
+                [single.p_value, single.ci_low, single.ci_high]
+            )
+
+    def test_all_pairwise_without_scipy(self, db, analyzer, monkeypatch):
+        """Test that batched Wilson intervals match the single-pair fallback."""
+        import framework.analyzer as analyzer_module
+        
+        monkeypatch.setattr(analyzer_module, "_HAS_SCIPY", False)
+        setup_eval_data(db, num_runs=9, models=["a", "b", "c"], winner_pattern=lambda idx: idx % 2)
+        
+        results = analyzer.all_pairwise_comparisons("optimizer")
+        
+        for r in results:
+            single = analyzer.pairwise_preference("optimizer", r.model_a, r.model_b)
+            assert r.p_value == single.p_value == 0.0
+            assert [r.ci_low, r.ci_high] == pytest.approx([single.ci_low, single.ci_high])
+
+    def test_pairwise_index_mirrors_reverse_order(self, db, analyzer):
+        """Test that PairwiseIndex serves (b, a) by mirroring the stored pair."""
+        setup_eval_data(
+            db,
+            num_runs=10,
+            models=["a", "b"],
+            winner_pattern=lambda idx: 0 if idx < 9 else 1,
+        )
+        
+        index = analyzer.pairwise_index("optimizer")
+        forward = index.get("a", "b")
+        reverse = index.get("b", "a")
+        
+        assert len(index) == 1
+        assert forward is index.results[0]
+        assert (reverse.a_wins, reverse.b_wins) == (forward.b_wins, forward.a_wins)
+        assert reverse.p_a_preferred == pytest.approx(1 - forward.p_a_preferred)
+        assert (reverse.ci_low, reverse.ci_high) == pytest.approx(
+            (1 - forward.ci_high, 1 - forward.ci_low)
+        )
+        assert reverse.significant == forward.significant
+        assert index.get("a", "z") is None
+
+    @pytest.mark.parametrize(
+        "k, n", [(0, 5), (5, 5), (3, 7), (9, 10), (5_020, 10_000), (61_234, 123_457)]
+    )
+    def test_binomial_tests_match_scipy(self, k, n):
+        """Test the symmetric two-sided shortcut against scipy's binomtest."""
+        stats = pytest.importorskip("scipy.stats")
+        from framework.analyzer import _binomial_tests
+        
+        expected = stats.binomtest(k, n, p=0.5)
+        ci = expected.proportion_ci(confidence_level=0.95)
+        
+        assert [float(v) for v in _binomial_tests(k, n)] == pytest.approx(
+            [expected.pvalue, ci.low, ci.high], rel=1e-9, abs=1e-12
+        )
 
 
 class TestBradleyTerry:
@@ -241,9 +353,112 @@ class TestBradleyTerry:
         model_b = next(r for r in results if r.model_id == "b")
         
         assert model_a.strength > model_b.strength
+        # The two-model MLE is the win ratio
+        assert model_a.strength / model_b.strength == pytest.approx(9.0, rel=1e-4)
+        
+        # Pre-fetched pairwise data gives the same fit as the database path
+        prefetched = analyzer.bradley_terry_ranking(
+            "optimizer", pairwise_data=db.get_all_pairwise("optimizer")
+        )
+        assert [r.strength for r in prefetched] == pytest.approx([r.strength for r in results])
+        streamed = analyzer.bradley_terry_ranking(
+            "optimizer",
+            pairwise_data=(
+                {"winner": winner, "loser": loser}
+                for winner, loser in db.iter_pairwise("optimizer")
+            ),
+        )
+        assert [r.strength for r in streamed] == pytest.approx([r.strength for r in results])
         assert model_a.rank == 1
         assert model_b.rank == 2
 
+    def test_bradley_terry_winless_model(self, analyzer):
+        """Test that a model that never wins gets zero strength and ranks last."""
+        pairwise_data = (
+            [{"winner": "a", "loser": "b"}] * 3
+            + [{"winner": "b", "loser": "a"}] * 2
+            + [{"winner": "a", "loser": "z"}, {"winner": "b", "loser": "z"}]
+        )
+        
+        results = analyzer.bradley_terry_ranking("optimizer", pairwise_data=pairwise_data)
+        
+        assert [r.model_id for r in results] == ["a", "b", "z"]
+        assert results[-1].strength == 0.0
+        assert results[0].strength / results[1].strength == pytest.approx(1.5, rel=1e-4)
+
+    def test_bradley_terry_chain_is_finite(self, analyzer):
+        """Test that wins only over strength-0 models don't produce NaN."""
+        pairwise_data = (
+            [{"winner": "a", "loser": "b"}] * 3 + [{"winner": "b", "loser": "c"}]
+        )
+        
+        results = analyzer.bradley_terry_ranking("optimizer", pairwise_data=pairwise_data)
+        strengths = [r.strength for r in results]
+        
+        assert np.isfinite(strengths).all()
+        assert results[0].model_id == "a"
+        assert results[0].strength > 0
+
+    @pytest.mark.parametrize(
+        "pairs, expected",
+        [
+            ([("a", "b")], [("a", 2.0), ("b", 0.0)]),
+            ([("a", "b"), ("a", "c")], [("a", 3.0), ("b", 0.0), ("c", 0.0)]),
+            ([("a", "b")] * 3 + [("b", "c")], [("a", 3.0), ("b", 0.0), ("c", 0.0)]),
+        ],
+    )
+    def test_bradley_terry_undefeated_leader(self, analyzer, pairs, expected):
+        """Test that an undefeated leader keeps the group's whole strength."""
+        pairwise_data = [{"winner": winner, "loser": loser} for winner, loser in pairs]
+        
+        results = analyzer.bradley_terry_ranking("optimizer", pairwise_data=pairwise_data)
+        
+        assert [(r.model_id, r.strength) for r in results] == [
+            (model_id, pytest.approx(strength)) for model_id, strength in expected
+        ]
+
+    def test_bradley_terry_disconnected_groups(self, analyzer, caplog):
+        """Test that disconnected groups are ranked separately with a warning."""
+        pairwise_data = (
+            [{"winner": "c", "loser": "d"}, {"winner": "d", "loser": "c"}]
+            + [{"winner": "a", "loser": "b"}] * 2
+            + [{"winner": "b", "loser": "a"}]
+            + [{"winner": "e", "loser": "a"}, {"winner": "a", "loser": "e"}]
+        )
+        
+        with caplog.at_level(logging.WARNING):
+            results = analyzer.bradley_terry_ranking("optimizer", pairwise_data=pairwise_data)
+        
+        assert "2 disconnected groups" in caplog.text
+        # The larger group first, each with mean strength 1
+        assert [r.model_id for r in results[3:]] == ["c", "d"]
+        assert [r.rank for r in results] == [1, 2, 3, 4, 5]
+        assert sum(r.strength for r in results[:3]) == pytest.approx(3.0)
+        assert results[3].strength == pytest.approx(1.0)
+
+    def test_bradley_terry_fit_kernels_agree(self):
+        """Test that the scalar-loop (Numba) fit matches the NumPy fit."""
+        wins = np.array([[0, 3, 1, 1], [2, 0, 1, 0], [0, 4, 0, 0], [1, 1, 1, 0]], dtype=np.float64)
+        comparisons = wins + wins.T
+        edge_rows, opponents = np.nonzero(comparisons)
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(edge_rows, minlength=4))])
+        with np.errstate(divide="ignore"):
+            edges = (
+                np.log(wins[edge_rows, opponents]),
+                np.log(wins[opponents, edge_rows]),
+                np.log(comparisons[edge_rows, opponents]),
+                np.log(wins.sum(axis=1)),
+            )
+        rows = np.arange(4)
+        phi_numpy = np.zeros(4)
+        phi_loops = np.zeros(4)
+        
+        sweeps = _bt_fit_numpy(phi_numpy, rows, indptr, opponents, *edges, 100, 1e-9)
+        
+        assert sweeps > 0
+        assert _bt_fit_loops(phi_loops, rows, indptr, opponents, *edges, 100, 1e-9) == sweeps
+        assert phi_loops == pytest.approx(phi_numpy)
+
 
 class TestMeanScores:
     """Tests for mean score computation."""
@@ -268,6 +483,16 @@ class TestMeanScores:
             for score in criteria.values():
                 assert 1 <= score <= 5
 
+    def test_mean_scores_from_records_match_cached_columns(self, db, analyzer):
+        """Test that passed-in records and the cached columns agree."""
+        setup_eval_data(db, num_runs=6)
+        records = db.get_judgments_for_stage("optimizer")
+        
+        assert analyzer._get_judgments("optimizer") == records
+        assert analyzer.compute_mean_scores("optimizer", judgments=records) == (
+            analyzer.compute_mean_scores("optimizer")
+        )
+
 
 class TestTagFrequencies:
     """Tests for tag frequency computation."""
@@ -321,3 +546,31 @@ class TestReportGeneration:
         # Should not raise
         json_str = json.dumps(report)
         assert len(json_str) > 0
+
+    def test_report_cached_until_write(self, db, analyzer):
+        """Test that reports are reused until the data changes."""
+        setup_eval_data(db, num_runs=6)
+        
+        first = analyzer.generate_report("optimizer")
+        second = analyzer.generate_report("optimizer")
+        
+        assert second == first and second is not first
+        assert second["pairwise_comparisons"] is first["pairwise_comparisons"]
+        assert "bradley_terry" not in analyzer.generate_report(
+            "optimizer", include_bradley_terry=False
+        )
+        
+        stage_run_id = db.create_stage_run("test_scenario", "optimizer", {})
+        candidate_id = db.save_candidate(
+            stage_run_id,
+            CandidateOutput(
+                model_id="model/a",
+                output_text="Output",
+                latency_ms=1000,
+                token_count=400,
+                candidate_label="A",
+            ),
+        )
+        db.save_judgment(Judgment(stage_run_id=stage_run_id, chosen_candidate_id=candidate_id))
+        
+        assert analyzer.generate_report("optimizer")["win_rates"] != first["win_rates"]
@@ -5,7 +5,7 @@ import tempfile
 import os
 from datetime import datetime
 
-from db.eval_db import EvalDatabase
+from db.eval_db import EvalDatabase, get_db
 from framework.schemas import (
     Scenario,
     CandidateOutput,
@@ -24,6 +24,130 @@ def db():
     os.unlink(path)
 
 
+class TestConnectionSetup:
+    """Tests for connection configuration."""
+
+    def test_file_database_uses_wal(self, db):
+        """Test that file databases open in WAL mode with foreign keys on."""
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_concurrent_reads_see_committed_writes(self, db):
+        """Test that reads from worker threads see the writer's commits."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        for i in range(4):
+            db.create_scenario(
+                Scenario(scenario_id=f"threaded_{i}", user_profile="P", job_posting="J")
+            )
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            found = list(executor.map(db.get_scenario, [f"threaded_{i}" for i in range(4)]))
+        
+        assert [s.scenario_id for s in found] == [f"threaded_{i}" for i in range(4)]
+        with db._read() as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+
+    def test_memory_database(self):
+        """Test that in-memory databases skip WAL but still open."""
+        database = EvalDatabase(":memory:")
+        
+        assert database.conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        database.close()
+
+    def test_get_db_shares_instance_per_path(self, db):
+        """Test that get_db reuses one open instance until it is closed."""
+        shared = get_db(db.db_path)
+        
+        assert get_db(db.db_path) is shared
+        assert get_db(":memory:") is not get_db(":memory:")
+        
+        shared.close()
+        assert get_db(db.db_path) is not shared
+        get_db(db.db_path).close()
+
+
+class TestTransactions:
+    """Tests for grouped writes."""
+
+    def test_transaction_commits_on_exit(self, db):
+        """Test that writes inside a transaction become visible on exit."""
+        with db.transaction():
+            db.create_scenario(Scenario(scenario_id="txn", user_profile="P", job_posting="J"))
+            db.create_stage_run("txn", "optimizer", {})
+            assert db.conn.in_transaction
+        
+        assert not db.conn.in_transaction
+        assert len(db.get_stage_runs_for_scenario("txn")) == 1
+
+    def test_transaction_rolls_back_on_error(self, db):
+        """Test that a failing block discards all of its writes."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.create_scenario(
+                    Scenario(scenario_id="rolled_back", user_profile="P", job_posting="J")
+                )
+                with db.transaction():
+                    db.create_stage_run("rolled_back", "optimizer", {})
+                raise RuntimeError("boom")
+        
+        assert db.get_scenario("rolled_back") is None
+        assert db.get_stage_runs_for_scenario("rolled_back") == []
+
+    def test_data_version_does_not_wait_on_open_transaction(self, db):
+        """Test that data_version answers while another thread holds a transaction."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        before = db.data_version()
+        entered, release = threading.Event(), threading.Event()
+        
+        def hold_transaction():
+            with db.transaction():
+                db.create_scenario(Scenario(scenario_id="held", user_profile="P", job_posting="J"))
+                entered.set()
+                release.wait(5)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            holder = executor.submit(hold_transaction)
+            assert entered.wait(5)
+            during = executor.submit(db.data_version).result(timeout=1)
+            release.set()
+            holder.result()
+        
+        # The held writes aren't visible to readers until the block commits
+        assert during == before
+        assert db.data_version() != during
+
+    def test_data_version_is_stable_across_pooled_readers(self, db):
+        """Test that the token only moves on commits, however many readers are pooled."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def open_another_reader():
+            # Hold one reader while a worker thread opens a fresh one
+            with db._read():
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(db.get_scenario, "missing").result()
+        
+        other = EvalDatabase(db.db_path)
+        try:
+            token = db.data_version()
+            for i in range(3):
+                other.create_scenario(
+                    Scenario(scenario_id=f"external_{i}", user_profile="P", job_posting="J")
+                )
+                # Readers opened after the commit start from their own baseline
+                open_another_reader()
+                tokens = {db.data_version() for _ in range(4)}
+                
+                assert len(tokens) == 1
+                assert token not in tokens
+                token = tokens.pop()
+            assert len(db._all_readers) >= 2
+        finally:
+            other.close()
+
+
 class TestScenarioOperations:
     """Tests for scenario CRUD operations."""
 
@@ -40,6 +164,7 @@ class TestScenarioOperations:
         
         assert scenario_id is not None
         assert scenario_id > 0
+        assert scenario.created_at == db.get_scenario("test_scenario_001").created_at
 
     def test_get_scenario(self, db):
         """Test retrieving a scenario."""
@@ -154,6 +279,32 @@ class TestStageRunOperations:
         assert len(pending) == 2
 
 
+    def test_stage_runs_carry_their_own_candidates(self, db):
+        """Test that listed stage runs get only their own candidates."""
+        db.create_scenario(Scenario(scenario_id="grouped", user_profile="P", job_posting="J"))
+        expected = {}
+        for n in (1, 2, 3):
+            stage_run_id = db.create_stage_run("grouped", "optimizer", {})
+            db.save_candidates(
+                stage_run_id,
+                [
+                    CandidateOutput(
+                        model_id=f"run{n}/model-{i}",
+                        output_text="Output",
+                        latency_ms=1000,
+                        token_count=400,
+                        candidate_label=chr(65 + i),
+                    )
+                    for i in range(n)
+                ],
+            )
+            expected[stage_run_id] = [f"run{n}/model-{i}" for i in range(n)]
+        
+        runs = db.get_stage_runs_for_scenario("grouped")
+        
+        assert {r.id: [c.model_id for c in r.candidates] for r in runs} == expected
+
+
 class TestCandidateOperations:
     """Tests for candidate output operations."""
 
@@ -209,6 +360,51 @@ class TestCandidateOperations:
         assert candidates[2].candidate_label == "C"
 
 
+    def test_save_candidates(self, db):
+        """Test saving several candidates in one batch."""
+        scenario = Scenario(
+            scenario_id="batch_candidates_test",
+            user_profile="Profile",
+            job_posting="Job",
+        )
+        db.create_scenario(scenario)
+        stage_run_id = db.create_stage_run("batch_candidates_test", "optimizer", {})
+        
+        candidates = [
+            CandidateOutput(
+                model_id=f"test/model-{i}",
+                output_text=f"Output {i}",
+                latency_ms=1000,
+                token_count=400,
+                candidate_label=label,
+            )
+            for i, label in enumerate(["A", "B", "C"])
+        ]
+        
+        candidate_ids = db.save_candidates(stage_run_id, candidates)
+        
+        assert len(candidate_ids) == 3
+        for candidate_id, candidate in zip(candidate_ids, candidates):
+            saved = db.get_candidate(candidate_id)
+            assert saved.model_id == candidate.model_id
+            assert saved.candidate_label == candidate.candidate_label
+        assert db.save_candidates(stage_run_id, []) == []
+        
+        # Larger batches are split across several multi-row INSERTs
+        many = [
+            CandidateOutput(
+                model_id="test/many",
+                output_text=str(i),
+                latency_ms=10,
+                token_count=1,
+                candidate_label=f"L{i}",
+            )
+            for i in range(200)
+        ]
+        many_ids = db.save_candidates(stage_run_id, many)
+        assert [db.get_candidate(i).output_text for i in many_ids] == [str(i) for i in range(200)]
+
+
 class TestJudgmentOperations:
     """Tests for judgment operations."""
 
@@ -245,6 +441,41 @@ class TestJudgmentOperations:
         assert judgment_id is not None
         assert judgment_id > 0
 
+    def test_save_judgments_batch(self, db):
+        """Test bulk-saving more judgments than fit in one INSERT."""
+        db.create_scenario(
+            Scenario(scenario_id="bulk_judgments", user_profile="Profile", job_posting="Job")
+        )
+        judgments = []
+        for i in range(100):
+            stage_run_id = db.create_stage_run("bulk_judgments", "optimizer", {})
+            candidate_id = db.save_candidate(
+                stage_run_id,
+                CandidateOutput(
+                    model_id="test/model",
+                    output_text="Output",
+                    latency_ms=1000,
+                    token_count=400,
+                    candidate_label="A",
+                ),
+            )
+            judgments.append(
+                Judgment(
+                    stage_run_id=stage_run_id,
+                    chosen_candidate_id=candidate_id,
+                    comments=f"judgment {i}",
+                    tags=["even"] if i % 2 == 0 else None,
+                )
+            )
+        
+        ids = db.save_judgments(judgments)
+        
+        assert ids == sorted(ids) and len(set(ids)) == 100
+        for judgment_id, judgment in zip(ids, judgments):
+            assert db.get_judgment_for_stage_run(judgment.stage_run_id).id == judgment_id
+        assert len(db.get_judgments_by_tag("even")) == 50
+        assert db.save_judgments([]) == []
+
     def test_get_judgment_for_stage_run(self, db):
         """Test retrieving judgment for a stage run."""
         scenario = Scenario(
@@ -278,6 +509,58 @@ class TestJudgmentOperations:
         assert retrieved.chosen_candidate_id == candidate_id
         assert retrieved.evaluator_id == "tester"
         assert retrieved.scores == {"relevance": 4}
+        
+        # Re-judging within the same second still returns the newest judgment
+        db.save_judgment(
+            Judgment(
+                stage_run_id=stage_run_id,
+                chosen_candidate_id=candidate_id,
+                evaluator_id="tester",
+                comments="revised",
+            )
+        )
+        assert db.get_judgment_for_stage_run(stage_run_id).comments == "revised"
+
+    def test_get_judgments_by_tag(self, db):
+        """Test filtering judgments by tag, including tags backfilled on open."""
+        db.create_scenario(
+            Scenario(scenario_id="tag_test", user_profile="Profile", job_posting="Job")
+        )
+        judgment_ids = {}
+        for stage_id, tags in (("optimizer", ["concise", "accurate"]), ("polish", ["concise"])):
+            stage_run_id = db.create_stage_run("tag_test", stage_id, {})
+            candidate_id = db.save_candidate(
+                stage_run_id,
+                CandidateOutput(
+                    model_id="test/model",
+                    output_text="Output",
+                    latency_ms=1000,
+                    token_count=400,
+                    candidate_label="A",
+                ),
+            )
+            judgment_ids[stage_id] = db.save_judgment(
+                Judgment(stage_run_id=stage_run_id, chosen_candidate_id=candidate_id, tags=tags)
+            )
+        
+        assert [j.id for j in db.get_judgments_by_tag("concise")] == [
+            judgment_ids["polish"],
+            judgment_ids["optimizer"],
+        ]
+        assert [j.tags for j in db.get_judgments_by_tag("accurate")] == [["concise", "accurate"]]
+        assert [j.id for j in db.get_judgments_by_tag("concise", stage_id="optimizer")] == [
+            judgment_ids["optimizer"]
+        ]
+        assert db.get_judgments_by_tag("missing") == []
+        
+        # A database from before the tag table is filled from the JSON column
+        db.conn.execute("DROP TABLE eval_judgment_tags")
+        db.conn.commit()
+        reopened = EvalDatabase(db.db_path)
+        try:
+            assert len(reopened.get_judgments_by_tag("concise")) == 2
+        finally:
+            reopened.close()
 
 
 class TestAnalysisQueries:
@@ -329,6 +612,8 @@ class TestAnalysisQueries:
         for model in ["model/a", "model/b", "model/c"]:
             assert model in stats
             assert stats[model]["appearances"] == 5
+        # Winners alternate a, b, c, a, b across the five runs
+        assert [stats[m]["wins"] for m in ["model/a", "model/b", "model/c"]] == [2, 2, 1]
 
     def test_get_judgments_for_stage(self, db):
         """Test getting judgments for a stage."""
@@ -363,3 +648,129 @@ class TestAnalysisQueries:
         for p in pairwise:
             assert "winner" in p
             assert "loser" in p
+
+    def test_iter_pairwise(self, db):
+        """Test that streamed pairs match the list form."""
+        self._setup_eval_data(db)
+        
+        pairs = db.iter_pairwise("optimizer")
+        
+        assert list(pairs) == [
+            (p["winner"], p["loser"]) for p in db.get_all_pairwise("optimizer")
+        ]
+        assert list(db.iter_pairwise("missing")) == []
+
+    def test_get_all_pairwise_arrays(self, db):
+        """Test that indexed pairwise data matches the dict form."""
+        self._setup_eval_data(db)
+        
+        winners, losers, labels = db.get_all_pairwise_arrays("optimizer")
+        
+        assert winners.dtype == losers.dtype == "int32"
+        assert labels == sorted(labels)
+        assert [(labels[winner], labels[loser]) for winner, loser in zip(winners, losers)] == [
+            (p["winner"], p["loser"]) for p in db.get_all_pairwise("optimizer")
+        ]
+        
+        winners, losers, labels = db.get_all_pairwise_arrays("missing")
+        assert len(winners) == len(losers) == len(labels) == 0
+
+    def test_get_report_bundle(self, db):
+        """Test that the report bundle matches the individual queries."""
+        self._setup_eval_data(db)
+        
+        bundle = db.get_report_bundle("optimizer")
+        
+        assert bundle["stats"] == db.get_model_stats("optimizer")
+        assert bundle["judgments"] == db.get_judgments_for_stage("optimizer")
+        assert bundle["head_to_head_counts"] == db.get_all_head_to_head_counts("optimizer")
+        winners, losers, labels = bundle["pairwise_arrays"]
+        expected = db.get_all_pairwise_arrays("optimizer")
+        assert winners.tolist() == expected[0].tolist()
+        assert losers.tolist() == expected[1].tolist()
+        assert labels == expected[2]
+        assert "pairwise_arrays" not in db.get_report_bundle(
+            "optimizer", include_pairwise_arrays=False
+        )
+
+
+class TestDeleteOperations:
+    """Tests for cascading deletes."""
+
+    def test_delete_scenario_removes_children(self, db):
+        """Test that deleting a scenario removes its runs, candidates and judgments."""
+        db.create_scenario(
+            Scenario(scenario_id="delete_me", user_profile="Profile", job_posting="Job")
+        )
+        db.create_scenario(
+            Scenario(scenario_id="keep_me", user_profile="Profile", job_posting="Job")
+        )
+        for scenario_id in ("delete_me", "keep_me"):
+            stage_run_id = db.create_stage_run(scenario_id, "optimizer", {})
+            candidate_id = db.save_candidate(
+                stage_run_id,
+                CandidateOutput(
+                    model_id="test/model",
+                    output_text="Output",
+                    latency_ms=1000,
+                    token_count=400,
+                    candidate_label="A",
+                ),
+            )
+            db.save_judgment(
+                Judgment(stage_run_id=stage_run_id, chosen_candidate_id=candidate_id)
+            )
+        
+        assert db.delete_scenario("delete_me") is True
+        assert db.delete_scenario("delete_me") is False
+        
+        assert db.get_scenario("delete_me") is None
+        assert db.get_stage_runs_for_scenario("delete_me") == []
+        counts = [
+            db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("eval_stage_runs", "eval_candidates", "eval_judgments")
+        ]
+        assert counts == [1, 1, 1]
+
+    def test_legacy_schema_is_migrated_to_cascade(self, tmp_path):
+        """Test that tables without ON DELETE CASCADE are rebuilt on open."""
+        import sqlite3
+        
+        path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE eval_scenarios (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scenario_id TEXT UNIQUE NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                user_profile TEXT NOT NULL,
+                job_posting TEXT NOT NULL,
+                metadata TEXT
+            );
+            CREATE TABLE eval_stage_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scenario_id TEXT NOT NULL,
+                stage_id TEXT NOT NULL,
+                context TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (scenario_id) REFERENCES eval_scenarios(scenario_id)
+            );
+            INSERT INTO eval_scenarios (scenario_id, user_profile, job_posting)
+                VALUES ('legacy', 'Profile', 'Job');
+            INSERT INTO eval_stage_runs (scenario_id, stage_id, context)
+                VALUES ('legacy', 'optimizer', '{"k": 1}');
+        """)
+        conn.close()
+        
+        database = EvalDatabase(path)
+        try:
+            fks = database.conn.execute("PRAGMA foreign_key_list(eval_stage_runs)").fetchall()
+            assert [fk["on_delete"] for fk in fks] == ["CASCADE"]
+            
+            runs = database.get_stage_runs_for_scenario("legacy")
+            assert [r.context for r in runs] == [{"k": 1}]
+            
+            assert database.delete_scenario("legacy") is True
+            assert database.get_stage_runs_for_scenario("legacy") == []
+        finally:
+            database.close()
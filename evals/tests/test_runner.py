@@ -4,6 +4,7 @@ import pytest
 import tempfile
 import os
 import asyncio
+import threading
 
 from db.eval_db import EvalDatabase
 from framework.runner import EvalRunner
@@ -24,7 +25,9 @@ def db():
 @pytest.fixture
 def runner(db):
     """Create an EvalRunner instance."""
-    return EvalRunner(db)
+    runner = EvalRunner(db)
+    yield runner
+    runner.close()
 
 
 class TestEvalRunner:
@@ -107,6 +110,30 @@ class TestEvalRunner:
         
         labels = [c.candidate_label for c in stage_eval.candidates]
         assert labels == ["A", "B", "C", "D", "E"]
+        # ~4 characters per token
+        assert stage_eval.candidates[0].token_count == len("Output from model/0") // 4
+
+    def test_candidate_labels_past_z(self, runner, db):
+        """Test that more than 26 candidates get distinct labels in order."""
+        scenario = runner.create_scenario(
+            user_profile="Profile",
+            job_posting="Job",
+        )
+        
+        candidates = [CandidateConfig(model_id=f"model/{i}") for i in range(28)]
+        
+        stage_eval = runner.run_stage_eval_sync(
+            scenario_id=scenario.scenario_id,
+            stage_id="optimizer",
+            context={},
+            candidates=candidates,
+            runner_fn=lambda cfg, context: "Output",
+            randomize=False,
+        )
+        
+        labels = [c.candidate_label for c in stage_eval.candidates]
+        assert labels[25:] == ["Z", "C27", "C28"]
+        assert [c.candidate_label for c in db.get_candidates_for_stage_run(stage_eval.id)] == labels
 
     def test_randomization(self, runner):
         """Test that candidates are randomized when requested."""
@@ -216,6 +243,107 @@ class TestEvalRunner:
         
         assert stage_eval.candidates[0].latency_ms >= 100
 
+    def test_custom_runner_runs_candidates_concurrently(self, runner):
+        """Test that blocking runner functions overlap instead of queuing."""
+        import time
+        
+        scenario = runner.create_scenario(
+            user_profile="Profile",
+            job_posting="Job",
+        )
+        
+        candidates = [CandidateConfig(model_id=f"model/{i}") for i in range(4)]
+        
+        def slow_runner(cfg, context):
+            time.sleep(0.2)
+            return "Output"
+        
+        start = time.perf_counter()
+        stage_eval = runner.run_stage_eval_sync(
+            scenario_id=scenario.scenario_id,
+            stage_id="optimizer",
+            context={},
+            candidates=candidates,
+            runner_fn=slow_runner,
+            randomize=False,
+        )
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.6
+        assert [c.model_id for c in stage_eval.candidates] == [c.model_id for c in candidates]
+        assert all(c.latency_ms >= 200 for c in stage_eval.candidates)
+
+    def test_sync_run_inside_running_loop(self, runner):
+        """Test that sync evals use asyncio.run, or a kept loop when nested."""
+        scenario = runner.create_scenario(user_profile="Profile", job_posting="Job")
+        threads = []
+        
+        def mock_runner(cfg, context):
+            threads.append(threading.current_thread())
+            return "Output"
+        
+        def run_sync():
+            return runner.run_stage_eval_sync(
+                scenario.scenario_id, "optimizer", {},
+                [CandidateConfig(model_id="model/a")], mock_runner,
+            )
+        
+        async def run_inside_loop():
+            # Runs on the background loop; this loop blocks until it finishes
+            return run_sync()
+        
+        run_sync()
+        
+        assert runner._loop_thread is None
+        
+        stage_eval = asyncio.run(run_inside_loop())
+        loop_thread = runner._loop_thread
+        asyncio.run(run_inside_loop())
+        
+        assert loop_thread is not None
+        assert runner._loop_thread is loop_thread
+        assert len(stage_eval.candidates) == 1
+        
+        runner.close()
+        
+        assert not loop_thread.is_alive()
+        assert not any(thread.is_alive() for thread in threads)
+
+    def test_provider_limits(self, db):
+        """Test that provider limits cap concurrent calls per provider."""
+        running = {"p": 0, "q": 0}
+        peak = {"p": 0, "q": 0}
+        
+        class Agent:
+            async def run_async(self, context, model, **kwargs):
+                provider = model.split("::")[0]
+                running[provider] += 1
+                peak[provider] = max(peak[provider], running[provider])
+                await asyncio.sleep(0.01)
+                running[provider] -= 1
+                return f"Output from {model}"
+        
+        class Factory:
+            def create(self, stage_id, model_id):
+                if model_id == "q::broken":
+                    raise RuntimeError("no such agent")
+                return Agent()
+        
+        runner = EvalRunner(db, agent_factory=Factory(), provider_limits={"p": 1})
+        scenario = runner.create_scenario(user_profile="Profile", job_posting="Job")
+        candidates = [
+            CandidateConfig(model_id=model_id)
+            for model_id in ("p::a", "p::b", "p::c", "q::a", "q::b", "q::broken")
+        ]
+        
+        stage_eval = asyncio.run(runner.run_stage_eval(
+            scenario.scenario_id, "optimizer", {}, candidates, randomize=False
+        ))
+        
+        assert peak == {"p": 1, "q": 2}
+        assert len(stage_eval.candidates) == 6
+        assert stage_eval.candidates[-1].output_text.startswith("[ERROR] RuntimeError")
+
 
 class TestCandidateConfig:
     """Tests for CandidateConfig dataclass."""
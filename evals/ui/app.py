@@ -19,7 +19,7 @@ backend_src = backend_root / "src"
 sys.path.insert(0, str(backend_root))
 sys.path.insert(0, str(backend_src))
 
-from db.eval_db import EvalDatabase
+from db.eval_db import EvalDatabase, get_db
 from framework.collector import JudgmentCollector
 from framework.config_resume import get_resume_eval_config, RESUME_STAGES
 from ui.judge_ui import (
@@ -39,7 +39,8 @@ def main():
 
     # Initialize database
     config = get_resume_eval_config()
-    db = EvalDatabase(config.db_path)
+    # Streamlit reruns main() on every interaction; reuse the open database
+    db = get_db(config.db_path)
     collector = JudgmentCollector(db)
 
     # Sidebar navigation
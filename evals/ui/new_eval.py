@@ -452,6 +452,8 @@ def run_evaluation(
             "success": False,
             "error": str(e),
         }
+    finally:
+        runner.close()
 
 
 def build_stage_context(
@@ -498,12 +500,8 @@ def run_agent_for_stage(
     
     This connects to the actual backend agents.
     """
-    import os
-    
-    # Change to backend directory so prompt files are found
-    original_cwd = os.getcwd()
-    os.chdir(backend_root)
-    
+    # No chdir into the backend: agents resolve their prompt files against
+    # the backend root, and the runner calls this from several threads
     try:
         from src.api.client_factory import create_client
         
@@ -636,6 +634,3 @@ Context received:
 """
     except Exception as e:
         return f"[Error running {cfg.model_id}]: {type(e).__name__}: {e}"
-    finally:
-        # Restore original working directory
-        os.chdir(original_cwd)